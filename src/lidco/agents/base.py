@@ -12,6 +12,7 @@ from typing import Callable
 
 from lidco.core.clarification import ClarificationNeeded
 from lidco.core.conversation_pruner import (
+    SummaryCache,
     compress_tool_results,
     prune_conversation,
     summarize_conversation_if_needed,
@@ -118,6 +119,8 @@ class BaseAgent(ABC):
         self._llm = llm
         self._tool_registry = tool_registry
         self._conversation: list[Message] = []
+        # Tool-result summaries reused across prune passes; reset per run
+        self._summary_cache: SummaryCache = {}
         self._status_callback: Any | None = None
         self._permission_handler: Any | None = None
         self._token_callback: Any | None = None
@@ -364,6 +367,7 @@ class BaseAgent(ABC):
             Message(role="system", content=system_content),
             Message(role="user", content=user_message),
         ]
+        self._summary_cache.clear()
 
         tool_schemas = self._get_tool_schemas()
         all_tool_calls: list[dict[str, Any]] = []
@@ -404,7 +408,9 @@ class BaseAgent(ABC):
             # Compress large tool results early — reduces token pressure before
             # the harder message-level pruning step below kicks in.
             if len(self._conversation) > 8:
-                self._conversation = compress_tool_results(self._conversation)
+                self._conversation = compress_tool_results(
+                    self._conversation, summary_cache=self._summary_cache,
+                )
 
             # Prune conversation if it's getting large (> 8 messages or
             # estimated tokens exceed threshold of the model's context window).
@@ -417,11 +423,13 @@ class BaseAgent(ABC):
                     self._conversation = prune_conversation(
                         self._conversation,
                         max_chars=int(context_limit * 4 * 0.40),
+                        summary_cache=self._summary_cache,
                     )
                 elif est_tokens > context_limit * 0.50:
                     self._conversation = prune_conversation(
                         self._conversation,
                         max_chars=int(context_limit * 4 * 0.60),
+                        summary_cache=self._summary_cache,
                     )
 
             if iteration == 1:
@@ -668,377 +668,378 @@ async def run_repl(flags: "CLIFlags | None" = None) -> None:
             )
         return HTML("<ansigreen><b>[You]</b></ansigreen> <ansiwhite>\u203a</ansiwhite> ")
 
-    while True:
-        try:
-            # Task 152: reflect /lock changes in the status bar each turn
-            current_agent = commands.locked_agent or default_agent or "auto"
-            renderer.session_status(
-                model=config.llm.default_model,
-                agent=current_agent,
-                turns=session_turns,
-                tokens=session_tokens,
-                cost_usd=session_cost_usd,
-                branch=_git_branch,
-            )
-
-            # Task 138: context window warning at 80% — shown once per 10% bucket
+    try:
+        while True:
             try:
-                _budget_limit = int(lidco_session.token_budget.session_limit or 0)
-                _ctx_limit = _budget_limit if _budget_limit > 0 else int(config.agents.context_window)
-                if _ctx_limit > 0 and session_tokens > 0:
-                    _ctx_pct = int(session_tokens / _ctx_limit * 100)
-                    _ctx_bucket = (_ctx_pct // 10) * 10
-                    if _ctx_pct >= 80 and _ctx_bucket != _last_ctx_warn_bucket:
-                        _last_ctx_warn_bucket = _ctx_bucket
-                        renderer.context_warning(_ctx_pct)
-            except (TypeError, ValueError, AttributeError):
-                pass
-
-            user_input = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: prompt_session.prompt(get_prompt()),
-            )
-
-            # Task 150: record hint shown and update for next iteration
-            if _prompt_state["show_hint"]:
-                _prefs.record_newline_hint_shown()
-                _prompt_state["show_hint"] = _prefs.should_show_newline_hint()
+                # Task 152: reflect /lock changes in the status bar each turn
+                current_agent = commands.locked_agent or default_agent or "auto"
+                renderer.session_status(
+                    model=config.llm.default_model,
+                    agent=current_agent,
+                    turns=session_turns,
+                    tokens=session_tokens,
+                    cost_usd=session_cost_usd,
+                    branch=_git_branch,
+                )
 
-            if not user_input.strip():
-                continue
+                # Task 138: context window warning at 80% — shown once per 10% bucket
+                try:
+                    _budget_limit = int(lidco_session.token_budget.session_limit or 0)
+                    _ctx_limit = _budget_limit if _budget_limit > 0 else int(config.agents.context_window)
+                    if _ctx_limit > 0 and session_tokens > 0:
+                        _ctx_pct = int(session_tokens / _ctx_limit * 100)
+                        _ctx_bucket = (_ctx_pct // 10) * 10
+                        if _ctx_pct >= 80 and _ctx_bucket != _last_ctx_warn_bucket:
+                            _last_ctx_warn_bucket = _ctx_bucket
+                            renderer.context_warning(_ctx_pct)
+                except (TypeError, ValueError, AttributeError):
+                    pass
 
-            # Handle slash commands
-            if user_input.strip().startswith("/"):
-                should_continue, retry_msg = await process_slash_command(user_input, commands, renderer)
-                if not should_continue:
-                    break
-                if retry_msg:
-                    # /retry — feed the message back as if the user typed it
-                    user_input = retry_msg
-                else:
-                    continue
+                user_input = await asyncio.get_event_loop().run_in_executor(
+                    None,
+                    lambda: prompt_session.prompt(get_prompt()),
+                )
 
-            # Check for @agent syntax: "@reviewer review this code"
-            forced_agent: str | None = None
-            message = user_input.strip()
+                # Task 150: record hint shown and update for next iteration
+                if _prompt_state["show_hint"]:
+                    _prefs.record_newline_hint_shown()
+                    _prompt_state["show_hint"] = _prefs.should_show_newline_hint()
 
-            # Task 282: @-mentions — expand @path/to/file in message
-            import re as _re_at
-            _AT_FILE_RE = _re_at.compile(r"@([^\s@]+\.[a-zA-Z0-9]+)")
-            _at_matches = _AT_FILE_RE.findall(message)
-            _at_injected: list[str] = []
-            for _at_path in _at_matches:
-                try:
-                    _at_p = Path(_at_path)
-                    if _at_p.is_file():
-                        _at_content = _at_p.read_text(encoding="utf-8", errors="replace")[:4000]
-                        _at_injected.append(f"## @{_at_path}\n\n```\n{_at_content}\n```")
-                        message = message.replace(f"@{_at_path}", f"`{_at_path}`", 1)
-                except OSError:
-                    pass
-            # Task 278: /mention — inject pre-mentioned files
-            for _mf in getattr(commands, "_mentions", []):
-                try:
-                    _mf_p = Path(_mf)
-                    if _mf_p.is_file():
-                        _mf_content = _mf_p.read_text(encoding="utf-8", errors="replace")[:4000]
-                        _at_injected.append(f"## Mentioned: {_mf}\n\n```\n{_mf_content}\n```")
-                except OSError:
-                    pass
-            if hasattr(commands, "_mentions"):
-                commands._mentions = []  # clear after use
-
-            # Task 174: /vars — substitute {{VAR}} in user message
-            if commands._vars and "{{" in message:
-                import re as _re
-                def _substitute_var(m: "_re.Match[str]") -> str:
-                    return commands._vars.get(m.group(1), m.group(0))
-                message = _re.sub(r"\{\{([A-Z0-9_]+)\}\}", _substitute_var, message)
-
-            # Track last message for /retry
-            if not message.startswith("/"):
-                commands.last_message = message
-            if message.startswith("@"):
-                parts = message.split(maxsplit=1)
-                forced_agent = parts[0][1:]
-                message = parts[1] if len(parts) > 1 else ""
-                if not message:
-                    renderer.error(f"Usage: @{forced_agent} <message>")
+                if not user_input.strip():
                     continue
-            elif commands.locked_agent:
-                # Task 152: /lock <agent> pins agent for the whole session
-                forced_agent = commands.locked_agent
-            elif default_agent:
-                forced_agent = default_agent
-
-            # Check token budget before routing to agent
-            from lidco.core.token_budget import TokenBudgetExceeded
-            try:
-                lidco_session.token_budget.check_remaining()
-            except TokenBudgetExceeded as exc:
-                renderer.error(str(exc))
-                continue
-
-            # Route to agent orchestrator
-            renderer.assistant_header(agent=forced_agent or "lidco", turn=session_turns + 1)
-            console.print()
 
-            try:
-                context = lidco_session.get_full_context()
-                # Task 173: inject pinned notes if any
-                if commands._pins:
-                    _pins_block = "\n\n".join(
-                        f"[{i}] {pin}" for i, pin in enumerate(commands._pins, 1)
-                    )
-                    _pins_section = f"## Pinned Notes\n\n{_pins_block}"
-                    context = f"{_pins_section}\n\n{context}" if context else _pins_section
-                # Task 167: inject session note if set
-                if commands.session_note:
-                    context = f"## Session Note\n\n{commands.session_note}\n\n{context}" if context else f"## Session Note\n\n{commands.session_note}"
-                # Task 282/278: inject @-mention and /mention file contents
-                if _at_injected:
-                    _at_block = "\n\n".join(_at_injected)
-                    context = f"{_at_block}\n\n{context}" if context else _at_block
-
-                # Task 272: inject /add-dir directories as context hint
-                if getattr(commands, "_extra_dirs", []):
-                    _extra = "\n".join(f"  · {d}" for d in commands._extra_dirs)
-                    _dir_section = f"## Extra Directories In Scope\n\n{_extra}"
-                    context = f"{_dir_section}\n\n{context}" if context else _dir_section
-
-                # Task 172: inject focus file content if set
-                if commands.focus_file:
+                # Handle slash commands
+                if user_input.strip().startswith("/"):
+                    should_continue, retry_msg = await process_slash_command(user_input, commands, renderer)
+                    if not should_continue:
+                        break
+                    if retry_msg:
+                        # /retry — feed the message back as if the user typed it
+                        user_input = retry_msg
+                    else:
+                        continue
+
+                # Check for @agent syntax: "@reviewer review this code"
+                forced_agent: str | None = None
+                message = user_input.strip()
+
+                # Task 282: @-mentions — expand @path/to/file in message
+                import re as _re_at
+                _AT_FILE_RE = _re_at.compile(r"@([^\s@]+\.[a-zA-Z0-9]+)")
+                _at_matches = _AT_FILE_RE.findall(message)
+                _at_injected: list[str] = []
+                for _at_path in _at_matches:
                     try:
-                        _focus_content = Path(commands.focus_file).read_text(encoding="utf-8", errors="replace")
-                        _focus_section = f"## Focus File: {commands.focus_file}\n\n```\n{_focus_content[:4000]}\n```"
-                        context = f"{_focus_section}\n\n{context}" if context else _focus_section
+                        _at_p = Path(_at_path)
+                        if _at_p.is_file():
+                            _at_content = _at_p.read_text(encoding="utf-8", errors="replace")[:4000]
+                            _at_injected.append(f"## @{_at_path}\n\n```\n{_at_content}\n```")
+                            message = message.replace(f"@{_at_path}", f"`{_at_path}`", 1)
                     except OSError:
-                        commands.focus_file = ""  # auto-clear if file gone
-                use_streaming = config.llm.streaming
-                _t0 = time.monotonic()
-
-                if use_streaming:
-                    # Streaming mode: persistent status bar at the bottom,
-                    # reasoning text + tool events scroll above it.
-                    stream_display = StreamDisplay(console)
-                    stream_display.set_debug_mode(lidco_session.debug_mode)
-                    stream_display.set_agent_name(forced_agent or "auto")
-                    active_live[0] = stream_display.live
-
-                    def on_status_stream(status: str) -> None:
-                        stream_display.on_status(status)
-
-                    def on_tokens_stream(total: int, total_cost_usd: float = 0.0) -> None:
-                        stream_display.update_tokens(total, total_cost_usd)
-                        # Q55/374: update context window meter
-                        _ctx_max = getattr(lidco_session.config.llm, "context_window", 128_000)
-                        stream_display.update_context_usage(total, _ctx_max)
-
-                    def on_text_chunk(text: str) -> None:
-                        stream_display.on_text_chunk(text)
-
-                    def on_tool_event(
-                        event: str, tool_name: str, args: dict, result: Any = None
-                    ) -> None:
-                        stream_display.on_tool_event(event, tool_name, args, result)
-
-                    def on_phase(name: str, phase_status: str) -> None:
-                        stream_display.set_phase(name, phase_status)
-
-                    orch = lidco_session.orchestrator
-                    orch.set_status_callback(on_status_stream)
-                    orch.set_token_callback(on_tokens_stream)
-                    orch.set_stream_callback(on_text_chunk)
-                    orch.set_tool_event_callback(on_tool_event)
-                    orch.set_phase_callback(on_phase)
-
+                        pass
+                # Task 278: /mention — inject pre-mentioned files
+                for _mf in getattr(commands, "_mentions", []):
                     try:
-                        response = await orch.handle(
-                            message,
-                            agent_name=forced_agent,
-                            context=context,
-                        )
-                    finally:
-                        orch.set_status_callback(None)
-                        orch.set_token_callback(None)
-                        orch.set_stream_callback(None)
-                        orch.set_tool_event_callback(None)
-                        orch.set_phase_callback(None)
-                        stream_display.finish()
-                        active_live[0] = None
-
-                else:
-                    # Non-streaming fallback: spinner with ThinkingTimer
-                    timer = ThinkingTimer("Обработка")
-
-                    def on_status(status: str) -> None:
-                        timer.label = status
+                        _mf_p = Path(_mf)
+                        if _mf_p.is_file():
+                            _mf_content = _mf_p.read_text(encoding="utf-8", errors="replace")[:4000]
+                            _at_injected.append(f"## Mentioned: {_mf}\n\n```\n{_mf_content}\n```")
+                    except OSError:
+                        pass
+                if hasattr(commands, "_mentions"):
+                    commands._mentions = []  # clear after use
+
+                # Task 174: /vars — substitute {{VAR}} in user message
+                if commands._vars and "{{" in message:
+                    import re as _re
+                    def _substitute_var(m: "_re.Match[str]") -> str:
+                        return commands._vars.get(m.group(1), m.group(0))
+                    message = _re.sub(r"\{\{([A-Z0-9_]+)\}\}", _substitute_var, message)
+
+                # Track last message for /retry
+                if not message.startswith("/"):
+                    commands.last_message = message
+                if message.startswith("@"):
+                    parts = message.split(maxsplit=1)
+                    forced_agent = parts[0][1:]
+                    message = parts[1] if len(parts) > 1 else ""
+                    if not message:
+                        renderer.error(f"Usage: @{forced_agent} <message>")
+                        continue
+                elif commands.locked_agent:
+                    # Task 152: /lock <agent> pins agent for the whole session
+                    forced_agent = commands.locked_agent
+                elif default_agent:
+                    forced_agent = default_agent
+
+                # Check token budget before routing to agent
+                from lidco.core.token_budget import TokenBudgetExceeded
+                try:
+                    lidco_session.token_budget.check_remaining()
+                except TokenBudgetExceeded as exc:
+                    renderer.error(str(exc))
+                    continue
 
-                    def on_tokens(total: int, total_cost_usd: float = 0.0) -> None:
-                        timer.total_tokens = total
+                # Route to agent orchestrator
+                renderer.assistant_header(agent=forced_agent or "lidco", turn=session_turns + 1)
+                console.print()
 
-                    lidco_session.orchestrator.set_status_callback(on_status)
-                    lidco_session.orchestrator.set_token_callback(on_tokens)
+                try:
+                    context = lidco_session.get_full_context()
+                    # Task 173: inject pinned notes if any
+                    if commands._pins:
+                        _pins_block = "\n\n".join(
+                            f"[{i}] {pin}" for i, pin in enumerate(commands._pins, 1)
+                        )
+                        _pins_section = f"## Pinned Notes\n\n{_pins_block}"
+                        context = f"{_pins_section}\n\n{context}" if context else _pins_section
+                    # Task 167: inject session note if set
+                    if commands.session_note:
+                        context = f"## Session Note\n\n{commands.session_note}\n\n{context}" if context else f"## Session Note\n\n{commands.session_note}"
+                    # Task 282/278: inject @-mention and /mention file contents
+                    if _at_injected:
+                        _at_block = "\n\n".join(_at_injected)
+                        context = f"{_at_block}\n\n{context}" if context else _at_block
+
+                    # Task 272: inject /add-dir directories as context hint
+                    if getattr(commands, "_extra_dirs", []):
+                        _extra = "\n".join(f"  · {d}" for d in commands._extra_dirs)
+                        _dir_section = f"## Extra Directories In Scope\n\n{_extra}"
+                        context = f"{_dir_section}\n\n{context}" if context else _dir_section
+
+                    # Task 172: inject focus file content if set
+                    if commands.focus_file:
+                        try:
+                            _focus_content = Path(commands.focus_file).read_text(encoding="utf-8", errors="replace")
+                            _focus_section = f"## Focus File: {commands.focus_file}\n\n```\n{_focus_content[:4000]}\n```"
+                            context = f"{_focus_section}\n\n{context}" if context else _focus_section
+                        except OSError:
+                            commands.focus_file = ""  # auto-clear if file gone
+                    use_streaming = config.llm.streaming
+                    _t0 = time.monotonic()
+
+                    if use_streaming:
+                        # Streaming mode: persistent status bar at the bottom,
+                        # reasoning text + tool events scroll above it.
+                        stream_display = StreamDisplay(console)
+                        stream_display.set_debug_mode(lidco_session.debug_mode)
+                        stream_display.set_agent_name(forced_agent or "auto")
+                        active_live[0] = stream_display.live
+
+                        def on_status_stream(status: str) -> None:
+                            stream_display.on_status(status)
+
+                        def on_tokens_stream(total: int, total_cost_usd: float = 0.0) -> None:
+                            stream_display.update_tokens(total, total_cost_usd)
+                            # Q55/374: update context window meter
+                            _ctx_max = getattr(lidco_session.config.llm, "context_window", 128_000)
+                            stream_display.update_context_usage(total, _ctx_max)
+
+                        def on_text_chunk(text: str) -> None:
+                            stream_display.on_text_chunk(text)
+
+                        def on_tool_event(
+                            event: str, tool_name: str, args: dict, result: Any = None
+                        ) -> None:
+                            stream_display.on_tool_event(event, tool_name, args, result)
+
+                        def on_phase(name: str, phase_status: str) -> None:
+                            stream_display.set_phase(name, phase_status)
+
+                        orch = lidco_session.orchestrator
+                        orch.set_status_callback(on_status_stream)
+                        orch.set_token_callback(on_tokens_stream)
+                        orch.set_stream_callback(on_text_chunk)
+                        orch.set_tool_event_callback(on_tool_event)
+                        orch.set_phase_callback(on_phase)
 
-                    try:
-                        live = Live(timer, console=console, refresh_per_second=4, transient=True)
-                        active_live[0] = live
-                        with live:
-                            response = await lidco_session.orchestrator.handle(
+                        try:
+                            response = await orch.handle(
                                 message,
                                 agent_name=forced_agent,
                                 context=context,
                             )
-                    finally:
-                        active_live[0] = None
-                        lidco_session.orchestrator.set_status_callback(None)
-                        lidco_session.orchestrator.set_token_callback(None)
-
-                    # Show tool calls if configured (non-streaming only)
-                    if config.cli.show_tool_calls and response.tool_calls_made:
-                        for tc in response.tool_calls_made:
-                            renderer.tool_call(tc["tool"], tc["args"])
-
-                    renderer.markdown(response.content)
-
-                # Accumulate session statistics
-                _elapsed = time.monotonic() - _t0
-                commands._turn_times.append(_elapsed)  # Task 175: /timing
-                turn_tokens = response.token_usage.total_tokens
-                turn_cost = getattr(response.token_usage, "total_cost_usd", 0.0) or 0.0
-                session_tokens += turn_tokens
-                session_prompt_tokens += response.token_usage.prompt_tokens
-                session_completion_tokens += response.token_usage.completion_tokens
-                session_cost_usd += turn_cost
-                session_turns += 1
-                session_tool_calls += len(response.tool_calls_made)
-                for tc in response.tool_calls_made:
-                    if tc.get("tool") in ("file_write", "file_edit"):
-                        path = tc.get("args", {}).get("path", "")
-                        if path:
-                            session_files_edited.add(path)
-                            commands._edited_files.append(path)  # Task 171: /recent
-                current_agent = forced_agent or getattr(response, "agent_used", None) or "auto"
-
-                # Task 182: /profile — accumulate per-agent stats
-                _astats = commands._agent_stats.setdefault(current_agent, {"calls": 0, "tokens": 0, "elapsed": 0.0})
-                _astats["calls"] += 1
-                _astats["tokens"] += turn_tokens
-                _astats["elapsed"] += _elapsed
-
-                # Record into token budget (enables budget limit enforcement)
-                lidco_session.token_budget.record(
-                    tokens=turn_tokens,
-                    prompt_tokens=response.token_usage.prompt_tokens,
-                    completion_tokens=response.token_usage.completion_tokens,
-                    cost_usd=turn_cost,
-                    role=current_agent,
-                )
+                        finally:
+                            orch.set_status_callback(None)
+                            orch.set_token_callback(None)
+                            orch.set_stream_callback(None)
+                            orch.set_tool_event_callback(None)
+                            orch.set_phase_callback(None)
+                            stream_display.finish()
+                            active_live[0] = None
 
-                # Show git diff and run linting when the agent edited files
-                _FILE_EDIT_TOOLS = frozenset({"file_write", "file_edit"})
-                _edited_tool_calls = [
-                    tc for tc in response.tool_calls_made
-                    if tc.get("tool") in _FILE_EDIT_TOOLS
-                ]
-                if _edited_tool_calls:
-                    from lidco.cli.diff_viewer import show_git_diff
-                    show_git_diff(console)
-
-                    _edited_paths = [
-                        tc.get("args", {}).get("path", "")
-                        for tc in _edited_tool_calls
-                    ]
-                    _edited_paths = list({p for p in _edited_paths if p})
-                    if _edited_paths:
-                        from lidco.cli.linter import show_lint_results
-                        show_lint_results(console, _edited_paths)
-
-                # Show summary and compact turn line (both modes)
-                if response.tool_calls_made:
-                    renderer.summary(response.tool_calls_made)
-
-                _files_changed = len({
-                    tc.get("args", {}).get("path", "")
-                    for tc in response.tool_calls_made
-                    if tc.get("tool") in ("file_write", "file_edit")
-                    and tc.get("args", {}).get("path")
-                })
-                renderer.turn_summary(
-                    model=response.model_used,
-                    iterations=response.iterations,
-                    tool_calls=len(response.tool_calls_made),
-                    files_changed=_files_changed,
-                    tokens=turn_tokens,
-                    cost_usd=turn_cost,
-                    elapsed=_elapsed,
-                )
+                    else:
+                        # Non-streaming fallback: spinner with ThinkingTimer
+                        timer = ThinkingTimer("Обработка")
 
-                # Task 186: /autosave — fire export every N turns
-                if commands._autosave_interval > 0:
-                    commands._autosave_turn_count += 1
-                    if commands._autosave_turn_count % commands._autosave_interval == 0:
-                        try:
-                            import json as _json
-                            _export_dir = Path.cwd() / ".lidco" / "autosave"
-                            _export_dir.mkdir(parents=True, exist_ok=True)
-                            _ts = int(time.monotonic() * 1000)
-                            _export_path = _export_dir / f"session_{_ts}.json"
-                            _history = getattr(lidco_session.orchestrator, "_conversation_history", [])
-                            _export_path.write_text(
-                                _json.dumps({"history": _history}, ensure_ascii=False, indent=2),
-                                encoding="utf-8",
-                            )
-                            renderer.info(f"Autosaved → {_export_path.name}")
-                        except Exception:
-                            pass
-
-                # Task 187: /remind — fire due reminders
-                # Q54/361: use set-based removal to avoid index shifting after pop
-                _current_turn = len(commands._turn_times)
-                _fired_set: set[int] = set()
-                for _ri, _rem in enumerate(commands._reminders):
-                    if _current_turn >= _rem["fire_at"]:
-                        renderer.info(f"⏰ Напоминание: {_rem['text']}")
-                        _fired_set.add(_ri)
-                if _fired_set:
-                    commands._reminders = [
-                        r for i, r in enumerate(commands._reminders)
-                        if i not in _fired_set
-                    ]
+                        def on_status(status: str) -> None:
+                            timer.label = status
 
-                # Task 155: contextual next-step suggestions
-                from lidco.core.suggestions import suggest
-                _hist_len = len(getattr(lidco_session.orchestrator, "_conversation_history", []))
-                _hints = suggest(response.tool_calls_made, response.content, history_len=_hist_len)
-                renderer.suggestions(_hints)
+                        def on_tokens(total: int, total_cost_usd: float = 0.0) -> None:
+                            timer.total_tokens = total
 
-                # Flush console so output appears before prompt_toolkit blocks
-                if hasattr(console.file, "flush"):
-                    console.file.flush()
+                        lidco_session.orchestrator.set_status_callback(on_status)
+                        lidco_session.orchestrator.set_token_callback(on_tokens)
 
-                # Auto-save to memory if enabled
-                if config.memory.enabled and config.memory.auto_save:
+                        try:
+                            live = Live(timer, console=console, refresh_per_second=4, transient=True)
+                            active_live[0] = live
+                            with live:
+                                response = await lidco_session.orchestrator.handle(
+                                    message,
+                                    agent_name=forced_agent,
+                                    context=context,
+                                )
+                        finally:
+                            active_live[0] = None
+                            lidco_session.orchestrator.set_status_callback(None)
+                            lidco_session.orchestrator.set_token_callback(None)
+
+                        # Show tool calls if configured (non-streaming only)
+                        if config.cli.show_tool_calls and response.tool_calls_made:
+                            for tc in response.tool_calls_made:
+                                renderer.tool_call(tc["tool"], tc["args"])
+
+                        renderer.markdown(response.content)
+
+                    # Accumulate session statistics
+                    _elapsed = time.monotonic() - _t0
+                    commands._turn_times.append(_elapsed)  # Task 175: /timing
+                    turn_tokens = response.token_usage.total_tokens
+                    turn_cost = getattr(response.token_usage, "total_cost_usd", 0.0) or 0.0
+                    session_tokens += turn_tokens
+                    session_prompt_tokens += response.token_usage.prompt_tokens
+                    session_completion_tokens += response.token_usage.completion_tokens
+                    session_cost_usd += turn_cost
+                    session_turns += 1
+                    session_tool_calls += len(response.tool_calls_made)
+                    for tc in response.tool_calls_made:
+                        if tc.get("tool") in ("file_write", "file_edit"):
+                            path = tc.get("args", {}).get("path", "")
+                            if path:
+                                session_files_edited.add(path)
+                                commands._edited_files.append(path)  # Task 171: /recent
+                    current_agent = forced_agent or getattr(response, "agent_used", None) or "auto"
+
+                    # Task 182: /profile — accumulate per-agent stats
+                    _astats = commands._agent_stats.setdefault(current_agent, {"calls": 0, "tokens": 0, "elapsed": 0.0})
+                    _astats["calls"] += 1
+                    _astats["tokens"] += turn_tokens
+                    _astats["elapsed"] += _elapsed
+
+                    # Record into token budget (enables budget limit enforcement)
+                    lidco_session.token_budget.record(
+                        tokens=turn_tokens,
+                        prompt_tokens=response.token_usage.prompt_tokens,
+                        completion_tokens=response.token_usage.completion_tokens,
+                        cost_usd=turn_cost,
+                        role=current_agent,
+                    )
+
+                    # Show git diff and run linting when the agent edited files
+                    _FILE_EDIT_TOOLS = frozenset({"file_write", "file_edit"})
+                    _edited_tool_calls = [
+                        tc for tc in response.tool_calls_made
+                        if tc.get("tool") in _FILE_EDIT_TOOLS
+                    ]
+                    if _edited_tool_calls:
+                        from lidco.cli.diff_viewer import show_git_diff
+                        show_git_diff(console)
+
+                        _edited_paths = [
+                            tc.get("args", {}).get("path", "")
+                            for tc in _edited_tool_calls
+                        ]
+                        _edited_paths = list({p for p in _edited_paths if p})
+                        if _edited_paths:
+                            from lidco.cli.linter import show_lint_results
+                            show_lint_results(console, _edited_paths)
+
+                    # Show summary and compact turn line (both modes)
                     if response.tool_calls_made:
-                        lidco_session.memory.add(
-                            key=f"action_{len(lidco_session.memory.list_all())}",
-                            content=f"Q: {message[:200]} -> {len(response.tool_calls_made)} tool calls",
-                            category="actions",
-                            source=str(Path.cwd()),
-                        )
+                        renderer.summary(response.tool_calls_made)
+
+                    _files_changed = len({
+                        tc.get("args", {}).get("path", "")
+                        for tc in response.tool_calls_made
+                        if tc.get("tool") in ("file_write", "file_edit")
+                        and tc.get("args", {}).get("path")
+                    })
+                    renderer.turn_summary(
+                        model=response.model_used,
+                        iterations=response.iterations,
+                        tool_calls=len(response.tool_calls_made),
+                        files_changed=_files_changed,
+                        tokens=turn_tokens,
+                        cost_usd=turn_cost,
+                        elapsed=_elapsed,
+                    )
 
-            except Exception as e:
-                logger.exception("Agent error")
-                renderer.friendly_error(e)
+                    # Task 186: /autosave — fire export every N turns
+                    if commands._autosave_interval > 0:
+                        commands._autosave_turn_count += 1
+                        if commands._autosave_turn_count % commands._autosave_interval == 0:
+                            try:
+                                import json as _json
+                                _export_dir = Path.cwd() / ".lidco" / "autosave"
+                                _export_dir.mkdir(parents=True, exist_ok=True)
+                                _ts = int(time.monotonic() * 1000)
+                                _export_path = _export_dir / f"session_{_ts}.json"
+                                _history = getattr(lidco_session.orchestrator, "_conversation_history", [])
+                                _export_path.write_text(
+                                    _json.dumps({"history": _history}, ensure_ascii=False, indent=2),
+                                    encoding="utf-8",
+                                )
+                                renderer.info(f"Autosaved → {_export_path.name}")
+                            except Exception:
+                                pass
 
-        except KeyboardInterrupt:
-            renderer.info("\nUse /exit to quit.")
-            continue
-        except EOFError:
-            renderer.info("\nGoodbye!")
-            break
+                    # Task 187: /remind — fire due reminders
+                    # Q54/361: use set-based removal to avoid index shifting after pop
+                    _current_turn = len(commands._turn_times)
+                    _fired_set: set[int] = set()
+                    for _ri, _rem in enumerate(commands._reminders):
+                        if _current_turn >= _rem["fire_at"]:
+                            renderer.info(f"⏰ Напоминание: {_rem['text']}")
+                            _fired_set.add(_ri)
+                    if _fired_set:
+                        commands._reminders = [
+                            r for i, r in enumerate(commands._reminders)
+                            if i not in _fired_set
+                        ]
+
+                    # Task 155: contextual next-step suggestions
+                    from lidco.core.suggestions import suggest
+                    _hist_len = len(getattr(lidco_session.orchestrator, "_conversation_history", []))
+                    _hints = suggest(response.tool_calls_made, response.content, history_len=_hist_len)
+                    renderer.suggestions(_hints)
+
+                    # Flush console so output appears before prompt_toolkit blocks
+                    if hasattr(console.file, "flush"):
+                        console.file.flush()
+
+                    # Auto-save to memory if enabled
+                    if config.memory.enabled and config.memory.auto_save:
+                        if response.tool_calls_made:
+                            lidco_session.memory.add(
+                                key=f"action_{len(lidco_session.memory.list_all())}",
+                                content=f"Q: {message[:200]} -> {len(response.tool_calls_made)} tool calls",
+                                category="actions",
+                                source=str(Path.cwd()),
+                            )
+
+                except Exception as e:
+                    logger.exception("Agent error")
+                    renderer.friendly_error(e)
 
-    lidco_session.close()
+            except KeyboardInterrupt:
+                renderer.info("\nUse /exit to quit.")
+                continue
+            except EOFError:
+                renderer.info("\nGoodbye!")
+                break
+    finally:
+        await lidco_session.aclose()
 
     # Task 383: auto-save named session on exit
     if flags is not None and getattr(flags, "session_name", None):
@@ -52,7 +52,10 @@ def register(registry: Any) -> None:
 
         from lidco.tools.web_fetch import WebFetchTool
         tool = WebFetchTool()
-        result = await tool._run(url=url)
+        try:
+            result = await tool._run(url=url)
+        finally:
+            await tool.aclose()
 
         if not result.success:
             return f"Fetch failed: {result.error}"
@@ -21,6 +21,7 @@ def prune_conversation(
     messages: list[Message],
     max_chars: int = 80_000,
     keep_recent_exchanges: int = 3,
+    summary_cache: SummaryCache | None = None,
 ) -> list[Message]:
     """Return a pruned copy of *messages* that fits within *max_chars*.
 
@@ -31,13 +32,15 @@ def prune_conversation(
     3. Older tool results are replaced with a one-line summary.
     4. Older assistant messages are trimmed to the first 200 chars.
 
+    *summary_cache*, when given, memoizes the tool summaries of step 3
+    across calls (see :data:`SummaryCache`).
+
     Returns a new list — the original is never mutated.
     """
     if not messages:
         return []
 
-    total_chars = sum(len(m.content) for m in messages)
-    if total_chars <= max_chars:
+    if _fits_budget(messages, max_chars):
         return list(messages)
 
     # Identify the boundary: keep system (index 0) + user (index 1)
@@ -45,25 +48,38 @@ def prune_conversation(
     # An "exchange" = one assistant message + its following tool messages.
     boundary = _find_keep_boundary(messages, keep_recent_exchanges)
 
-    pruned: list[Message] = []
-    for i, msg in enumerate(messages):
-        if i == 0:
-            # System prompt — always keep
-            pruned.append(msg)
-        elif i >= boundary:
-            # Recent messages — keep in full
-            pruned.append(msg)
-        elif msg.role == "tool":
-            pruned.append(_summarize_tool_message(msg))
-        elif msg.role == "assistant":
+    # System prompt — always keep.  Only the older middle needs a per-message
+    # role check; the recent tail (boundary >= 1) is copied over wholesale.
+    pruned: list[Message] = [messages[0]]
+    for msg in messages[1:boundary]:
+        role = msg.role
+        if role == "tool":
+            pruned.append(_summarize_tool_message(msg, summary_cache))
+        elif role == "assistant":
             pruned.append(_trim_assistant_message(msg))
         else:
             # user messages in middle — keep (usually just one)
             pruned.append(msg)
+    # Recent messages — keep in full
+    pruned.extend(messages[boundary:])
 
     return pruned
 
 
+def _fits_budget(messages: list[Message], max_chars: int) -> bool:
+    """Return True when the combined content of *messages* is within *max_chars*.
+
+    Stops at the first message that pushes the running total over budget,
+    so long conversations that need pruning are not measured end to end.
+    """
+    total = 0
+    for m in messages:
+        total += len(m.content)
+        if total > max_chars:
+            return False
+    return True
+
+
 def _find_keep_boundary(
     messages: list[Message],
     keep_recent_exchanges: int,
@@ -83,17 +99,38 @@ def _find_keep_boundary(
     return 1
 
 
-def _summarize_tool_message(msg: Message) -> Message:
-    """Replace a tool result with a compact summary line."""
-    tool_name = msg.name or "tool"
-    content = msg.content
-    line_count = content.count("\n") + 1
+# (tool_call_id, tool name, hash(content)) -> summary line.  Owned by the
+# caller (one per agent conversation); keys hold no tool output.
+SummaryCache = dict[tuple[str | None, str, int], str]
+
+
+def _summary_line(tool_name: str, content: str) -> str:
+    """Build the one-line summary for a tool result."""
+    # Counts "\n" only, so unlike splitlines() a bare "\r" does not end a line
+    line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
 
     # Extract a brief hint from the first line
     first_line = content.split("\n", 1)[0][:80]
 
-    summary = f"[{tool_name}: {line_count} lines | {first_line}...]"
+    return f"[{tool_name}: {line_count} lines | {first_line}...]"
 
+
+def _summarize_tool_message(
+    msg: Message, cache: SummaryCache | None = None,
+) -> Message:
+    """Replace a tool result with a compact summary line.
+
+    With *cache*, a summary already built for the same call id, tool name
+    and content hash is reused instead of re-scanning the output.
+    """
+    tool_name = msg.name or "tool"
+    if cache is None:
+        summary = _summary_line(tool_name, msg.content)
+    else:
+        key = (msg.tool_call_id, tool_name, hash(msg.content))
+        summary = cache.get(key)
+        if summary is None:
+            summary = cache[key] = _summary_line(tool_name, msg.content)
     return Message(
         role=msg.role,
         content=summary,
@@ -129,6 +166,7 @@ def compress_tool_results(
     messages: list[Message],
     max_chars: int = _DEFAULT_MAX_TOOL_RESULT_CHARS,
     keep_recent: int = _DEFAULT_KEEP_RECENT_TOOL_RESULTS,
+    summary_cache: SummaryCache | None = None,
 ) -> list[Message]:
     """Reduce token cost of tool results before message-level pruning.
 
@@ -136,7 +174,8 @@ def compress_tool_results(
     - The last *keep_recent* tool messages are kept, each truncated to
       *max_chars* if they exceed it.
     - Earlier tool messages are replaced with a compact one-line summary
-      (identical to what ``prune_conversation`` does for old messages).
+      (identical to what ``prune_conversation`` does for old messages,
+      sharing its *summary_cache*).
 
     Returns a new list — the original is never mutated.
     Only called when there is work to do (large results present).
@@ -185,7 +224,7 @@ def compress_tool_results(
             # Summarize old messages only when they're large enough to benefit.
             # Small old messages (≤200 chars) are cheaper to keep than replace.
             if len(content) > 200:
-                result.append(_summarize_tool_message(msg))
+                result.append(_summarize_tool_message(msg, summary_cache))
             else:
                 result.append(msg)
 
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import logging
+import os
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:  # optional C serializer for the JSONL logs (the ``speedups`` extra)
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,10 +53,62 @@ class MemoryEntry:
         )
 
 
+def _dump_line(record: dict[str, Any]) -> bytes:
+    """Serialize *record* as one compact UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    data = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return (data + "\n").encode("utf-8")
+
+
+def _log_line(entry: MemoryEntry) -> bytes:
+    """Serialize *entry* as one compact UTF-8 JSONL record."""
+    return _dump_line(entry.to_dict())
+
+
+def _stored_line(entry: MemoryEntry) -> bytes:
+    """Like :func:`_log_line`, but a missing ``created_at`` stays empty.
+
+    Used when rewriting existing records: legacy entries without a
+    timestamp never expire, and must not be given one by a vacuum.
+    """
+    return _dump_line({**entry.to_dict(), "created_at": entry.created_at})
+
+
+def _parse_log_line(line: bytes) -> Any:
+    """Decode one JSONL record (orjson and json both accept bytes)."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _replace_file(path: Path, data: bytes) -> None:
+    """Atomically replace *path* with *data*: temp file, one fsync, os.replace.
+
+    A crash mid-vacuum leaves either the old log or the new one, never a
+    truncated file.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
 class MemoryStore:
     """File-based persistent memory store.
 
-    Stores memories in JSON files organized by category.
+    Stores memories in append-only JSONL logs organized by category
+    (``<category>.jsonl``): saving an entry appends one line instead of
+    rewriting the whole category.  Superseded, expired and over-cap lines are
+    skipped when a log is loaded and vacuumed by the next save to that log.
+    Legacy ``<category>.json`` arrays are still read.
     Supports both global (~/.lidco/memory/) and project-level (.lidco/memory/).
     """
 
@@ -64,10 +124,20 @@ class MemoryStore:
         self._max_entries = max_entries
         self._ttl_days = ttl_days
         self._entries: dict[str, MemoryEntry] = {}
+        self._log_lines: dict[Path, int] = {}  # lines currently in each JSONL log
+        self._dirty_logs: set[Path] = set()  # logs loaded with dead lines
+        # key -> (entry, content.lower(), key.lower()); stale when the entry differs
+        self._lowered: dict[str, tuple[MemoryEntry, str, str]] = {}
+        # (max_lines, rendered text, moment the next included entry expires)
+        self._ctx_cache: tuple[int, str, datetime | None] | None = None
         self._load()
 
     def _load(self) -> None:
-        """Load memories from disk."""
+        """Load memories from disk.
+
+        Legacy JSON arrays are read before the JSONL logs so that a logged
+        update wins over an old snapshot of the same key.
+        """
         for directory in self._get_dirs():
             if not directory.exists():
                 continue
@@ -80,6 +150,9 @@ class MemoryStore:
                         self._entries[entry.key] = entry
                 except (json.JSONDecodeError, KeyError) as e:
                     logger.warning("Failed to load memory from %s: %s", json_file, e)
+            for log_file in directory.glob("*.jsonl"):
+                for entry in self._read_log(log_file):
+                    self._entries[entry.key] = entry
 
         # Also load MEMORY.md if it exists
         for directory in self._get_dirs():
@@ -94,26 +167,32 @@ class MemoryStore:
                         source="MEMORY.md",
                     )
 
-    def _is_expired(self, entry: MemoryEntry) -> bool:
-        """Return True if the entry is older than ``ttl_days``."""
+    def _expiry(self, entry: MemoryEntry) -> datetime | None:
+        """Return when *entry* expires, or None if it never does."""
         if self._ttl_days is None or not entry.created_at:
-            return False
+            return None
         try:
             created = datetime.fromisoformat(entry.created_at)
         except ValueError:
-            return False
-        cutoff = datetime.now(timezone.utc) - timedelta(days=self._ttl_days)
-        # Make cutoff timezone-aware if created is naive (legacy entries)
+            return None
+        # Make created timezone-aware if it is naive (legacy entries)
         if created.tzinfo is None:
             created = created.replace(tzinfo=timezone.utc)
-        return created < cutoff
+        return created + timedelta(days=self._ttl_days)
+
+    def _is_expired(self, entry: MemoryEntry) -> bool:
+        """Return True if the entry is older than ``ttl_days``."""
+        expiry = self._expiry(entry)
+        return expiry is not None and expiry < datetime.now(timezone.utc)
 
     def prune_expired(self) -> int:
         """Remove all expired entries from the in-memory store. Returns count removed."""
         expired_keys = [k for k, e in self._entries.items() if self._is_expired(e)]
         for key in expired_keys:
             del self._entries[key]
+            self._lowered.pop(key, None)
         if expired_keys:
+            self._ctx_cache = None
             logger.debug("Pruned %d expired memory entries", len(expired_keys))
         return len(expired_keys)
 
@@ -124,50 +203,108 @@ class MemoryStore:
             dirs.append(self._project_dir / ".lidco" / "memory")
         return dirs
 
+    def _read_log(self, log_file: Path) -> list[MemoryEntry]:
+        """Read the live entries of a JSONL log without modifying it.
+
+        The last line for a key wins.  Expired entries are dropped and only
+        the newest ``max_entries`` are kept; a log left with dead lines is
+        marked for vacuuming on the next save.
+        """
+        try:
+            lines = log_file.read_bytes().splitlines()
+        except OSError as e:
+            logger.warning("Failed to read memory log %s: %s", log_file, e)
+            return []
+
+        latest: dict[str, MemoryEntry] = {}
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = MemoryEntry.from_dict(_parse_log_line(line))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning("Skipping bad memory line in %s: %s", log_file, e)
+                continue
+            latest.pop(entry.key, None)  # re-insert so order follows the last write
+            latest[entry.key] = entry
+
+        kept = [e for e in latest.values() if not self._is_expired(e)]
+        if len(kept) > self._max_entries:
+            kept = kept[-self._max_entries :]
+
+        self._log_lines[log_file] = len(lines)
+        if len(kept) != len(lines):
+            self._dirty_logs.add(log_file)
+        return kept
+
+    def _vacuum_log(self, log_file: Path) -> None:
+        """Rewrite *log_file* with only its live entries."""
+        self._dirty_logs.discard(log_file)
+        kept = self._read_log(log_file)
+        if log_file not in self._dirty_logs:
+            return
+        self._dirty_logs.discard(log_file)
+        try:
+            _replace_file(log_file, b"".join(_stored_line(e) for e in kept))
+        except OSError as e:
+            # The appended line is safe on disk; the size cap retries later
+            logger.warning("Failed to vacuum memory log %s: %s", log_file, e)
+            return
+        self._log_lines[log_file] = len(kept)
+
+    def _migrate_legacy(self, legacy_file: Path, log_file: Path) -> None:
+        """Fold a legacy ``<category>.json`` array into the front of its log.
+
+        The legacy lines go first so that any logged update still wins.  The
+        log is then marked dirty, so the save that triggered the migration
+        also dedups and caps it; the ``.json`` file is removed afterwards.
+        """
+        try:
+            data = json.loads(legacy_file.read_text(encoding="utf-8"))
+            entries = data if isinstance(data, list) else [data]
+            legacy = b"".join(_stored_line(MemoryEntry.from_dict(e)) for e in entries)
+            logged = log_file.read_bytes() if log_file.exists() else b""
+            _replace_file(log_file, legacy + logged)
+            legacy_file.unlink()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Failed to migrate legacy memory file %s: %s", legacy_file, e)
+            return
+        self._log_lines[log_file] = (legacy + logged).count(b"\n")
+        self._dirty_logs.add(log_file)
+
     def _save_entry(self, entry: MemoryEntry, scope: str = "global") -> None:
-        """Save a single entry to disk."""
+        """Append a single entry to its category log on disk.
+
+        The first save to a category migrates its legacy ``.json`` file, if
+        any.  The first save to a log that was loaded with dead lines vacuums
+        it, as does any save once the log holds twice the cap, so a long
+        session cannot grow it without bound.
+        """
         if scope == "project" and self._project_dir:
             directory = self._project_dir / ".lidco" / "memory"
         else:
             directory = self._global_dir
 
         directory.mkdir(parents=True, exist_ok=True)
-        file_path = directory / f"{entry.category}.json"
+        file_path = directory / f"{entry.category}.jsonl"
 
-        # Load existing entries for this category
-        existing: list[dict[str, Any]] = []
-        if file_path.exists():
+        legacy_file = directory / f"{entry.category}.json"
+        if legacy_file.exists():
+            self._migrate_legacy(legacy_file, file_path)
+        if file_path not in self._log_lines:
+            # A log created after init (e.g. a new project dir) was never read
             try:
-                data = json.loads(file_path.read_text(encoding="utf-8"))
-                existing = data if isinstance(data, list) else [data]
-            except json.JSONDecodeError:
-                existing = []
-
-        # Update or append
-        found = False
-        for i, e in enumerate(existing):
-            if e.get("key") == entry.key:
-                existing[i] = entry.to_dict()
-                found = True
-                break
-        if not found:
-            existing.append(entry.to_dict())
-
-        # Prune expired entries before writing
-        if self._ttl_days is not None:
-            existing = [
-                e for e in existing
-                if not self._is_expired(MemoryEntry.from_dict(e))
-            ]
-
-        # Enforce max entries per file
-        if len(existing) > self._max_entries:
-            existing = existing[-self._max_entries :]
-
-        file_path.write_text(
-            json.dumps(existing, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+                self._log_lines[file_path] = file_path.read_bytes().count(b"\n")
+            except OSError:
+                self._log_lines[file_path] = 0
+
+        with file_path.open("ab") as fh:
+            fh.write(_log_line(entry))
+
+        count = self._log_lines[file_path] + 1
+        self._log_lines[file_path] = count
+        if file_path in self._dirty_logs or count > 2 * self._max_entries:
+            self._vacuum_log(file_path)
 
     def add(
         self,
@@ -189,6 +326,7 @@ class MemoryStore:
             source=source,
         )
         self._entries[key] = entry
+        self._ctx_cache = None
         self._save_entry(entry, scope=scope)
         return entry
 
@@ -207,23 +345,31 @@ class MemoryStore:
         """Search memories by content, category, or tags."""
         query_lower = query.lower()
         results: list[MemoryEntry] = []
+        lowered = self._lowered
 
+        # Cheapest filters first; the TTL check parses a timestamp, so it
+        # only runs for entries that otherwise match.
         for entry in self._entries.values():
             if entry.key == "__memory_md__":
                 continue
 
-            if self._is_expired(entry):
-                continue
-
             if category and entry.category != category:
                 continue
 
             if tags and not any(t in entry.tags for t in tags):
                 continue
 
-            if query_lower in entry.content.lower() or query_lower in entry.key.lower():
-                results.append(entry)
+            cached = lowered.get(entry.key)
+            if cached is None or cached[0] is not entry:
+                cached = (entry, entry.content.lower(), entry.key.lower())
+                lowered[entry.key] = cached
+            if query_lower not in cached[1] and query_lower not in cached[2]:
+                continue
 
+            if self._is_expired(entry):
+                continue
+
+            results.append(entry)
             if len(results) >= limit:
                 break
 
@@ -233,6 +379,8 @@ class MemoryStore:
         """Remove a memory entry."""
         if key in self._entries:
             del self._entries[key]
+            self._lowered.pop(key, None)
+            self._ctx_cache = None
             return True
         return False
 
@@ -247,8 +395,20 @@ class MemoryStore:
         return entries
 
     def build_context_string(self, max_lines: int = 200) -> str:
-        """Build a memory context string for injection into system prompts."""
+        """Build a memory context string for injection into system prompts.
+
+        The rendered text is cached until the store is mutated through
+        ``add``/``remove``/``prune_expired`` or one of the included entries
+        reaches its TTL, since this runs on every agent turn.
+        """
+        cached = self._ctx_cache
+        if cached is not None and cached[0] == max_lines:
+            until = cached[2]
+            if until is None or datetime.now(timezone.utc) <= until:
+                return cached[1]
+
         parts: list[str] = []
+        valid_until: datetime | None = None
 
         # MEMORY.md first
         md_entry = self._entries.get("__memory_md__")
@@ -262,6 +422,9 @@ class MemoryStore:
                 continue
             if self._is_expired(entry):
                 continue
+            expiry = self._expiry(entry)
+            if expiry is not None and (valid_until is None or expiry < valid_until):
+                valid_until = expiry
             by_category.setdefault(entry.category, []).append(entry)
 
         for cat, entries in sorted(by_category.items()):
@@ -276,4 +439,6 @@ class MemoryStore:
             lines = lines[:max_lines - 1]
             lines.append("... (memory truncated)")
 
-        return "\n".join(lines)
+        text = "\n".join(lines)
+        self._ctx_cache = (max_lines, text, valid_until)
+        return text
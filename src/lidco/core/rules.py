@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -58,10 +59,15 @@ class RulesManager:
         self.project_dir = project_dir or Path.cwd()
         self.rules_file = self.project_dir / "LIDCO.md"
         self.rules_dir = self.project_dir / ".lidco" / "rules"
+        # str forms for the per-turn stat calls: no Path re-parsing each time
+        self._rules_file_str = os.fspath(self.rules_file)
+        self._rules_dir_str = os.fspath(self.rules_dir)
+        # ((LIDCO.md mtime_ns, size), parsed rules) from the last list_rules()
+        self._rules_cache: tuple[tuple[int, int], list[Rule]] | None = None
 
     def has_rules_file(self) -> bool:
         """Check if the main rules file exists."""
-        return self.rules_file.exists()
+        return os.path.exists(self._rules_file_str)
 
     def init_rules(self, project_name: str | None = None) -> Path:
         """Create the default LIDCO.md rules file.
@@ -111,18 +117,37 @@ class RulesManager:
         return rule_path
 
     def list_rules(self) -> list[Rule]:
-        """List all rules from LIDCO.md (parsed by ## headings)."""
-        if not self.rules_file.exists():
+        """List all rules from LIDCO.md (parsed by ## headings).
+
+        The parse is reused while the file's mtime and size are unchanged,
+        so a long LIDCO.md is not re-read and re-split on every call.
+        """
+        try:
+            st = os.stat(self._rules_file_str)
+        except OSError:
             return []
 
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._rules_cache
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
         text = self.rules_file.read_text(encoding="utf-8")
-        return self._parse_rules(text)
+        rules = self._parse_rules(text)
+        self._rules_cache = (key, rules)
+        return list(rules)
 
     def list_rule_files(self) -> list[Path]:
-        """List all .md files in .lidco/rules/."""
-        if not self.rules_dir.is_dir():
+        """List all .md files in .lidco/rules/.
+
+        One ``os.listdir`` replaces the ``is_dir`` + glob pair; a missing
+        directory (or a file in its place) yields an empty list.
+        """
+        try:
+            names = os.listdir(self._rules_dir_str)
+        except OSError:
             return []
-        return sorted(self.rules_dir.glob("*.md"))
+        return sorted(self.rules_dir / n for n in names if n.endswith(".md"))
 
     def get_all_rules_text(self) -> str:
         """Get full text of all rules (LIDCO.md + rule files)."""
@@ -150,7 +175,9 @@ class RulesManager:
         rules: list[Rule] = []
         current_title = ""
         current_lines: list[str] = []
+        append = current_lines.append
 
+        # "### " never matches "## ", so one prefix test per line suffices.
         for line in text.splitlines():
             if line.startswith("## "):
                 if current_title:
@@ -160,8 +187,9 @@ class RulesManager:
                     ))
                 current_title = line[3:].strip()
                 current_lines = []
+                append = current_lines.append
             elif current_title:
-                current_lines.append(line)
+                append(line)
 
         if current_title:
             rules.append(Rule(
@@ -507,6 +507,22 @@ class Session:
         except Exception:
             pass
 
+    async def aclose(self) -> None:
+        """Close tools holding async resources, then run :meth:`close`.
+
+        Any registered tool with an ``aclose()`` coroutine (e.g. the pooled
+        HTTP client of ``web_fetch``) is closed on the caller's event loop.
+        """
+        for tool in self.tool_registry.list_tools():
+            aclose = getattr(tool, "aclose", None)
+            if aclose is None:
+                continue
+            try:
+                await aclose()
+            except Exception as e:
+                logger.warning("Failed to close tool %s: %s", tool.name, e)
+        self.close()
+
     def index_project(self) -> int:
         """Index the project for RAG. Returns number of chunks indexed."""
         if not self.context_retriever:
@@ -6,6 +6,8 @@ deciding when to prune conversations or warn about context limits.
 
 from __future__ import annotations
 
+import json
+import weakref
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,6 +16,12 @@ if TYPE_CHECKING:
 # Average characters per token (English / code mix).
 _CHARS_PER_TOKEN = 4
 
+# id(message) -> (weakref to message, token estimate).  Only messages with
+# tool_calls are cached: their json.dumps is the one costly step, and the
+# agent loop re-estimates the same history every turn.  Entries drop out when
+# the message is garbage-collected, so there is no size bound to tune.
+_tool_call_cache: dict[int, tuple[weakref.ref[Message], int]] = {}
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate the number of tokens in *text*.
@@ -30,20 +38,46 @@ def estimate_message_tokens(message: Message) -> int:
 
     Accounts for role overhead (~4 tokens) and tool_call JSON if present.
     """
-    import json
+    if not message.tool_calls:
+        return _count_message_tokens(message)
+
+    key = id(message)
+    hit = _tool_call_cache.get(key)
+    if hit is not None and hit[0]() is message:
+        return hit[1]
+
+    tokens = _count_message_tokens(message)
+
+    def _evict(ref: weakref.ref[Message], key: int = key) -> None:
+        # id() values are reused: only drop the slot if it is still ours
+        current = _tool_call_cache.get(key)
+        if current is not None and current[0] is ref:
+            del _tool_call_cache[key]
 
+    _tool_call_cache[key] = (weakref.ref(message, _evict), tokens)
+    return tokens
+
+
+def _count_message_tokens(message: Message) -> int:
+    # estimate_tokens() inlined per part: each part still rounds down on its
+    # own with a floor of one token, so totals match the per-call version.
     tokens = 4  # role / message overhead
-    tokens += estimate_tokens(message.content)
+
+    n = len(message.content)
+    if n:
+        tokens += max(1, n // _CHARS_PER_TOKEN)
 
     if message.tool_calls:
-        tokens += estimate_tokens(json.dumps(message.tool_calls))
+        # Compact separators: the padding spaces are not content the model sees.
+        serialized = json.dumps(message.tool_calls, separators=(",", ":"))
+        tokens += max(1, len(serialized) // _CHARS_PER_TOKEN)
 
     if message.name:
-        tokens += estimate_tokens(message.name)
+        tokens += max(1, len(message.name) // _CHARS_PER_TOKEN)
 
     return tokens
 
 
 def estimate_conversation_tokens(messages: list[Message]) -> int:
     """Estimate total tokens for an entire conversation."""
-    return sum(estimate_message_tokens(m) for m in messages)
+    return sum(map(estimate_message_tokens, messages))
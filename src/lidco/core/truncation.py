@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
+
 
 def truncate_tool_result(
     tool_name: str,
@@ -19,27 +22,22 @@ def truncate_tool_result(
     if len(output) <= max_chars:
         return output
 
-    if tool_name == "file_read":
-        return _truncate_file_read(output, head_lines=80, tail_lines=20)
-
-    if tool_name in ("grep", "glob"):
-        return _truncate_search_results(output, max_results=30)
-
-    if tool_name == "bash":
-        return _truncate_file_read(output, head_lines=100, tail_lines=20)
-
-    if tool_name == "git":
-        return _truncate_file_read(output, head_lines=100, tail_lines=20)
-
-    return _truncate_plain(output, max_chars)
+    strategy = _STRATEGIES.get(tool_name)
+    if strategy is None:
+        return _truncate_plain(output, max_chars)
+    return strategy(output)
 
 
-def _truncate_file_read(
+def _truncate_head_tail(
     output: str,
     head_lines: int,
     tail_lines: int,
 ) -> str:
     """Truncate by keeping head and tail lines."""
+    # A string can't hold more lines than characters, so short outputs
+    # never need the split.
+    if len(output) <= head_lines + tail_lines:
+        return output
     lines = output.splitlines()
     total = len(lines)
 
@@ -47,18 +45,17 @@ def _truncate_file_read(
         return output
 
     omitted = total - head_lines - tail_lines
-    head = lines[:head_lines]
-    tail = lines[-tail_lines:]
-
-    return (
-        "\n".join(head)
-        + f"\n\n... ({omitted} lines omitted) ...\n\n"
-        + "\n".join(tail)
-    )
+    # Slice from an explicit index: lines[-0:] would keep everything.
+    kept = lines[:head_lines]
+    kept.append(f"\n... ({omitted} lines omitted) ...\n")
+    kept.extend(lines[total - tail_lines:])
+    return "\n".join(kept)
 
 
 def _truncate_search_results(output: str, max_results: int) -> str:
     """Truncate search output by limiting result count."""
+    if len(output) <= max_results:
+        return output
     lines = output.splitlines()
     total = len(lines)
 
@@ -66,11 +63,25 @@ def _truncate_search_results(output: str, max_results: int) -> str:
         return output
 
     omitted = total - max_results
+    # Append the marker to the slice and join once; concatenating after the
+    # join would copy the kept text a second time.
     kept = lines[:max_results]
-
-    return "\n".join(kept) + f"\n\n... ({omitted} more matches) ..."
+    kept.append(f"\n... ({omitted} more matches) ...")
+    return "\n".join(kept)
 
 
 def _truncate_plain(output: str, max_chars: int) -> str:
     """Hard truncate with a marker at the cut point."""
-    return output[:max_chars] + f"\n\n... (truncated, {len(output) - max_chars} chars omitted) ..."
+    omitted = len(output) - max_chars
+    return f"{output[:max_chars]}\n\n... (truncated, {omitted} chars omitted) ..."
+
+
+# Per-tool strategies, bound to their limits once at import.  Tools not
+# listed here fall back to _truncate_plain.
+_STRATEGIES: dict[str, Callable[[str], str]] = {
+    "file_read": partial(_truncate_head_tail, head_lines=80, tail_lines=20),
+    "grep": partial(_truncate_search_results, max_results=30),
+    "glob": partial(_truncate_search_results, max_results=30),
+    "bash": partial(_truncate_head_tail, head_lines=100, tail_lines=20),
+    "git": partial(_truncate_head_tail, head_lines=100, tail_lines=20),
+}
@@ -12,6 +12,8 @@ from __future__ import annotations
 import ast
 import logging
 import re
+from collections import OrderedDict
+from dataclasses import replace
 from pathlib import Path
 
 from lidco.index.schema import ImportRecord, SymbolRecord
@@ -19,29 +21,49 @@ from lidco.rag.indexer import EXTENSION_TO_LANGUAGE, SUPPORTED_EXTENSIONS
 
 logger = logging.getLogger(__name__)
 
+# Built once rather than as a fresh tuple on every isinstance() check.
+_PY_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
 # ── JS/TS regex patterns ──────────────────────────────────────────────────────
 
-# Each entry: (pattern, kind, is_exported)
-_JS_SYMBOL_PATTERNS: list[tuple[re.Pattern[str], str, bool]] = [
-    (re.compile(r"^export\s+(?:default\s+)?(?:abstract\s+)?class\s+(\w+)"), "class", True),
-    (re.compile(r"^class\s+(\w+)"), "class", False),
-    (re.compile(r"^export\s+(?:default\s+)?(?:async\s+)?function\s+(\w+)"), "function", True),
-    (re.compile(r"^(?:async\s+)?function\s+(\w+)"), "function", False),
+# One alternation per line instead of a loop over separate patterns.  Python's
+# alternation is ordered, so the first alternative to match wins exactly as
+# the first pattern in a list would.  Each name is captured by a named group
+# that maps to (kind, is_exported) via _JS_SYMBOL_KINDS.
+_JS_SYMBOL_RE = re.compile(
+    r"^export\s+(?:default\s+)?(?:abstract\s+)?class\s+(?P<export_class>\w+)"
+    r"|^class\s+(?P<class>\w+)"
+    r"|^export\s+(?:default\s+)?(?:async\s+)?function\s+(?P<export_function>\w+)"
+    r"|^(?:async\s+)?function\s+(?P<function>\w+)"
     # Arrow functions assigned to const/let/var
-    (re.compile(r"^export\s+(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\("), "function", True),
-    (re.compile(r"^(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\("), "function", False),
+    r"|^export\s+(?:const|let|var)\s+(?P<export_arrow>\w+)\s*=\s*(?:async\s*)?\("
+    r"|^(?:const|let|var)\s+(?P<arrow>\w+)\s*=\s*(?:async\s*)?\("
     # Exported constants (non-arrow)
-    (re.compile(r"^export\s+(?:const|let|var)\s+(\w+)\b"), "constant", True),
+    r"|^export\s+(?:const|let|var)\s+(?P<export_const>\w+)\b"
     # ALL_CAPS module-level constants
-    (re.compile(r"^(?:const|let|var)\s+([A-Z][A-Z0-9_]{2,})\b"), "constant", False),
-]
-
-_JS_IMPORT_PATTERNS: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"""^import\s+.+\s+from\s+['"](.+)['"]"""), "from"),
-    (re.compile(r"""^import\s+['"](.+)['"]"""), "module"),
-    (re.compile(r"""(?:const|let|var)\s+.+\s*=\s*require\(\s*['"](.+)['"]\s*\)"""), "require"),
-    (re.compile(r"""import\s*\(\s*['"](.+)['"]\s*\)"""), "dynamic"),
-]
+    r"|^(?:const|let|var)\s+(?P<const>[A-Z][A-Z0-9_]{2,})\b"
+)
+
+_JS_SYMBOL_KINDS: dict[str, tuple[str, bool]] = {
+    "export_class": ("class", True),
+    "class": ("class", False),
+    "export_function": ("function", True),
+    "function": ("function", False),
+    "export_arrow": ("function", True),
+    "arrow": ("function", False),
+    "export_const": ("constant", True),
+    "const": ("constant", False),
+}
+
+# Imports keep the same first-alternative-wins order.  The unanchored forms
+# (require, dynamic import) are prefixed with a lazy ``.*?`` so they find the
+# leftmost occurrence, as re.search would.
+_JS_IMPORT_RE = re.compile(
+    r"""^import\s+.+\s+from\s+['"](?P<from>.+)['"]"""
+    r"""|^import\s+['"](?P<module>.+)['"]"""
+    r"""|^.*?(?:const|let|var)\s+.+\s*=\s*require\(\s*['"](?P<require>.+)['"]\s*\)"""
+    r"""|^.*?import\s*\(\s*['"](?P<dynamic>.+)['"]\s*\)"""
+)
 
 # ── Generic line-scan patterns (fallback for Java, Go, Rust, etc.) ────────────
 
@@ -62,6 +84,45 @@ _GENERIC_SYMBOL_PATTERNS: list[tuple[re.Pattern[str], str]] = [
 ]
 
 
+def _with_file_id(
+    result: tuple[list[SymbolRecord], list[ImportRecord]],
+    file_id: int,
+) -> tuple[list[SymbolRecord], list[ImportRecord]]:
+    """Return fresh lists of cached records, re-stamped with *file_id* if needed."""
+    symbols, imports = result
+    if all(s.file_id == file_id for s in symbols) and all(
+        i.from_file_id == file_id for i in imports
+    ):
+        return list(symbols), list(imports)
+    return (
+        [replace(s, file_id=file_id) for s in symbols],
+        [replace(i, from_file_id=file_id) for i in imports],
+    )
+
+
+# ── File role detection ───────────────────────────────────────────────────────
+
+_TEST_DIRS = ("/tests/", "/test/", "/__tests__/")
+_CONFIG_STEMS = frozenset({
+    "config", "settings", "conf", "configuration", "constants", "env", "envs", "defaults",
+})
+_CONFIG_NAMES = frozenset({
+    "pyproject.toml", "setup.cfg", "setup.py", "webpack.config.js",
+    "vite.config.ts", "jest.config.js", "tsconfig.json", ".env",
+})
+_ENTRYPOINT_STEMS = frozenset({
+    "__main__", "main", "app", "server", "index", "cli",
+    "wsgi", "asgi", "manage", "run", "start",
+})
+_ROUTER_STEMS = frozenset({
+    "routes", "router", "routers", "views", "handlers", "endpoints", "api", "urls",
+})
+_ROUTER_FACTORY_PREFIXES = ("create_router", "create_app", "setup_routes", "register_routes")
+_MODEL_STEMS = frozenset({
+    "models", "model", "schema", "schemas", "entities", "entity", "types", "interfaces",
+})
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 class AstAnalyzer:
@@ -72,8 +133,17 @@ class AstAnalyzer:
         analyzer = AstAnalyzer()
         symbols, imports = analyzer.analyze(Path("src/auth.py"), file_id=3)
         role = analyzer.detect_file_role(Path("src/auth.py"), symbols)
+
+    Results are cached per ``(path, mtime_ns, size)`` so re-indexing an
+    unchanged file skips reading and parsing it again.
     """
 
+    def __init__(self, cache_size: int = 512) -> None:
+        self._cache: OrderedDict[
+            tuple[str, int, int], tuple[list[SymbolRecord], list[ImportRecord]]
+        ] = OrderedDict()
+        self._cache_size = cache_size
+
     def analyze(
         self,
         file_path: Path,
@@ -88,12 +158,33 @@ class AstAnalyzer:
             return [], []
 
         try:
-            source = file_path.read_text(encoding="utf-8", errors="replace")
+            st = file_path.stat()
+            key = (str(file_path), st.st_mtime_ns, st.st_size)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return _with_file_id(cached, file_id)
+            # Decode in one step; newline translation is unnecessary because
+            # ast.parse and splitlines() both accept \r\n and \r.
+            source = file_path.read_bytes().decode("utf-8", errors="replace")
         except OSError as exc:
             logger.warning("Cannot read %s: %s", file_path, exc)
             return [], []
 
-        if not source.strip():
+        result = self._analyze_source(source, ext, file_id)
+        self._cache[key] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)  # evict LRU entry
+        return list(result[0]), list(result[1])
+
+    def _analyze_source(
+        self,
+        source: str,
+        ext: str,
+        file_id: int,
+    ) -> tuple[list[SymbolRecord], list[ImportRecord]]:
+        # isspace() scans in place; strip() would copy the whole source first.
+        if not source or source.isspace():
             return [], []
 
         language = EXTENSION_TO_LANGUAGE.get(ext, "unknown")
@@ -122,48 +213,32 @@ class AstAnalyzer:
             or stem.endswith("_test")
             or ".spec." in name
             or ".test." in name
-            or "/tests/" in path_str
-            or "/test/" in path_str
-            or "/__tests__/" in path_str
+            or any(d in path_str for d in _TEST_DIRS)
         ):
             return "test"
 
         # Config / settings files
         if (
-            stem in ("config", "settings", "conf", "configuration", "constants",
-                     "env", "envs", "defaults")
-            or name in ("pyproject.toml", "setup.cfg", "setup.py", "webpack.config.js",
-                        "vite.config.ts", "jest.config.js", "tsconfig.json", ".env")
+            stem in _CONFIG_STEMS
+            or name in _CONFIG_NAMES
             or stem.endswith(("_config", "_settings", "_conf"))
         ):
             return "config"
 
         # Entrypoints
-        if stem in ("__main__", "main", "app", "server", "index", "cli",
-                    "wsgi", "asgi", "manage", "run", "start"):
+        if stem in _ENTRYPOINT_STEMS:
             return "entrypoint"
 
         # Routers / HTTP handlers
-        symbol_names_lower = {s.name.lower() for s in symbols}
-        if (
-            stem in ("routes", "router", "routers", "views", "handlers",
-                     "endpoints", "api", "urls")
-            or any(
-                n.startswith(("create_router", "create_app", "setup_routes", "register_routes"))
-                for n in symbol_names_lower
-            )
+        if stem in _ROUTER_STEMS or any(
+            s.name.lower().startswith(_ROUTER_FACTORY_PREFIXES) for s in symbols
         ):
             return "router"
 
         # Models / schemas
-        class_names_lower = {s.name.lower() for s in symbols if s.kind == "class"}
-        if (
-            stem in ("models", "model", "schema", "schemas", "entities", "entity",
-                     "types", "interfaces")
-            or any(
-                "model" in n or "schema" in n or "entity" in n
-                for n in class_names_lower
-            )
+        if stem in _MODEL_STEMS or any(
+            "model" in n or "schema" in n or "entity" in n
+            for n in (s.name.lower() for s in symbols if s.kind == "class")
         ):
             return "model"
 
@@ -185,38 +260,41 @@ class AstAnalyzer:
 
         symbols: list[SymbolRecord] = []
         imports: list[ImportRecord] = []
+        add_symbol = symbols.append
+        add_import = imports.append
 
-        for node in ast.iter_child_nodes(tree):
+        # Only module and class bodies matter; never descend into function bodies.
+        for node in tree.body:
             # Top-level functions
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                symbols.append(SymbolRecord(
+            if isinstance(node, _PY_FUNCTION_NODES):
+                add_symbol(SymbolRecord(
                     file_id=file_id,
                     name=node.name,
                     kind="function",
                     line_start=node.lineno,
                     line_end=node.end_lineno or node.lineno,
-                    is_exported=not node.name.startswith("_"),
+                    is_exported=node.name[:1] != "_",
                 ))
 
             # Top-level classes + their methods
             elif isinstance(node, ast.ClassDef):
-                symbols.append(SymbolRecord(
+                add_symbol(SymbolRecord(
                     file_id=file_id,
                     name=node.name,
                     kind="class",
                     line_start=node.lineno,
                     line_end=node.end_lineno or node.lineno,
-                    is_exported=not node.name.startswith("_"),
+                    is_exported=node.name[:1] != "_",
                 ))
-                for child in ast.iter_child_nodes(node):
-                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        symbols.append(SymbolRecord(
+                for child in node.body:
+                    if isinstance(child, _PY_FUNCTION_NODES):
+                        add_symbol(SymbolRecord(
                             file_id=file_id,
                             name=child.name,
                             kind="method",
                             line_start=child.lineno,
                             line_end=child.end_lineno or child.lineno,
-                            is_exported=not child.name.startswith("_"),
+                            is_exported=child.name[:1] != "_",
                             parent_name=node.name,
                         ))
 
@@ -224,7 +302,7 @@ class AstAnalyzer:
             elif isinstance(node, ast.Assign):
                 for target in node.targets:
                     if isinstance(target, ast.Name) and target.id.isupper():
-                        symbols.append(SymbolRecord(
+                        add_symbol(SymbolRecord(
                             file_id=file_id,
                             name=target.id,
                             kind="constant",
@@ -237,7 +315,7 @@ class AstAnalyzer:
                 if isinstance(node.target, ast.Name):
                     name = node.target.id
                     if name.isupper():
-                        symbols.append(SymbolRecord(
+                        add_symbol(SymbolRecord(
                             file_id=file_id,
                             name=name,
                             kind="constant",
@@ -249,7 +327,7 @@ class AstAnalyzer:
             # Imports
             elif isinstance(node, ast.Import):
                 for alias in node.names:
-                    imports.append(ImportRecord(
+                    add_import(ImportRecord(
                         from_file_id=file_id,
                         imported_module=alias.name,
                         import_kind="module",
@@ -257,7 +335,7 @@ class AstAnalyzer:
 
             elif isinstance(node, ast.ImportFrom):
                 module = node.module or ""
-                imports.append(ImportRecord(
+                add_import(ImportRecord(
                     from_file_id=file_id,
                     imported_module=module,
                     import_kind="from",
@@ -281,29 +359,24 @@ class AstAnalyzer:
             if not line or line.startswith("//") or line.startswith("*"):
                 continue
 
-            # Symbols
-            for pattern, kind, exported in _JS_SYMBOL_PATTERNS:
-                m = pattern.match(line)
-                if m:
-                    symbols.append(SymbolRecord(
-                        file_id=file_id,
-                        name=m.group(1),
-                        kind=kind,
-                        line_start=lineno,
-                        is_exported=exported,
-                    ))
-                    break  # first match wins per line
+            m = _JS_SYMBOL_RE.match(line)
+            if m:
+                kind, exported = _JS_SYMBOL_KINDS[m.lastgroup]
+                symbols.append(SymbolRecord(
+                    file_id=file_id,
+                    name=m.group(m.lastgroup),
+                    kind=kind,
+                    line_start=lineno,
+                    is_exported=exported,
+                ))
 
-            # Imports
-            for pattern, import_kind in _JS_IMPORT_PATTERNS:
-                m = pattern.search(line)
-                if m:
-                    imports.append(ImportRecord(
-                        from_file_id=file_id,
-                        imported_module=m.group(1),
-                        import_kind=import_kind,
-                    ))
-                    break
+            m = _JS_IMPORT_RE.match(line)
+            if m:
+                imports.append(ImportRecord(
+                    from_file_id=file_id,
+                    imported_module=m.group(m.lastgroup),
+                    import_kind=m.lastgroup,
+                ))
 
         return symbols, imports
 
@@ -156,37 +156,47 @@ class IndexContextEnricher:
             return ""
 
         lines: list[str] = []
+        # Length of "\n".join(lines) so far.  Once it exceeds max_chars the
+        # truncated result is fixed, so the remaining sections are skipped.
+        length = -1
+
+        def add(line: str) -> None:
+            nonlocal length
+            lines.append(line)
+            length += len(line) + 1
 
         summary = self.get_project_summary()
         if summary:
-            lines.append(summary)
+            add(summary)
 
         # Entrypoints
-        entrypoints = self.get_entrypoints()
+        entrypoints = self.get_entrypoints() if length <= max_chars else []
         if entrypoints:
             ep_paths = ", ".join(f"`{f.path}`" for f in entrypoints[:5])
             if len(entrypoints) > 5:
                 ep_paths += f" (+{len(entrypoints) - 5} more)"
-            lines.append(f"Entrypoints: {ep_paths}.")
+            add(f"Entrypoints: {ep_paths}.")
 
         # Query-relevant files
-        if query:
+        if query and length <= max_chars:
             relevant = self.find_relevant_files(query)
             if relevant:
-                lines.append("Relevant files for this query:")
+                add("Relevant files for this query:")
                 for f in relevant:
+                    if length > max_chars:
+                        break
                     symbols = self._db.query_symbols(file_id=f.id)
                     # Only top-level (non-method) symbols for brevity
                     top_syms = [s for s in symbols if s.kind != "method"][:4]
                     sym_str = ", ".join(f"`{s.name}`" for s in top_syms)
                     suffix = f" — {sym_str}" if sym_str else ""
-                    lines.append(f"  - `{f.path}` ({f.language}){suffix}")
+                    add(f"  - `{f.path}` ({f.language}){suffix}")
 
         # Import-related files for the current file being worked on
-        if current_file:
+        if current_file and length <= max_chars:
             related_section = self.get_related_files(current_file)
             if related_section:
-                lines.append(related_section)
+                add(related_section)
 
         result = "\n".join(lines)
         if len(result) > max_chars:
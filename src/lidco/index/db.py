@@ -8,6 +8,7 @@ providing CRUD methods.  All business logic lives in ProjectIndexer.
 from __future__ import annotations
 
 import sqlite3
+import sys
 import threading
 import time
 from pathlib import Path
@@ -28,13 +29,39 @@ from lidco.index.schema import (
 
 logger = logging.getLogger(__name__)
 
+# Stay under SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds (default 999).
+_MAX_SQL_PARAMS = 900
+
+_UPSERT_FILE_SQL = """
+    INSERT INTO files (path, language, role, size_bytes, mtime, lines_count, indexed_at)
+    VALUES (:path, :language, :role, :size_bytes, :mtime, :lines_count, :indexed_at)
+    ON CONFLICT(path) DO UPDATE SET
+        language    = excluded.language,
+        role        = excluded.role,
+        size_bytes  = excluded.size_bytes,
+        mtime       = excluded.mtime,
+        lines_count = excluded.lines_count,
+        indexed_at  = excluded.indexed_at
+"""
+
+
+_SYNCHRONOUS_MODES = frozenset({"OFF", "NORMAL", "FULL", "EXTRA"})
+
 
 class IndexDatabase:
-    """SQLite-backed store for project index data."""
+    """SQLite-backed store for project index data.
 
-    def __init__(self, db_path: Path) -> None:
+    ``synchronous`` sets ``PRAGMA synchronous`` on every connection; leave it
+    as None for SQLite's default.  ``"OFF"`` skips the fsync on each commit,
+    which is only safe for throwaway databases such as test fixtures.
+    """
+
+    def __init__(self, db_path: Path, *, synchronous: str | None = None) -> None:
+        if synchronous is not None and synchronous.upper() not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown SQLite synchronous mode: {synchronous!r}")
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._path = db_path
+        self._synchronous = synchronous
         self._local = threading.local()
         self._apply_schema()
 
@@ -51,6 +78,11 @@ class IndexDatabase:
         if not hasattr(self._local, "conn"):
             conn = sqlite3.connect(str(self._path))
             conn.row_factory = sqlite3.Row
+            # foreign_keys is per-connection, not stored in the file: without
+            # this, reopened databases and worker threads skip ON DELETE CASCADE.
+            conn.execute("PRAGMA foreign_keys=ON")
+            if self._synchronous is not None:
+                conn.execute(f"PRAGMA synchronous={self._synchronous.upper()}")
             self._local.conn = conn
         return self._local.conn
 
@@ -106,34 +138,33 @@ class IndexDatabase:
 
     def upsert_file(self, record: FileRecord) -> int:
         """Insert or replace a file record. Returns the row id."""
-        self._conn.execute(
-            """
-            INSERT INTO files (path, language, role, size_bytes, mtime, lines_count, indexed_at)
-            VALUES (:path, :language, :role, :size_bytes, :mtime, :lines_count, :indexed_at)
-            ON CONFLICT(path) DO UPDATE SET
-                language    = excluded.language,
-                role        = excluded.role,
-                size_bytes  = excluded.size_bytes,
-                mtime       = excluded.mtime,
-                lines_count = excluded.lines_count,
-                indexed_at  = excluded.indexed_at
-            """,
-            {
-                "path": record.path,
-                "language": record.language,
-                "role": record.role,
-                "size_bytes": record.size_bytes,
-                "mtime": record.mtime,
-                "lines_count": record.lines_count,
-                "indexed_at": record.indexed_at,
-            },
-        )
+        self._conn.execute(_UPSERT_FILE_SQL, _file_params(record))
         self._conn.commit()
         # Always look up the actual row id — lastrowid is unreliable for
         # ON CONFLICT DO UPDATE on some platforms (returns AUTOINCREMENT
         # counter rather than the existing row's rowid).
         return self._get_file_id(record.path)
 
+    def upsert_files(self, records: list[FileRecord]) -> list[int]:
+        """Bulk insert-or-replace file records in one transaction.
+
+        Returns the row ids in the same order as *records*.
+        """
+        if not records:
+            return []
+        self._conn.executemany(_UPSERT_FILE_SQL, [_file_params(r) for r in records])
+        self._conn.commit()
+        paths = list(dict.fromkeys(r.path for r in records))
+        ids: dict[str, int] = {}
+        for start in range(0, len(paths), _MAX_SQL_PARAMS):
+            chunk = paths[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT id, path FROM files WHERE path IN ({placeholders})", chunk
+            ).fetchall()
+            ids.update((row["path"], row["id"]) for row in rows)
+        return [ids[r.path] for r in records]
+
     def get_file_by_path(self, path: str) -> FileRecord | None:
         """Return a FileRecord for the given relative path, or None."""
         row = self._conn.execute(
@@ -364,12 +395,27 @@ class IndexDatabase:
 
 # ── Row mappers ───────────────────────────────────────────────────────────────
 
+def _file_params(record: FileRecord) -> dict[str, Any]:
+    return {
+        "path": record.path,
+        "language": record.language,
+        "role": record.role,
+        "size_bytes": record.size_bytes,
+        "mtime": record.mtime,
+        "lines_count": record.lines_count,
+        "indexed_at": record.indexed_at,
+    }
+
+
+# The _row_to_* mappers intern the closed-vocabulary columns (language, role,
+# kind, import_kind): each row carries its own copy, and interning makes every
+# record share one string object.
 def _row_to_file(row: sqlite3.Row) -> FileRecord:
     return FileRecord(
         id=row["id"],
         path=row["path"],
-        language=row["language"],
-        role=row["role"],
+        language=sys.intern(row["language"]),
+        role=sys.intern(row["role"]),
         size_bytes=row["size_bytes"],
         mtime=row["mtime"],
         lines_count=row["lines_count"],
@@ -382,7 +428,7 @@ def _row_to_symbol(row: sqlite3.Row) -> SymbolRecord:
         id=row["id"],
         file_id=row["file_id"],
         name=row["name"],
-        kind=row["kind"],
+        kind=sys.intern(row["kind"]),
         line_start=row["line_start"],
         line_end=row["line_end"],
         is_exported=bool(row["is_exported"]),
@@ -396,5 +442,5 @@ def _row_to_import(row: sqlite3.Row) -> ImportRecord:
         from_file_id=row["from_file_id"],
         imported_module=row["imported_module"],
         resolved_path=row["resolved_path"],
-        import_kind=row["import_kind"],
+        import_kind=sys.intern(row["import_kind"]),
     )
@@ -112,7 +112,7 @@ IMPORT_KINDS = frozenset({
 
 # ── Dataclass models ──────────────────────────────────────────────────────────
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileRecord:
     """Immutable representation of an indexed file."""
 
@@ -126,7 +126,7 @@ class FileRecord:
     id: int = 0         # 0 = not yet persisted
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolRecord:
     """Immutable representation of a code symbol (function, class, etc.)."""
 
@@ -140,7 +140,7 @@ class SymbolRecord:
     id: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportRecord:
     """Immutable representation of an import statement."""
 
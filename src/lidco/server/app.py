@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
@@ -38,10 +40,20 @@ logger = logging.getLogger(__name__)
 def create_app(project_dir: Path | None = None) -> FastAPI:
     """Create and configure the FastAPI application."""
 
+    _session_holder: dict[str, Session] = {}
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        session = _session_holder.pop("session", None)
+        if session is not None:
+            await session.aclose()
+
     app = FastAPI(
         title="LIDCO API",
         description="HTTP API for the LIDCO multi-agent coding assistant",
         version=__version__,
+        lifespan=lifespan,
     )
 
     # ── Middleware ───────────────────────────────────────────────────────────
@@ -67,9 +79,7 @@ def create_app(project_dir: Path | None = None) -> FastAPI:
         },
     )
 
-    # ── Session (lazy singleton) ────────────────────────────────────────────
-
-    _session_holder: dict[str, Session] = {}
+    # ── Session (lazy singleton, closed by ``lifespan``) ────────────────────
 
     def _get_session() -> Session:
         if "session" not in _session_holder:
@@ -46,6 +46,9 @@ class BaseTool(ABC):
     # __init__ without calling super().__init__().
     _progress_callback: Callable[[str], None] | None = None
 
+    # Lazily built by to_openai_schema(); same class-attribute default trick.
+    _openai_schema: dict[str, Any] | None = None
+
     def set_progress_callback(
         self, callback: Callable[[str], None] | None
     ) -> None:
@@ -90,7 +93,17 @@ class BaseTool(ABC):
         """Internal implementation - override this in subclasses."""
 
     def to_openai_schema(self) -> dict[str, Any]:
-        """Convert to OpenAI function-calling schema."""
+        """Convert to OpenAI function-calling schema.
+
+        The schema is built on first call and cached on the instance, since
+        name, description and parameters are fixed once a tool is constructed.
+        Callers share the returned dict and must treat it as read-only.
+        """
+        if self._openai_schema is None:
+            self._openai_schema = self._build_openai_schema()
+        return self._openai_schema
+
+    def _build_openai_schema(self) -> dict[str, Any]:
         properties: dict[str, Any] = {}
         required: list[str] = []
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -15,6 +16,9 @@ if TYPE_CHECKING:
 _COMPRESS_THRESHOLD = 4_000
 # Show this many chars of the raw content in compressed output.
 _COMPRESS_HEAD_CHARS = 2_000
+# Read files larger than this many bytes in a worker thread. Below it the
+# thread hand-off costs more than the read itself.
+_THREAD_READ_THRESHOLD = 256 * 1024
 
 # ── In-session read cache ────────────────────────────────────────────────────
 # Key: (path_str, offset, limit, mtime_ns) — the mtime component means the
@@ -128,15 +132,19 @@ class FileReadTool(BaseTool):
 
         # Build cache key using mtime_ns — auto-invalidates when file changes on disk
         try:
-            mtime_ns = path.stat().st_mtime_ns
+            st = path.stat()
+            mtime_ns, size = st.st_mtime_ns, st.st_size
         except OSError:
-            mtime_ns = 0
+            mtime_ns, size = 0, 0
         cache_key = (str(path), offset, limit, mtime_ns)
         cached = _cache_get(cache_key)
         if cached is not None:
             return ToolResult(output=cached, metadata={"path": str(path), "cached": True})
 
-        text = path.read_text(encoding="utf-8", errors="replace")
+        if size > _THREAD_READ_THRESHOLD:
+            text = await asyncio.to_thread(path.read_text, encoding="utf-8", errors="replace")
+        else:
+            text = path.read_text(encoding="utf-8", errors="replace")
 
         # Smart compression: only when reading from the start of a large file
         # and the project index has structural info about it.
@@ -2,11 +2,45 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
 from pathlib import Path
 from typing import Any
 
 from lidco.tools.base import BaseTool, ToolParameter, ToolPermission, ToolResult
 
+_NOISE_DIRS = frozenset({"__pycache__", "node_modules", ".git", "venv", ".venv"})
+
+
+def _is_noise(part: str) -> bool:
+    return part.startswith(".") or part in _NOISE_DIRS
+
+
+def _recursive_name_glob(search_dir: Path, name_pattern: str) -> list[Path]:
+    """Match ``**/<name_pattern>`` like ``Path.glob`` but without entering noise dirs.
+
+    ``Path.glob`` walks every directory before the results are filtered, which
+    on a project with ``node_modules`` or a virtualenv means tens of thousands
+    of entries that can never be returned.
+    """
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    matcher = re.compile(fnmatch.translate(name_pattern), flags)
+    # Like Path.glob, a name without wildcards only matches entries that exist
+    # (so not dangling symlinks).
+    literal = not set("*?[").intersection(name_pattern)
+    found: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(search_dir):
+        dirnames[:] = [d for d in dirnames if not _is_noise(d)]
+        for name in dirnames + filenames:
+            if _is_noise(name) or not matcher.match(name):
+                continue
+            path = Path(dirpath, name)
+            if literal and not path.exists():
+                continue
+            found.append(path)
+    return found
+
 
 class GlobTool(BaseTool):
     """Find files by glob pattern."""
@@ -46,16 +80,15 @@ class GlobTool(BaseTool):
         if not search_dir.exists():
             return ToolResult(output="", success=False, error=f"Directory not found: {search_dir}")
 
-        matches = sorted(search_dir.glob(pattern))
+        name_pattern = pattern[3:]
+        if pattern.startswith("**/") and name_pattern and not set("/\\").intersection(
+            name_pattern
+        ):
+            matches = sorted(_recursive_name_glob(search_dir, name_pattern))
+        else:
+            matches = sorted(search_dir.glob(pattern))
         # Filter out common noise
-        filtered = [
-            m for m in matches
-            if not any(
-                part.startswith(".")
-                or part in ("__pycache__", "node_modules", ".git", "venv", ".venv")
-                for part in m.parts
-            )
-        ]
+        filtered = [m for m in matches if not any(_is_noise(part) for part in m.parts)]
 
         if not filtered:
             return ToolResult(output="No files matched the pattern.", metadata={"count": 0})
@@ -8,6 +8,8 @@ from typing import Any
 
 from lidco.tools.base import BaseTool, ToolParameter, ToolPermission, ToolResult
 
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+
 
 class GrepTool(BaseTool):
     """Search file contents by regex pattern."""
@@ -65,15 +67,28 @@ class GrepTool(BaseTool):
         except re.error as e:
             return ToolResult(output="", success=False, error=f"Invalid regex: {e}")
 
+        # Literal patterns can rule out a file with a bytes substring search
+        # before paying for decoding and per-line matching.
+        needle: bytes | None = None
+        if (
+            not case_insensitive
+            and "\ufffd" not in pattern_str
+            and not _REGEX_METACHARS.intersection(pattern_str)
+        ):
+            needle = pattern_str.encode("utf-8")
+
         skip_dirs = {".git", "node_modules", "__pycache__", "venv", ".venv", "dist", "build"}
         results: list[str] = []
         max_results = 200
 
         def search_file(file_path: Path) -> None:
             try:
-                text = file_path.read_text(encoding="utf-8", errors="replace")
+                data = file_path.read_bytes()
             except (OSError, PermissionError):
                 return
+            if needle is not None and needle not in data:
+                return
+            text = data.decode("utf-8", errors="replace")
             for i, line in enumerate(text.splitlines(), 1):
                 if regex.search(line):
                     rel = file_path.relative_to(search_path) if search_path.is_dir() else file_path
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import re
 from typing import Any
 
@@ -15,15 +17,66 @@ except ImportError:
 
 from lidco.tools.base import BaseTool, ToolParameter, ToolPermission, ToolResult
 
+# Stop downloading once the body exceeds max_length * this many bytes. No
+# common encoding needs more than 4 bytes per character, so plain text is
+# never cut short of max_length.
+_FETCH_BYTES_PER_CHAR = 4
+# HTML shrinks a lot once tags and scripts are stripped, so always allow at
+# least this much markup.
+_MIN_FETCH_BYTES = 1024 * 1024
+
+
+_SCRIPT_STYLE_OPEN_RE = re.compile(r"<(script|style)[^>]*>", re.IGNORECASE)
+_SCRIPT_STYLE_CLOSE_RE = {
+    "script": re.compile(r"</script>", re.IGNORECASE),
+    "style": re.compile(r"</style>", re.IGNORECASE),
+}
+_BLOCK_TAG_RE = re.compile(r"<(br|p|div|h[1-6]|li|tr)[^>]*>", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _drop_script_style(html: str) -> str:
+    """Remove ``<script>``/``<style>`` blocks in a single left-to-right pass.
+
+    Once a closing tag is known to be missing, later openings of the same kind
+    are left in place without searching again; a backreferencing regex would
+    rescan to the end of the document for each one.
+    """
+    parts: list[str] = []
+    pos = 0
+    end = html.rfind(">") + 1
+    unclosed: set[str] = set()
+    while True:
+        opening = _SCRIPT_STYLE_OPEN_RE.search(html, pos, end)
+        if opening is None:
+            break
+        kind = opening.group(1).lower()
+        closing = None
+        if kind not in unclosed:
+            closing = _SCRIPT_STYLE_CLOSE_RE[kind].search(html, opening.end())
+        if closing is None:
+            unclosed.add(kind)
+            parts.append(html[pos:opening.end()])
+            pos = opening.end()
+        else:
+            parts.append(html[pos:opening.start()])
+            pos = closing.end()
+    parts.append(html[pos:])
+    return "".join(parts)
+
 
 def _strip_html(html: str) -> str:
     """Convert HTML to plain text preserving basic structure."""
     # Remove script and style blocks
-    text = re.sub(r"<(script|style)[^>]*>.*?</\1>", "", html, flags=re.DOTALL | re.IGNORECASE)
+    text = _drop_script_style(html)
+    # Tags can only match up to the last '>'; keeping the tail out of the
+    # substitutions stops a run of unterminated '<' from rescanning it.
+    cut = text.rfind(">") + 1
+    head, tail = text[:cut], text[cut:]
     # Convert block-level tags to newlines
-    text = re.sub(r"<(br|p|div|h[1-6]|li|tr)[^>]*>", "\n", text, flags=re.IGNORECASE)
+    head = _BLOCK_TAG_RE.sub("\n", head)
     # Strip remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
+    text = _TAG_RE.sub("", head) + tail
     # Decode common entities
     for entity, char in [("&amp;", "&"), ("&lt;", "<"), ("&gt;", ">"), ("&nbsp;", " "), ("&quot;", '"')]:
         text = text.replace(entity, char)
@@ -34,7 +87,36 @@ def _strip_html(html: str) -> str:
 
 
 class WebFetchTool(BaseTool):
-    """Fetch and parse a web page."""
+    """Fetch and parse a web page.
+
+    One ``httpx.AsyncClient`` is kept per tool instance so repeated fetches
+    reuse pooled connections. It is rebuilt if the tool is used from a
+    different event loop, since a client's connections belong to one loop.
+    Call :meth:`aclose` when the tool is no longer needed.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            await self.aclose()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(follow_redirects=True, timeout=15.0)
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client, if one was created."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None or client.is_closed:
+            return
+        # A client left over from a finished event loop cannot shut its
+        # connections down cleanly; there is nothing more to release.
+        with contextlib.suppress(RuntimeError):
+            await client.aclose()
 
     @property
     def name(self) -> str:
@@ -76,10 +158,18 @@ class WebFetchTool(BaseTool):
                 error="httpx is not installed. Run: pip install httpx",
             )
 
+        byte_limit = max(max_length * _FETCH_BYTES_PER_CHAR, _MIN_FETCH_BYTES)
+        body = bytearray()
+        cut_short = False
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=15.0) as client:
-                response = await client.get(url)
+            client = await self._get_client()
+            async with client.stream("GET", url) as response:
                 response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > byte_limit:
+                        cut_short = True
+                        break
         except httpx.TimeoutException:
             return ToolResult(
                 output="",
@@ -94,14 +184,14 @@ class WebFetchTool(BaseTool):
             )
 
         content_type = response.headers.get("content-type", "")
-        raw = response.text
+        raw = body.decode(response.encoding or "utf-8", errors="replace")
 
         if "html" in content_type or raw.strip().startswith("<"):
             text = _strip_html(raw)
         else:
             text = raw
 
-        if len(text) > max_length:
+        if cut_short or len(text) > max_length:
             text = text[:max_length] + "\n\n[Truncated]"
 
         return ToolResult(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from typing import Any
 
 from lidco.tools.base import BaseTool, ToolParameter, ToolPermission, ToolResult
@@ -18,8 +19,14 @@ class WebSearchTool(BaseTool):
     within the same session.
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        ddgs_factory: Callable[[], Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
         super().__init__(**kwargs)
+        # Optional injected DDGS constructor — skips the lazy duckduckgo_search import.
+        self._ddgs_factory = ddgs_factory
         # Cache: query -> (cached_at: float, output: str)
         self._cache: dict[str, tuple[float, str]] = {}
 
@@ -67,20 +74,23 @@ class WebSearchTool(BaseTool):
                     metadata={"query": query, "result_count": 0, "cached": True},
                 )
 
-        try:
-            from duckduckgo_search import DDGS
-        except ImportError:
-            return ToolResult(
-                output="",
-                success=False,
-                error=(
-                    "duckduckgo-search is not installed. "
-                    "Run: pip install duckduckgo-search"
-                ),
-            )
+        ddgs_factory = self._ddgs_factory
+        if ddgs_factory is None:
+            try:
+                from duckduckgo_search import DDGS
+            except ImportError:
+                return ToolResult(
+                    output="",
+                    success=False,
+                    error=(
+                        "duckduckgo-search is not installed. "
+                        "Run: pip install duckduckgo-search"
+                    ),
+                )
+            ddgs_factory = DDGS
 
         try:
-            with DDGS() as ddgs:
+            with ddgs_factory() as ddgs:
                 results = list(ddgs.text(query, max_results=max_results))
         except Exception as e:
             return ToolResult(
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 
 from lidco.agents.builtin.researcher import create_researcher_agent
 
 
+class _Stub:
+    """Opaque stand-in; the factory only stores the LLM and registry."""
+
+
 class TestResearcherAgent:
     def setup_method(self):
-        self.llm = MagicMock()
-        self.tool_registry = MagicMock()
+        self.llm = _Stub()
+        self.tool_registry = _Stub()
         self.agent = create_researcher_agent(self.llm, self.tool_registry)
 
     def test_name(self):
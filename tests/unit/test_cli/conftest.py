@@ -0,0 +1,62 @@
+"""Shared fixtures for CLI rendering tests."""
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+
+class ListIO:
+    """Write-only text sink that appends chunks to a list; joined on ``getvalue()``."""
+
+    def __init__(self) -> None:
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+    def getvalue(self) -> str:
+        return "".join(self.writes)
+
+
+@pytest.fixture(scope="session")
+def _shared_console() -> Console:
+    """One ANSI Console for the whole session — terminal detection runs once."""
+    return Console(file=StringIO(), force_terminal=True, width=120)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_rich(_shared_console: Console) -> None:
+    """Pay Rich's lazy Markdown/Pygments loading once, not inside the first test."""
+    from rich.markdown import Markdown
+    from rich.syntax import Syntax
+
+    _shared_console.file = ListIO()
+    _shared_console.print(Markdown("# warm\n\n`x`"))
+    _shared_console.print(Syntax("x = 1", "python", theme="monokai"))
+
+
+@pytest.fixture
+def captured_console(_shared_console: Console):
+    """The shared Console pointed at a fresh ``ListIO`` buffer for assertion."""
+    buf = ListIO()
+    _shared_console.file = buf
+    return _shared_console, buf
+
+
+@pytest.fixture
+def _no_live(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep Rich Live from spawning its refresh thread; tests run synchronously.
+
+    Opt in with ``pytest.mark.usefixtures("_no_live")`` where a Live is started.
+    """
+    monkeypatch.setattr("rich.live.Live.start", lambda self, *a, **k: None)
+    monkeypatch.setattr("rich.live.Live.stop", lambda self, *a, **k: None)
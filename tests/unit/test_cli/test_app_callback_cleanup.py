@@ -59,6 +59,7 @@ def _make_mock_session(streaming: bool = False):
     session.token_budget.total_prompt_tokens = 6
     session.token_budget.total_completion_tokens = 4
     session.token_budget.total_cost_usd = 0.002
+    session.aclose = AsyncMock()
 
     config = MagicMock()
     config.llm.streaming = streaming
@@ -87,7 +87,6 @@ class TestExportErrors:
 
 @pytest.mark.skip(reason="Q92 overrides /export with sync handler — tested in test_q92/")
 class TestExportJson:
-    @pytest.mark.asyncio
     async def test_default_creates_json_in_lidco_exports(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -102,7 +101,6 @@ class TestExportJson:
         json_files = list((tmp_path / ".lidco" / "exports").glob("session-*.json"))
         assert len(json_files) == 1
 
-    @pytest.mark.asyncio
     async def test_json_structure(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -132,7 +130,6 @@ class TestExportJson:
         assert data["tokens"]["total"] == 1500
         assert abs(data["cost_usd"] - 0.003) < 1e-6
 
-    @pytest.mark.asyncio
     async def test_custom_json_path(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -147,7 +144,6 @@ class TestExportJson:
         data = json.loads(custom.read_text(encoding="utf-8"))
         assert len(data["messages"]) == 2
 
-    @pytest.mark.asyncio
     async def test_json_messages_contain_all_turns(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -169,7 +165,6 @@ class TestExportJson:
 
 @pytest.mark.skip(reason="Q92 overrides /export with sync handler — tested in test_q92/")
 class TestExportMarkdown:
-    @pytest.mark.asyncio
     async def test_md_flag_creates_markdown(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -182,7 +177,6 @@ class TestExportMarkdown:
         md_files = list(tmp_path.glob("lidco-session-*.md"))
         assert len(md_files) == 1
 
-    @pytest.mark.asyncio
     async def test_md_content(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -203,7 +197,6 @@ class TestExportMarkdown:
         assert "## LIDCO" in content
         assert "Hi there!" in content
 
-    @pytest.mark.asyncio
     async def test_md_custom_path(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -217,7 +210,6 @@ class TestExportMarkdown:
         content = custom.read_text(encoding="utf-8")
         assert "# LIDCO Session Export" in content
 
-    @pytest.mark.asyncio
     async def test_md_role_headers_alternate(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -238,7 +230,6 @@ class TestExportMarkdown:
         assert you_positions[0] < lidco_positions[0]
         assert you_positions[1] < lidco_positions[1]
 
-    @pytest.mark.asyncio
     async def test_md_token_metadata(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -266,18 +257,15 @@ class TestExportMarkdown:
 # ---------------------------------------------------------------------------
 
 class TestImportHandler:
-    @pytest.mark.asyncio
     async def test_no_session(self, registry: CommandRegistry) -> None:
         result = await registry.get("import").handler(arg="file.json")
         assert result == "Session not initialized."
 
-    @pytest.mark.asyncio
     async def test_no_arg_shows_usage(self, registry: CommandRegistry) -> None:
         registry.set_session(_make_session())
         result = await registry.get("import").handler()
         assert "Usage" in result or "/import" in result
 
-    @pytest.mark.asyncio
     async def test_file_not_found(
         self, registry: CommandRegistry, tmp_path: Path
     ) -> None:
@@ -285,7 +273,6 @@ class TestImportHandler:
         result = await registry.get("import").handler(arg=str(tmp_path / "nope.json"))
         assert "not found" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_import_restores_history(
         self, registry: CommandRegistry, tmp_path: Path
     ) -> None:
@@ -311,7 +298,6 @@ class TestImportHandler:
         # Verify restore_history was called with the messages
         session.orchestrator.restore_history.assert_called_once_with(HISTORY_2)
 
-    @pytest.mark.asyncio
     async def test_import_summary_contains_metadata(
         self, registry: CommandRegistry, tmp_path: Path
     ) -> None:
@@ -331,7 +317,6 @@ class TestImportHandler:
         assert "openai/glm-4.7" in result
         assert "5,000" in result or "5000" in result
 
-    @pytest.mark.asyncio
     async def test_import_invalid_json(
         self, registry: CommandRegistry, tmp_path: Path
     ) -> None:
@@ -342,7 +327,6 @@ class TestImportHandler:
         result = await registry.get("import").handler(arg=str(bad_file))
         assert "failed" in result.lower() or "invalid" in result.lower()
 
-    @pytest.mark.asyncio
     async def test_import_missing_messages_key(
         self, registry: CommandRegistry, tmp_path: Path
     ) -> None:
@@ -354,7 +338,6 @@ class TestImportHandler:
         assert "messages" in result.lower() or "invalid" in result.lower()
 
     @pytest.mark.skip(reason="Q92 overrides /export — tested in test_q92/")
-    @pytest.mark.asyncio
     async def test_roundtrip_export_then_import(
         self, registry: CommandRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
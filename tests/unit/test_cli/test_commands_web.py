@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import sys
 from types import ModuleType
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -160,20 +160,27 @@ class TestWebfetchCommand:
         import httpx
         from unittest.mock import patch, AsyncMock as AM
 
+        async def _aiter_bytes():
+            yield b"Hello, plain text content"
+
         mock_resp = MagicMock()
         mock_resp.raise_for_status = MagicMock()
         mock_resp.headers = {"content-type": "text/plain"}
-        mock_resp.text = "Hello, plain text content"
+        mock_resp.encoding = "utf-8"
+        mock_resp.aiter_bytes = _aiter_bytes
 
-        mock_client = AsyncMock()
-        mock_client.get = AM(return_value=mock_resp)
+        mock_stream = MagicMock()
+        mock_stream.__aenter__ = AM(return_value=mock_resp)
+        mock_stream.__aexit__ = AM(return_value=None)
 
         with patch("httpx.AsyncClient") as mock_cls:
-            mock_cls.return_value.__aenter__ = AM(return_value=mock_client)
-            mock_cls.return_value.__aexit__ = AM(return_value=None)
+            mock_cls.return_value.is_closed = False
+            mock_cls.return_value.stream = MagicMock(return_value=mock_stream)
+            mock_cls.return_value.aclose = AM()
             result = await cmd.handler(arg="https://example.com")
 
-        assert result  # non-empty
+        assert "Hello, plain text content" in result
+        mock_cls.return_value.aclose.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_httpx_not_installed(self):
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from lidco.cli.commands import CommandRegistry
-from lidco.index.db import IndexDatabase
 from lidco.index.schema import FileRecord
 
 
@@ -163,13 +163,24 @@ class TestIndexStatusCommand:
         result = asyncio.run(project_registry.get("index-status").handler())
         assert "up to date" in result
 
-    def test_stale_index_warns(self, project_registry: CommandRegistry, tmp_path: Path) -> None:
+    def test_stale_index_warns(
+        self,
+        project_registry: CommandRegistry,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         import asyncio
-        # Build index, then manually set a very old timestamp
-        asyncio.run(project_registry.get("index").handler(arg="full"))
-        db = IndexDatabase(tmp_path / ".lidco" / "project_index.db")
-        db.set_meta("last_indexed_at", str(time.time() - 25 * 3600))
-        db.close()
+
+        from lidco.index import project_indexer
+        from lidco.index.db import IndexDatabase
+
+        # Build the index directly: /index is taken over by the semantic-index command
+        with IndexDatabase(tmp_path / ".lidco" / "project_index.db") as db:
+            project_indexer.ProjectIndexer(project_dir=tmp_path, db=db).run_full_index()
+        # Move the indexer's clock forward instead of rewriting the DB meta;
+        # only the module's own ``time`` name is swapped, not time.time itself
+        later = time.time() + 25 * 3600
+        monkeypatch.setattr(project_indexer, "time", SimpleNamespace(time=lambda: later))
         result = asyncio.run(project_registry.get("index-status").handler())
         assert "older than 24 hours" in result
 
@@ -178,27 +189,31 @@ class TestIndexStatusCommand:
 
 
 class TestIndexSubcommand:
-    def test_full_index_stdout(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    def test_full_index_stdout(
+        self, tmp_path: Path, capfdbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
         _make_project(tmp_path)
         from lidco.__main__ import _run_index
         _run_index(["--dir", str(tmp_path)])
-        captured = capsys.readouterr()
-        assert "Done:" in captured.out
-        assert "files" in captured.out
+        captured = capfdbinary.readouterr()
+        assert b"Done:" in captured.out
+        assert b"files" in captured.out
 
-    def test_incremental_flag(self, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    def test_incremental_flag(
+        self, tmp_path: Path, capfdbinary: pytest.CaptureFixture[bytes]
+    ) -> None:
         _make_project(tmp_path)
         from lidco.__main__ import _run_index
         # First full
         _run_index(["--dir", str(tmp_path)])
-        capsys.readouterr()
+        capfdbinary.readouterr()
         # Then incremental — nothing changed, should skip all
         _run_index(["--dir", str(tmp_path), "--incremental"])
-        captured = capsys.readouterr()
-        assert "Done:" in captured.out
+        captured = capfdbinary.readouterr()
+        assert b"Done:" in captured.out
 
     def test_codemap_flag_writes_file(
-        self, tmp_path: Path, capsys: pytest.CaptureFixture
+        self, tmp_path: Path, capfdbinary: pytest.CaptureFixture[bytes]
     ) -> None:
         _make_project(tmp_path)
         from lidco.__main__ import _run_index
@@ -213,7 +228,7 @@ class TestIndexSubcommand:
             _run_index(["--unknown-flag"])
 
     def test_creates_db_in_lidco_dir(
-        self, tmp_path: Path, capsys: pytest.CaptureFixture
+        self, tmp_path: Path, capfdbinary: pytest.CaptureFixture[bytes]
     ) -> None:
         _make_project(tmp_path)
         from lidco.__main__ import _run_index
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -171,21 +172,35 @@ class TestRunServe:
 # ── _run_index incremental path ───────────────────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def _indexed_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A one-file project with a full structural index built once per session."""
+    from lidco.index.db import IndexDatabase
+    from lidco.index.project_indexer import ProjectIndexer
+
+    root = tmp_path_factory.mktemp("indexed_template")
+    src = root / "src"
+    src.mkdir()
+    (src / "main.py").write_text("def main(): pass\n", encoding="utf-8")
+
+    db = IndexDatabase(root / ".lidco" / "project_index.db")
+    try:
+        ProjectIndexer(project_dir=root, db=db).run_full_index()
+    finally:
+        db.close()
+    return root
+
+
 class TestRunIndexIncremental:
     def test_incremental_after_full_uses_incremental(
-        self, tmp_path: Path, capsys: pytest.CaptureFixture
+        self, tmp_path: Path, capsys: pytest.CaptureFixture, _indexed_template: Path
     ) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "main.py").write_text("def main(): pass\n", encoding="utf-8")
+        # copytree keeps mtimes, so the copied index still matches the files
+        shutil.copytree(_indexed_template, tmp_path, dirs_exist_ok=True)
 
         from lidco.__main__ import _run_index
 
-        # First run: full index
-        _run_index(["--dir", str(tmp_path)])
-        capsys.readouterr()
-
-        # Second run: incremental (DB already has files)
+        # DB already has files → incremental
         _run_index(["--dir", str(tmp_path), "--incremental"])
         captured = capsys.readouterr()
         assert "incremental" in captured.out
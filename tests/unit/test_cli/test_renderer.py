@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
-from io import StringIO
+import re
 
 import pytest
-from rich.console import Console
 
 from lidco.cli.renderer import Renderer
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _plain(buf) -> str:
+    """Rendered text with ANSI styling removed, for substring assertions."""
+    return _ANSI_RE.sub("", buf.getvalue())
+
 
 @pytest.fixture
-def captured_renderer():
-    """Create a Renderer that writes to a string buffer for assertion."""
-    buf = StringIO()
-    console = Console(file=buf, force_terminal=True, width=120)
-    renderer = Renderer(console)
-    return renderer, buf
+def captured_renderer(captured_console):
+    """Create a Renderer on the shared ANSI console, writing to a fresh buffer."""
+    console, buf = captured_console
+    return Renderer(console), buf
 
 
 class TestSummaryFiltering:
@@ -30,11 +34,8 @@ class TestSummaryFiltering:
             {"tool": "glob", "args": {"pattern": "*.py"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
         # No panel should be printed at all
-        assert "Summary" not in output
-        assert "Read:" not in output
-        assert "Searched:" not in output
+        assert _plain(buf) == ""
 
     def test_write_tools_shown(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -43,7 +44,7 @@ class TestSummaryFiltering:
             {"tool": "file_edit", "args": {"path": "src/old.py"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Итог" in output
         assert "Создан: src/new.py" in output
         assert "Изменён: src/old.py" in output
@@ -54,8 +55,7 @@ class TestSummaryFiltering:
             {"tool": "bash", "args": {"command": "npm test"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
-        assert "Выполнено: npm test" in output
+        assert "Выполнено: npm test" in _plain(buf)
 
     def test_git_shown(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -63,8 +63,7 @@ class TestSummaryFiltering:
             {"tool": "git", "args": {"subcommand": "commit"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
-        assert "Git: commit" in output
+        assert "Git: commit" in _plain(buf)
 
     def test_unknown_tool_shown(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -72,8 +71,7 @@ class TestSummaryFiltering:
             {"tool": "web_search", "args": {"query": "python docs"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
-        assert "web_search" in output
+        assert "web_search" in _plain(buf)
 
     def test_mixed_calls_filters_read_only(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -85,11 +83,12 @@ class TestSummaryFiltering:
             {"tool": "bash", "args": {"command": "pytest"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Изменён: a.py" in output
         assert "Выполнено: pytest" in output
-        assert "Read:" not in output
-        assert "Searched:" not in output
+        # Read-only calls (grep "foo", glob "*.md") leave no trace
+        assert "foo" not in output
+        assert "*.md" not in output
 
     def test_deduplication(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -98,9 +97,8 @@ class TestSummaryFiltering:
             {"tool": "file_edit", "args": {"path": "x.py"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
         # "Изменён: x.py" should appear only once
-        assert output.count("Изменён: x.py") == 1
+        assert _plain(buf).count("Изменён: x.py") == 1
 
     def test_empty_after_filtering_no_panel(self, captured_renderer):
         renderer, buf = captured_renderer
@@ -109,14 +107,12 @@ class TestSummaryFiltering:
             {"tool": "file_read", "args": {"path": "b.py"}},
         ]
         renderer.summary(tool_calls)
-        output = buf.getvalue()
-        assert "Summary" not in output
+        assert _plain(buf) == ""
 
     def test_empty_list_no_panel(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.summary([])
-        output = buf.getvalue()
-        assert "Summary" not in output
+        assert _plain(buf) == ""
 
 
 class TestAssistantHeader:
@@ -125,32 +121,32 @@ class TestAssistantHeader:
     def test_known_agent_shows_label(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("coder")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "coder" in output
 
     def test_debugger_header(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("debugger")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "debugger" in output
 
     def test_unknown_agent_falls_back(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("myagent")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "myagent" in output
 
     def test_default_agent_is_lidco(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header()
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "lidco" in output
 
     def test_agent_icon_present(self, captured_renderer):
         # ⌨ (U+2328) is the coder icon
         renderer, buf = captured_renderer
         renderer.assistant_header("coder")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "\u2328" in output
 
 
@@ -166,7 +162,7 @@ class TestCodeBlockPanels:
         text = self._make_fence("python", 5)
         renderer.markdown(text)
         # Short block stays inline — no Panel border characters
-        output = buf.getvalue()
+        output = _plain(buf)
         # Panel border uses box-drawing chars; short blocks should NOT produce a Panel
         assert "line_0" in output
 
@@ -174,7 +170,7 @@ class TestCodeBlockPanels:
         renderer, buf = captured_renderer
         text = self._make_fence("python", 15)
         renderer.markdown(text)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "line_0" in output
         assert "line_14" in output
 
@@ -183,7 +179,7 @@ class TestCodeBlockPanels:
         prose = "Here is the implementation:\n\n"
         code = self._make_fence("python", 12)
         renderer.markdown(prose + code)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "implementation" in output
         assert "line_0" in output
 
@@ -192,14 +188,14 @@ class TestCodeBlockPanels:
         block1 = self._make_fence("python", 12)
         block2 = self._make_fence("bash", 11)
         renderer.markdown(block1 + "\n\nSome text\n\n" + block2)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "line_0" in output
         assert "Some text" in output
 
     def test_empty_text_no_crash(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.markdown("")  # should not raise
-        output = buf.getvalue()
+        output = _plain(buf)
         assert output == "" or True  # just check no exception
 
 
@@ -212,7 +208,7 @@ class TestTurnSummary:
             model="gpt-4", iterations=3, tool_calls=2,
             files_changed=1, tokens=1500, cost_usd=0.002,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "gpt-4" in output
         assert "2 инструментов" in output
         assert "1 файл" in output
@@ -225,7 +221,7 @@ class TestTurnSummary:
             model="gpt-4", iterations=1, tool_calls=0,
             files_changed=0, tokens=500, cost_usd=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "$" not in output
         assert "500 токенов" in output
 
@@ -235,7 +231,7 @@ class TestTurnSummary:
             model="m", iterations=1, tool_calls=1,
             files_changed=0, tokens=100, cost_usd=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "1 инструмент" in output
         assert "инструментов" not in output
 
@@ -245,7 +241,7 @@ class TestTurnSummary:
             model="m", iterations=5, tool_calls=0,
             files_changed=0, tokens=100, cost_usd=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "шаг 5" in output
 
     def test_step_hidden_when_one_iteration(self, captured_renderer):
@@ -254,7 +250,7 @@ class TestTurnSummary:
             model="m", iterations=1, tool_calls=0,
             files_changed=0, tokens=100, cost_usd=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "шаг" not in output
 
 
@@ -264,7 +260,7 @@ class TestAgentSelected:
     def test_known_agent_shows_icon(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.agent_selected("coder")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Авто" in output
         assert "coder" in output
         assert "\u2192" in output  # → arrow
@@ -272,13 +268,13 @@ class TestAgentSelected:
     def test_unknown_agent_fallback(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.agent_selected("mybot")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "mybot" in output
 
     def test_debugger_announcement(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.agent_selected("debugger")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "debugger" in output
 
 
@@ -288,7 +284,7 @@ class TestModelFallback:
     def test_shows_both_models(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.model_fallback("claude-opus", "claude-sonnet", "retries exhausted")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "claude-opus" in output
         assert "claude-sonnet" in output
         assert "retries exhausted" in output
@@ -296,7 +292,7 @@ class TestModelFallback:
     def test_shows_arrow(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.model_fallback("a", "b", "stream error")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "\u2192" in output  # →
 
 
@@ -306,13 +302,13 @@ class TestContextWarning:
     def test_shows_percentage(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.context_warning(83)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "83%" in output
 
     def test_shows_clear_hint(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.context_warning(95)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "/clear" in output
 
 
@@ -326,19 +322,19 @@ class TestFriendlyError:
             pass
 
         renderer.friendly_error(LLMRetryExhausted("all failed"))
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Все модели недоступны" in output
 
     def test_timeout_error(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.friendly_error(TimeoutError("timed out"))
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "время ожидания" in output.lower()
 
     def test_generic_exception(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.friendly_error(ValueError("bad value xyz"))
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "bad value xyz" in output
 
     def test_no_crash_on_empty_message(self, captured_renderer):
@@ -355,47 +351,47 @@ class TestAssistantHeaderTurn:
     def test_turn_number_shown(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("coder", turn=3)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Ход 3" in output
         assert "coder" in output
 
     def test_turn_zero_omitted(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("coder", turn=0)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Ход" not in output
         assert "coder" in output
 
     def test_turn_default_omitted(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("debugger")
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Ход" not in output
 
     def test_turn_one(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("tester", turn=1)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Ход 1" in output
         assert "tester" in output
 
     def test_large_turn_number(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("auto", turn=42)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "Ход 42" in output
 
     def test_agent_still_shown_with_turn(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("architect", turn=5)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "architect" in output
         assert "Ход 5" in output
 
     def test_unknown_agent_with_turn(self, captured_renderer):
         renderer, buf = captured_renderer
         renderer.assistant_header("mybot", turn=2)
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "mybot" in output
         assert "Ход 2" in output
 
@@ -410,7 +406,7 @@ class TestTurnSummaryElapsed:
             files_changed=0, tokens=100, cost_usd=0.0,
             elapsed=3.7,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "3.7с" in output
 
     def test_elapsed_zero_omitted(self, captured_renderer):
@@ -420,7 +416,7 @@ class TestTurnSummaryElapsed:
             files_changed=0, tokens=100, cost_usd=0.0,
             elapsed=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "с" not in output or "токенов" in output  # no elapsed suffix
 
     def test_elapsed_default_omitted(self, captured_renderer):
@@ -429,7 +425,7 @@ class TestTurnSummaryElapsed:
             model="gpt-4", iterations=1, tool_calls=0,
             files_changed=0, tokens=100, cost_usd=0.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         # No time shown when elapsed not provided
         assert "0.0с" not in output
 
@@ -440,7 +436,7 @@ class TestTurnSummaryElapsed:
             files_changed=0, tokens=50, cost_usd=0.0,
             elapsed=12.456,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "12.5с" in output
 
     def test_elapsed_with_other_fields(self, captured_renderer):
@@ -450,7 +446,7 @@ class TestTurnSummaryElapsed:
             files_changed=1, tokens=2000, cost_usd=0.01,
             elapsed=5.0,
         )
-        output = buf.getvalue()
+        output = _plain(buf)
         assert "claude-3" in output
         assert "5.0с" in output
         assert "2.0k токенов" in output
@@ -2,29 +2,37 @@
 
 from __future__ import annotations
 
-from io import StringIO
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 
 import pytest
-from rich.console import Console
 
 from lidco.cli.stream_display import StreamDisplay, _brief_result, _extract_key_arg
 
-
-@pytest.fixture
-def captured_console():
-    """Create a Console that writes to a string buffer for assertion."""
-    buf = StringIO()
-    console = Console(file=buf, force_terminal=True, width=120)
-    return console, buf
+pytestmark = [pytest.mark.xdist_group("stream_display"), pytest.mark.usefixtures("_no_live")]
 
 
 @pytest.fixture
-def display(captured_console):
+def display(captured_console, request):
     console, _ = captured_console
     sd = StreamDisplay(console)
-    yield sd
-    sd.finish()
+    request.addfinalizer(sd.finish)
+    return sd
+
+
+@pytest.fixture(scope="module")
+def big_diff_args() -> dict[str, str]:
+    """A 20-line old/new edit — enough to trip the diff truncation."""
+    return {
+        "path": "big.py",
+        "old_string": "\n".join(f"old line {i}" for i in range(20)),
+        "new_string": "\n".join(f"new line {i}" for i in range(20)),
+    }
+
+
+@pytest.fixture(scope="module")
+def long_bash_output() -> str:
+    """30 lines of bash output — more than the displayed tail."""
+    return "\n".join(f"line {i}" for i in range(30))
 
 
 class TestOnTextChunk:
@@ -78,9 +86,7 @@ class TestReadOnlyTools:
     def test_end_event_silenced(self, captured_console, tool):
         console, buf = captured_console
         sd = StreamDisplay(console)
-        result = MagicMock()
-        result.success = True
-        result.output = "some output"
+        result = SimpleNamespace(success=True, output="some output", error=None)
         sd.on_tool_event("end", tool, {}, result)
         sd.finish()
         output = buf.getvalue()
@@ -107,9 +113,7 @@ class TestFileEditDisplay:
             "old_string": "old line 1\nold line 2",
             "new_string": "new line 1\nnew line 2",
         }
-        result = MagicMock()
-        result.success = True
-        result.output = "Replaced 1 occurrence(s)"
+        result = SimpleNamespace(success=True, output="Replaced 1 occurrence(s)", error=None)
         sd.on_tool_event("end", "file_edit", args, result)
         sd.finish()
         output = buf.getvalue()
@@ -119,20 +123,11 @@ class TestFileEditDisplay:
         assert "new line 1" in output
         assert "\u2713" in output
 
-    def test_truncates_long_diffs(self, captured_console):
+    def test_truncates_long_diffs(self, captured_console, big_diff_args):
         console, buf = captured_console
         sd = StreamDisplay(console)
-        old_lines = "\n".join(f"old line {i}" for i in range(20))
-        new_lines = "\n".join(f"new line {i}" for i in range(20))
-        args = {
-            "path": "big.py",
-            "old_string": old_lines,
-            "new_string": new_lines,
-        }
-        result = MagicMock()
-        result.success = True
-        result.output = "Applied"
-        sd.on_tool_event("end", "file_edit", args, result)
+        result = SimpleNamespace(success=True, output="Applied", error=None)
+        sd.on_tool_event("end", "file_edit", big_diff_args, result)
         sd.finish()
         output = buf.getvalue()
         # Should show "... (10 more lines)" for both old and new
@@ -160,9 +155,7 @@ class TestFileWriteDisplay:
         sd = StreamDisplay(console)
         content = "line1\nline2\nline3\n"
         args = {"path": "src/new_file.py", "content": content}
-        result = MagicMock()
-        result.success = True
-        result.output = "created"
+        result = SimpleNamespace(success=True, output="created", error=None)
         sd.on_tool_event("end", "file_write", args, result)
         sd.finish()
         output = buf.getvalue()
@@ -174,9 +167,7 @@ class TestFileWriteDisplay:
         console, buf = captured_console
         sd = StreamDisplay(console)
         args = {"path": "one.txt", "content": "single line"}
-        result = MagicMock()
-        result.success = True
-        result.output = "created"
+        result = SimpleNamespace(success=True, output="created", error=None)
         sd.on_tool_event("end", "file_write", args, result)
         sd.finish()
         output = buf.getvalue()
@@ -200,22 +191,22 @@ class TestBashDisplay:
     def test_end_shows_output_lines(self, captured_console):
         console, buf = captured_console
         sd = StreamDisplay(console)
-        result = MagicMock()
-        result.success = True
-        result.output = "PASS src/app.test.ts\nTests: 5 passed"
+        result = SimpleNamespace(
+            success=True,
+            output="PASS src/app.test.ts\nTests: 5 passed",
+            error=None,
+        )
         sd.on_tool_event("end", "bash", {"command": "npm test"}, result)
         sd.finish()
         output = buf.getvalue()
         assert "PASS src/app.test.ts" in output
         assert "Tests: 5 passed" in output
 
-    def test_end_truncates_long_output(self, captured_console):
+    def test_end_truncates_long_output(self, captured_console, long_bash_output):
         # 30 lines, max_tail=5 → "▲ 25 more lines" shown before the tail
         console, buf = captured_console
         sd = StreamDisplay(console)
-        result = MagicMock()
-        result.success = True
-        result.output = "\n".join(f"line {i}" for i in range(30))
+        result = SimpleNamespace(success=True, output=long_bash_output, error=None)
         sd.on_tool_event("end", "bash", {"command": "ls"}, result)
         sd.finish()
         output = buf.getvalue()
@@ -226,9 +217,7 @@ class TestBashDisplay:
     def test_bash_error_shows_error(self, captured_console):
         console, buf = captured_console
         sd = StreamDisplay(console)
-        result = MagicMock()
-        result.success = False
-        result.error = "Command failed"
+        result = SimpleNamespace(success=False, error="Command failed", output="")
         sd.on_tool_event("end", "bash", {"command": "bad"}, result)
         sd.finish()
         output = buf.getvalue()
@@ -242,9 +231,7 @@ class TestOnToolEvent:
     def test_end_event_failure(self, captured_console):
         console, buf = captured_console
         sd = StreamDisplay(console)
-        result = MagicMock()
-        result.success = False
-        result.error = "Something went wrong"
+        result = SimpleNamespace(success=False, error="Something went wrong", output="")
         sd.on_tool_event("end", "git", {"subcommand": "push"}, result)
         sd.finish()
         output = buf.getvalue()
@@ -339,9 +326,7 @@ class TestStatusBarLifecycle:
         sd.on_tool_event("start", "file_read", {"path": "x.py"})
         assert sd.live is not None
 
-        result = MagicMock()
-        result.success = True
-        result.output = "content\n"
+        result = SimpleNamespace(success=True, output="content\n", error=None)
         sd.on_tool_event("end", "file_read", {"path": "x.py"}, result)
 
         sd.on_status("Thinking (step 2)")
@@ -460,26 +445,21 @@ class TestSetPhase:
 
 class TestBriefResult:
     def test_file_read(self):
-        result = MagicMock()
-        result.output = "line1\nline2\nline3\n"
+        result = SimpleNamespace(output="line1\nline2\nline3\n")
         assert _brief_result("file_read", result) == "3 строк"
 
     def test_file_write(self):
-        result = MagicMock()
-        result.output = "created"
+        result = SimpleNamespace(output="created")
         assert _brief_result("file_write", result) == "Изменение применено"
 
     def test_bash_single_line(self):
-        result = MagicMock()
-        result.output = "OK"
+        result = SimpleNamespace(output="OK")
         assert _brief_result("bash", result) == "OK"
 
     def test_bash_multi_line(self):
-        result = MagicMock()
-        result.output = "line1\nline2\nline3"
+        result = SimpleNamespace(output="line1\nline2\nline3")
         assert _brief_result("bash", result) == "3 строк вывода"
 
     def test_grep_matches(self):
-        result = MagicMock()
-        result.output = "file1.py\nfile2.py\n"
+        result = SimpleNamespace(output="file1.py\nfile2.py\n")
         assert _brief_result("grep", result) == "2 совпадений"
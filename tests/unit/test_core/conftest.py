@@ -0,0 +1,18 @@
+"""Shared fixtures for core tests."""
+from __future__ import annotations
+
+import pytest
+
+from lidco.core.config import LidcoConfig, load_config
+
+
+@pytest.fixture(scope="session")
+def default_config() -> LidcoConfig:
+    """``load_config()`` result — the YAML search and parse run once per session."""
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def base_config() -> LidcoConfig:
+    """A pristine ``LidcoConfig()``; callers derive variants via ``model_copy``."""
+    return LidcoConfig()
@@ -1,5 +1,7 @@
 """Tests for the clarification system."""
 
+import copy
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,7 +10,70 @@ from lidco.core.clarification import (
     ClarificationManager,
     ClarificationNeeded,
 )
-from lidco.core.memory import MemoryStore
+from lidco.core.memory import MemoryEntry, MemoryStore
+
+pytestmark = pytest.mark.xdist_group("clarification")
+
+
+class FakeMemoryStore(MemoryStore):
+    """MemoryStore that keeps entries in RAM only — no directory scan, no JSON writes."""
+
+    def _load(self) -> None:
+        pass
+
+    def _save_entry(self, entry: MemoryEntry, scope: str = "global") -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def _clean_mgr() -> ClarificationManager:
+    return ClarificationManager(FakeMemoryStore(max_entries=100))
+
+
+@pytest.fixture
+def mgr(_clean_mgr: ClarificationManager) -> ClarificationManager:
+    """A private copy of the warm, empty manager — tests may mutate it freely."""
+    return copy.deepcopy(_clean_mgr)
+
+
+# Canned ambiguity-analysis replies; one mock LLM per shape, built once per module.
+_CLEAR_REPLY = '{"clear": true}'
+_QUESTIONS_REPLY = (
+    '{"clear": false, "questions": ['
+    '{"question": "Which auth method?", "options": ["JWT", "Session"], "context": "auth"}'
+    ']}'
+)
+_BAD_JSON_REPLY = "not valid json at all"
+
+
+def _llm_replying(content: str) -> AsyncMock:
+    llm = AsyncMock()
+    response = MagicMock()
+    response.content = content
+    llm.complete.return_value = response
+    return llm
+
+
+@pytest.fixture(scope="module")
+def llm_clear() -> AsyncMock:
+    return _llm_replying(_CLEAR_REPLY)
+
+
+@pytest.fixture(scope="module")
+def llm_questions() -> AsyncMock:
+    return _llm_replying(_QUESTIONS_REPLY)
+
+
+@pytest.fixture(scope="module")
+def llm_bad_json() -> AsyncMock:
+    return _llm_replying(_BAD_JSON_REPLY)
+
+
+@pytest.fixture(scope="module")
+def llm_error() -> AsyncMock:
+    llm = AsyncMock()
+    llm.complete.side_effect = RuntimeError("LLM unavailable")
+    return llm
 
 
 class TestClarificationNeeded:
@@ -44,57 +109,39 @@ class TestClarificationNeeded:
         assert exc.context == "ctx"
 
 
+_FULL_ENTRY = {
+    "question": "Q?",
+    "answer": "A",
+    "context": "ctx",
+    "agent": "coder",
+    "timestamp": "2026-01-01T00:00:00",
+}
+
+
 class TestClarificationEntry:
-    def test_to_dict(self):
-        entry = ClarificationEntry(
-            question="Q?",
-            answer="A",
-            context="ctx",
-            agent="coder",
-            timestamp="2026-01-01T00:00:00",
-        )
-        d = entry.to_dict()
-        assert d["question"] == "Q?"
-        assert d["answer"] == "A"
-        assert d["context"] == "ctx"
-        assert d["agent"] == "coder"
-        assert d["timestamp"] == "2026-01-01T00:00:00"
-
-    def test_from_dict(self):
-        entry = ClarificationEntry.from_dict({
-            "question": "Q?",
-            "answer": "A",
-            "context": "ctx",
-            "agent": "planner",
-            "timestamp": "2026-01-01",
-        })
-        assert entry.question == "Q?"
-        assert entry.answer == "A"
-        assert entry.agent == "planner"
-
-    def test_from_dict_defaults(self):
-        entry = ClarificationEntry.from_dict({
-            "question": "Q?",
-            "answer": "A",
-        })
-        assert entry.context == ""
-        assert entry.agent == ""
-        assert entry.timestamp == ""
-
-    def test_roundtrip(self):
-        original = ClarificationEntry(
-            question="Method?",
-            answer="JWT",
-            context="auth",
-            agent="architect",
-            timestamp="2026-02-01T12:00:00",
-        )
-        restored = ClarificationEntry.from_dict(original.to_dict())
-        assert restored.question == original.question
-        assert restored.answer == original.answer
-        assert restored.context == original.context
-        assert restored.agent == original.agent
-        assert restored.timestamp == original.timestamp
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            pytest.param(_FULL_ENTRY, _FULL_ENTRY, id="full"),
+            pytest.param(
+                {"question": "Q?", "answer": "A"},
+                {"question": "Q?", "answer": "A", "context": "", "agent": "", "timestamp": ""},
+                id="defaults",
+            ),
+            pytest.param(
+                {"question": "Method?", "answer": "JWT", "context": "auth",
+                 "agent": "architect", "timestamp": "2026-02-01T12:00:00"},
+                {"question": "Method?", "answer": "JWT", "context": "auth",
+                 "agent": "architect", "timestamp": "2026-02-01T12:00:00"},
+                id="architect",
+            ),
+        ],
+    )
+    def test_dict_roundtrip(self, data, expected):
+        entry = ClarificationEntry.from_dict(data)
+        assert entry.to_dict() == expected
+        assert ClarificationEntry.from_dict(entry.to_dict()) == entry
+        assert ClarificationEntry(**expected) == entry
 
     def test_frozen(self):
         entry = ClarificationEntry(
@@ -105,10 +152,7 @@ class TestClarificationEntry:
 
 
 class TestClarificationManager:
-    def test_save_and_find_decision(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
+    def test_save_and_find_decision(self, mgr):
         mgr.save_decision(
             question="Which auth method?",
             answer="JWT",
@@ -120,35 +164,24 @@ class TestClarificationManager:
         assert len(results) >= 1
         assert results[0].answer == "JWT"
 
-    def test_list_recent(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
+    def test_list_recent(self, mgr):
         mgr.save_decision(question="Q1?", answer="A1")
         mgr.save_decision(question="Q2?", answer="A2")
 
         recent = mgr.list_recent(10)
         assert len(recent) == 2
 
-    def test_build_context_string_empty(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
+    def test_build_context_string_empty(self, mgr):
         assert mgr.build_context_string() == ""
 
-    def test_build_context_string_with_decisions(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
+    def test_build_context_string_with_decisions(self, mgr):
         mgr.save_decision(question="Framework?", answer="FastAPI")
         ctx = mgr.build_context_string()
         assert "Past Decisions" in ctx
         assert "Framework?" in ctx
         assert "FastAPI" in ctx
 
-    def test_clear(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
+    def test_clear(self, mgr):
         mgr.save_decision(question="Q1?", answer="A1")
         mgr.save_decision(question="Q2?", answer="A2")
 
@@ -156,64 +189,31 @@ class TestClarificationManager:
         assert count == 2
         assert mgr.list_recent(10) == []
 
-    def test_clear_empty(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
+    def test_clear_empty(self, mgr):
         assert mgr.clear() == 0
 
-    @pytest.mark.asyncio
-    async def test_analyze_ambiguity_clear_request(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
 
-        mock_llm = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = '{"clear": true}'
-        mock_llm.complete.return_value = mock_response
+class TestAnalyzeAmbiguity:
+    # Share the session event loop instead of building one per test.
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-        result = await mgr.analyze_ambiguity("fix the typo in README", mock_llm)
+    async def test_analyze_ambiguity_clear_request(self, mgr, llm_clear):
+        result = await mgr.analyze_ambiguity("fix the typo in README", llm_clear)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_analyze_ambiguity_with_questions(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
-        mock_llm = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = (
-            '{"clear": false, "questions": ['
-            '{"question": "Which auth method?", "options": ["JWT", "Session"], "context": "auth"}'
-            ']}'
+    async def test_analyze_ambiguity_with_questions(self, mgr, llm_questions):
+        result = await mgr.analyze_ambiguity(
+            "add authentication to the application with user management", llm_questions
         )
-        mock_llm.complete.return_value = mock_response
-
-        result = await mgr.analyze_ambiguity("add authentication to the application with user management", mock_llm)
         assert result is not None
         assert len(result) == 1
         assert result[0].question == "Which auth method?"
         assert result[0].options == ["JWT", "Session"]
 
-    @pytest.mark.asyncio
-    async def test_analyze_ambiguity_parse_error(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
-        mock_llm = AsyncMock()
-        mock_response = MagicMock()
-        mock_response.content = "not valid json at all"
-        mock_llm.complete.return_value = mock_response
-
-        result = await mgr.analyze_ambiguity("something", mock_llm)
+    async def test_analyze_ambiguity_parse_error(self, mgr, llm_bad_json):
+        result = await mgr.analyze_ambiguity("something", llm_bad_json)
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_analyze_ambiguity_llm_error(self, tmp_path):
-        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
-        mgr = ClarificationManager(store)
-
-        mock_llm = AsyncMock()
-        mock_llm.complete.side_effect = RuntimeError("LLM unavailable")
-
-        result = await mgr.analyze_ambiguity("something", mock_llm)
+    async def test_analyze_ambiguity_llm_error(self, mgr, llm_error):
+        result = await mgr.analyze_ambiguity("something", llm_error)
         assert result is None
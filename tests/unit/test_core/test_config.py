@@ -1,5 +1,7 @@
 """Tests for the configuration system."""
 
+import copy
+
 import pytest
 from pathlib import Path
 
@@ -12,36 +14,33 @@ from lidco.core.config import (
     _deep_merge,
     _coerce_env_value,
     _apply_env_overrides,
-    load_config,
 )
 
 
 class TestDeepMerge:
-    def test_simple_merge(self):
-        base = {"a": 1, "b": 2}
-        override = {"b": 3, "c": 4}
-        result = _deep_merge(base, override)
-        assert result == {"a": 1, "b": 3, "c": 4}
-
-    def test_nested_merge(self):
-        base = {"llm": {"model": "openai/glm-4.7", "temp": 0.5}}
-        override = {"llm": {"temp": 0.1}}
-        result = _deep_merge(base, override)
-        assert result == {"llm": {"model": "openai/glm-4.7", "temp": 0.1}}
-
-    def test_empty_override(self):
-        base = {"a": 1}
-        result = _deep_merge(base, {})
-        assert result == {"a": 1}
-
-    def test_empty_base(self):
-        result = _deep_merge({}, {"a": 1})
-        assert result == {"a": 1}
-
-    def test_does_not_mutate_base(self):
-        base = {"a": {"x": 1}}
-        _deep_merge(base, {"a": {"y": 2}})
-        assert base == {"a": {"x": 1}}
+    @pytest.mark.parametrize(
+        "base,override,expected",
+        [
+            pytest.param(
+                {"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 1, "b": 3, "c": 4}, id="simple"
+            ),
+            pytest.param(
+                {"llm": {"model": "openai/glm-4.7", "temp": 0.5}},
+                {"llm": {"temp": 0.1}},
+                {"llm": {"model": "openai/glm-4.7", "temp": 0.1}},
+                id="nested",
+            ),
+            pytest.param({"a": 1}, {}, {"a": 1}, id="empty_override"),
+            pytest.param({}, {"a": 1}, {"a": 1}, id="empty_base"),
+            pytest.param(
+                {"a": {"x": 1}}, {"a": {"y": 2}}, {"a": {"x": 1, "y": 2}}, id="no_mutation"
+            ),
+        ],
+    )
+    def test_deep_merge(self, base, override, expected):
+        snapshot = copy.deepcopy(base)
+        assert _deep_merge(base, override) == expected
+        assert base == snapshot  # base is never mutated
 
 
 class TestLidcoConfig:
@@ -99,10 +98,9 @@ class TestLoadYamlConfig:
 
 
 class TestLoadConfig:
-    def test_loads_defaults(self):
-        config = load_config()
-        assert isinstance(config, LidcoConfig)
-        assert config.llm.default_model is not None
+    def test_loads_defaults(self, default_config):
+        assert isinstance(default_config, LidcoConfig)
+        assert default_config.llm.default_model is not None
 
 
 class TestCoerceEnvValue:
@@ -127,58 +125,57 @@ class TestCoerceEnvValue:
 
 
 class TestApplyEnvOverrides:
-    def test_override_llm_default_model(self, monkeypatch):
+    def test_override_llm_default_model(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_LLM_DEFAULT_MODEL", "openai/glm-4.7")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.llm.default_model == "openai/glm-4.7"
 
-    def test_override_llm_temperature(self, monkeypatch):
+    def test_override_llm_temperature(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_LLM_TEMPERATURE", "0.7")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.llm.temperature == pytest.approx(0.7)
 
-    def test_override_agents_auto_review_false(self, monkeypatch):
+    def test_override_agents_auto_review_false(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_AGENTS_AUTO_REVIEW", "false")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.agents.auto_review is False
 
-    def test_override_rag_enabled(self, monkeypatch):
+    def test_override_rag_enabled(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_RAG_ENABLED", "true")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.rag.enabled is True
 
-    def test_override_memory_max_entries(self, monkeypatch):
+    def test_override_memory_max_entries(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_MEMORY_MAX_ENTRIES", "100")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.memory.max_entries == 100
 
-    def test_override_cli_theme(self, monkeypatch):
+    def test_override_cli_theme(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_CLI_THEME", "dracula")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.cli.theme == "dracula"
 
-    def test_unknown_section_ignored(self, monkeypatch):
+    def test_unknown_section_ignored(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_NONEXISTENT_FIELD", "value")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert isinstance(config, LidcoConfig)  # no crash
 
-    def test_unknown_field_within_section_ignored(self, monkeypatch):
+    def test_unknown_field_within_section_ignored(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_LLM_TOTALLY_FAKE_FIELD", "x")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert isinstance(config, LidcoConfig)
 
-    def test_no_lidco_vars_returns_unchanged(self, monkeypatch):
+    def test_no_lidco_vars_returns_unchanged(self, monkeypatch, base_config):
         # Remove all LIDCO_ vars
         for key in list(__import__("os").environ):
             if key.startswith("LIDCO_"):
                 monkeypatch.delenv(key, raising=False)
-        original = LidcoConfig()
-        result = _apply_env_overrides(original)
-        assert result.llm.default_model == original.llm.default_model
+        result = _apply_env_overrides(base_config)
+        assert result.llm.default_model == base_config.llm.default_model
 
-    def test_multiple_sections_at_once(self, monkeypatch):
+    def test_multiple_sections_at_once(self, monkeypatch, base_config):
         monkeypatch.setenv("LIDCO_LLM_MAX_TOKENS", "8192")
         monkeypatch.setenv("LIDCO_AGENTS_MAX_ITERATIONS", "50")
-        config = _apply_env_overrides(LidcoConfig())
+        config = _apply_env_overrides(base_config)
         assert config.llm.max_tokens == 8192
         assert config.agents.max_iterations == 50
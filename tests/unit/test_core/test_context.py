@@ -45,6 +45,18 @@ class TestFormatDependencies:
         assert "^18.2.0" not in result
         assert "2 packages" in result
 
+    def test_large_dependency_sets_render_counts_only(self):
+        deps = ProjectDependencies(
+            production={f"pkg-{i}": "1.0" for i in range(500)},
+            development={f"dev-{i}": "2.0" for i in range(40)},
+        )
+        result = ProjectContext._format_dependencies(deps)
+        assert result == (
+            "## Dependencies\n\n"
+            "**Production:** 500 packages\n"
+            "**Development:** 40 packages"
+        )
+
 
 class TestFormatGitInfo:
     """Tests for compact git info formatting."""
@@ -1,12 +1,14 @@
 """Tests for conversation pruning."""
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from lidco.core.conversation_pruner import (
+    _find_keep_boundary,
     _has_existing_summary,
     _needs_summarization,
     _summarize_tool_message,
+    _summary_line,
     _trim_assistant_message,
     compress_tool_results,
     prune_conversation,
@@ -15,14 +17,17 @@ from lidco.core.conversation_pruner import (
 from lidco.llm.base import LLMResponse, Message
 
 
+_FILE_READ_FN = {"name": "file_read", "arguments": "{}"}
+
+
 def _make_exchange(step: int, tool_content: str = "") -> list[Message]:
     """Create an assistant + tool message pair."""
-    content = tool_content or f"Tool output for step {step}\n" * 50
+    content = tool_content or ("Tool output for step " + str(step) + "\n") * 50
     return [
         Message(
             role="assistant",
             content=f"I will do step {step}.",
-            tool_calls=[{"id": f"call_{step}", "type": "function", "function": {"name": "file_read", "arguments": "{}"}}],
+            tool_calls=[{"id": f"call_{step}", "type": "function", "function": _FILE_READ_FN}],
         ),
         Message(
             role="tool",
@@ -50,6 +55,14 @@ class TestPruneConversation:
         assert result[0].content == "System prompt"
         assert result[2].content == "Done!"
 
+    def test_exactly_at_budget_unchanged(self):
+        messages = [Message(role="system", content="S" * 60)]
+        for i in range(6):
+            messages.extend(_make_exchange(i, "x" * 100))
+        budget = sum(len(m.content) for m in messages)
+        assert prune_conversation(messages, max_chars=budget) == messages
+        assert prune_conversation(messages, max_chars=budget - 1) != messages
+
     def test_large_conversation_prunes_old_tool_results(self):
         messages = [
             Message(role="system", content="System prompt"),
@@ -84,6 +97,46 @@ class TestPruneConversation:
         assert result[0].content == "S" * 50_000
 
 
+class TestFindKeepBoundary:
+    @staticmethod
+    def _history(exchanges: int) -> list[Message]:
+        messages = [Message(role="system", content="S"), Message(role="user", content="U")]
+        for i in range(exchanges):
+            messages.extend(_make_exchange(i, "out"))
+        return messages
+
+    def test_long_history_keeps_recent_exchanges(self):
+        messages = self._history(500)
+        boundary = _find_keep_boundary(messages, keep_recent_exchanges=3)
+        assert boundary == len(messages) - 6
+        assert messages[boundary].role == "assistant"
+
+    def test_exactly_enough_exchanges(self):
+        # The oldest assistant (index 2) starts the kept tail
+        assert _find_keep_boundary(self._history(3), keep_recent_exchanges=3) == 2
+
+    def test_keep_one_exchange(self):
+        messages = self._history(4)
+        assert _find_keep_boundary(messages, keep_recent_exchanges=1) == len(messages) - 2
+
+    def test_trailing_user_message_is_kept(self):
+        messages = self._history(5)
+        messages.append(Message(role="user", content="next"))
+        assert _find_keep_boundary(messages, keep_recent_exchanges=2) == len(messages) - 5
+
+    def test_no_assistant_messages_keeps_everything(self):
+        messages = [Message(role="system", content="S"), Message(role="user", content="U")]
+        assert _find_keep_boundary(messages, keep_recent_exchanges=1) == 1
+
+    def test_system_prompt_only(self):
+        assert _find_keep_boundary([Message(role="system", content="S")], 3) == 1
+
+    def test_short_history_keeps_everything(self):
+        messages = [Message(role="system", content="S"), Message(role="user", content="U")]
+        messages.extend(_make_exchange(0, "out"))
+        assert _find_keep_boundary(messages, keep_recent_exchanges=3) == 1
+
+
 class TestSummarizeToolMessage:
     """Tests for tool message summarization."""
 
@@ -97,6 +150,42 @@ class TestSummarizeToolMessage:
         result = _summarize_tool_message(msg)
         assert "4 lines" in result.content
 
+    def test_repeat_summaries_reuse_cache(self):
+        content = "row\n" * 500
+        msg = Message(role="tool", content=content, tool_call_id="call_7", name="bash")
+        cache: dict = {}
+        with patch(
+            "lidco.core.conversation_pruner._summary_line", wraps=_summary_line,
+        ) as summarize:
+            first = _summarize_tool_message(msg, cache)
+            again = _summarize_tool_message(msg, cache)
+        assert again == first
+        assert first.content == _summarize_tool_message(msg).content
+        summarize.assert_called_once()
+
+    def test_cache_shared_across_prune_passes(self):
+        messages = [Message(role="system", content="S"), Message(role="user", content="U")]
+        for i in range(6):
+            messages.extend(_make_exchange(i))
+        cache: dict = {}
+        with patch(
+            "lidco.core.conversation_pruner._summary_line", wraps=_summary_line,
+        ) as summarize:
+            first = prune_conversation(messages, max_chars=5_000, summary_cache=cache)
+            calls = summarize.call_count
+            again = prune_conversation(messages, max_chars=5_000, summary_cache=cache)
+        assert again == first
+        assert calls == 3
+        assert summarize.call_count == calls
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [("a\nb\nc\nd\n", "4 lines"), ("single", "1 lines"), ("", "0 lines")],
+    )
+    def test_line_count_matches_splitlines(self, content, expected):
+        result = _summarize_tool_message(Message(role="tool", content=content, name="bash"))
+        assert expected in result.content
+
     def test_preserves_tool_call_id(self):
         msg = Message(role="tool", content="data", tool_call_id="call_42", name="bash")
         result = _summarize_tool_message(msg)
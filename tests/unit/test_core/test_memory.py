@@ -74,6 +74,15 @@ class TestMemoryStore:
         assert len(results) == 1
         assert results[0].key == "a"
 
+    def test_search_sees_updated_content(self, tmp_path):
+        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
+        store.add(key="db", content="Use SQLite")
+        assert [e.key for e in store.search("sqlite")] == ["db"]
+
+        store.add(key="db", content="Use Postgres")
+        assert store.search("sqlite") == []
+        assert [e.key for e in store.search("POSTGRES")] == ["db"]
+
     def test_list_all(self, tmp_path):
         store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
         store.add(key="k1", content="v1")
@@ -98,6 +107,18 @@ class TestMemoryStore:
         assert "tip1" in ctx
         assert "frozen dataclasses" in ctx
 
+    def test_build_context_string_tracks_mutations(self, tmp_path):
+        store = MemoryStore(global_dir=tmp_path / "memory", max_entries=100)
+        store.add(key="lang", content="Python")
+        first = store.build_context_string()
+        assert store.build_context_string() is first  # served from cache
+
+        store.add(key="style", content="black")
+        assert "black" in store.build_context_string()
+        store.remove("style")
+        assert "black" not in store.build_context_string()
+        assert store.build_context_string(max_lines=1) != first
+
     def test_max_entries_enforcement(self, tmp_path):
         store = MemoryStore(global_dir=tmp_path / "memory", max_entries=5)
         for i in range(10):
@@ -108,6 +129,102 @@ class TestMemoryStore:
         all_entries = store2.list_all()
         assert len(all_entries) <= 5
 
+    def test_add_appends_one_line(self, tmp_path):
+        mem_dir = tmp_path / "memory"
+        store = MemoryStore(global_dir=mem_dir, max_entries=100)
+        store.add(key="a", content="1", category="test")
+        store.add(key="a", content="2", category="test")
+        store.add(key="b", content="3", category="test")
+        assert len((mem_dir / "test.jsonl").read_text().splitlines()) == 3
+
+        # Reload keeps the last write per key without touching the log...
+        store2 = MemoryStore(global_dir=mem_dir, max_entries=100)
+        assert store2.get("a").content == "2"
+        assert len((mem_dir / "test.jsonl").read_text().splitlines()) == 3
+
+        # ...and the next save compacts it
+        store2.add(key="c", content="4", category="test")
+        assert len((mem_dir / "test.jsonl").read_text().splitlines()) == 3
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_log_roundtrip_unicode(self, tmp_path, monkeypatch, use_orjson):
+        import lidco.core.memory as memory_mod
+        if not use_orjson:
+            monkeypatch.setattr(memory_mod, "orjson", None)
+        elif memory_mod.orjson is None:
+            pytest.skip("orjson not installed")
+        mem_dir = tmp_path / "memory"
+        store = MemoryStore(global_dir=mem_dir, max_entries=100)
+        store.add(key="ru", content="Привет, мир", tags=["i18n"], category="test")
+        assert "Привет" in (mem_dir / "test.jsonl").read_text(encoding="utf-8")
+
+        store2 = MemoryStore(global_dir=mem_dir, max_entries=100)
+        entry = store2.get("ru")
+        assert entry.content == "Привет, мир"
+        assert entry.tags == ("i18n",)
+
+    def test_failed_vacuum_keeps_old_log(self, tmp_path, monkeypatch):
+        mem_dir = tmp_path / "memory"
+        store = MemoryStore(global_dir=mem_dir, max_entries=100)
+        store.add(key="a", content="1", category="test")
+        store.add(key="a", content="2", category="test")
+        before = (mem_dir / "test.jsonl").read_bytes()
+
+        def _fail(*_a, **_k):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("lidco.core.memory.os.replace", _fail)
+        store2 = MemoryStore(global_dir=mem_dir, max_entries=100)
+        store2.add(key="b", content="3", category="test")
+        assert store2.get("a").content == "2"
+        after = (mem_dir / "test.jsonl").read_bytes()
+        assert after.startswith(before)
+        assert len(after.splitlines()) == 3
+        assert sorted(p.name for p in mem_dir.iterdir()) == ["test.jsonl"]
+
+    def test_legacy_json_still_loaded(self, tmp_path):
+        import json
+        mem_dir = tmp_path / "memory"
+        mem_dir.mkdir()
+        (mem_dir / "test.json").write_text(json.dumps([
+            {"key": "old", "content": "from json", "category": "test"},
+        ]))
+        store = MemoryStore(global_dir=mem_dir, max_entries=100)
+        assert store.get("old").content == "from json"
+
+        # A logged update overrides the legacy snapshot on the next load
+        store.add(key="old", content="from jsonl", category="test")
+        store2 = MemoryStore(global_dir=mem_dir, max_entries=100)
+        assert store2.get("old").content == "from jsonl"
+
+    def test_first_save_migrates_legacy_json(self, tmp_path):
+        import json
+        mem_dir = tmp_path / "memory"
+        mem_dir.mkdir()
+        (mem_dir / "test.json").write_text(json.dumps([
+            {"key": f"old{i}", "content": "from json", "category": "test"} for i in range(4)
+        ]))
+        store = MemoryStore(global_dir=mem_dir, max_entries=3)
+        store.add(key="new", content="from jsonl", category="test")
+
+        assert not (mem_dir / "test.json").exists()
+        # Legacy entries count toward the cap, and the new save is newest
+        store2 = MemoryStore(global_dir=mem_dir, max_entries=3)
+        assert [e.key for e in store2.list_all()] == ["old2", "old3", "new"]
+        assert len((mem_dir / "test.jsonl").read_text().splitlines()) == 3
+        # No timestamp is invented for legacy entries, so they still never expire
+        assert store2.get("old3").created_at == ""
+
+    def test_vacuum_counts_lines_of_log_created_after_init(self, tmp_path):
+        mem_dir = tmp_path / "memory"
+        store = MemoryStore(global_dir=mem_dir, max_entries=2)
+        writer = MemoryStore(global_dir=mem_dir, max_entries=100)
+        for i in range(4):
+            writer.add(key="k", content=str(i), category="test")
+
+        store.add(key="k", content="last", category="test")
+        assert (mem_dir / "test.jsonl").read_text().count("\n") == 1
+
     def test_memory_md_loaded(self, tmp_path):
         mem_dir = tmp_path / "memory"
         mem_dir.mkdir()
@@ -189,6 +306,21 @@ class TestMemoryTTL:
         assert "live_value" in ctx
         assert "old_value" not in ctx
 
+    def test_cached_context_drops_entry_once_it_expires(self, tmp_path, monkeypatch):
+        store = MemoryStore(global_dir=tmp_path / "m", ttl_days=7)
+        store._entries["edge"] = MemoryEntry(
+            key="edge", content="about_to_expire", created_at=self._old_iso(6),
+        )
+        assert "about_to_expire" in store.build_context_string()
+
+        class _TwoDaysLater(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.now(tz) + timedelta(days=2)
+
+        monkeypatch.setattr("lidco.core.memory.datetime", _TwoDaysLater)
+        assert "about_to_expire" not in store.build_context_string()
+
     def test_prune_expired_removes_from_dict(self, tmp_path):
         store = MemoryStore(global_dir=tmp_path / "m", ttl_days=7)
         store._entries["old"] = MemoryEntry(
@@ -203,6 +335,16 @@ class TestMemoryTTL:
         assert "old" not in store._entries
         assert "new" in store._entries
 
+    def test_prune_expired_drops_search_cache(self, tmp_path):
+        store = MemoryStore(global_dir=tmp_path / "m", ttl_days=7)
+        store._entries["old"] = MemoryEntry(
+            key="old", content="v", created_at=self._old_iso(10)
+        )
+        store.search("v")
+        assert "old" in store._lowered
+        store.prune_expired()
+        assert "old" not in store._lowered
+
     def test_prune_expired_returns_zero_when_nothing_expired(self, tmp_path):
         store = MemoryStore(global_dir=tmp_path / "m", ttl_days=30)
         store._entries["fresh"] = MemoryEntry(
@@ -216,26 +358,24 @@ class TestMemoryTTL:
         store = MemoryStore(global_dir=mem_dir, ttl_days=7)
         # Add a fresh entry via the public API (writes to disk)
         store.add(key="keeper", content="keep me", category="test")
-        # Manually inject an expired entry into the JSON file
+        # Manually inject an expired entry into the JSONL log
         import json
-        cat_file = mem_dir / "test.json"
-        data = json.loads(cat_file.read_text())
-        data.append({
-            "key": "expired_one",
-            "content": "delete me",
-            "category": "test",
-            "tags": [],
-            "created_at": self._old_iso(10),
-            "source": "",
-        })
-        cat_file.write_text(json.dumps(data))
-        # Writing a new entry triggers pruning on save
-        store._entries["expired_one"] = MemoryEntry(
-            key="expired_one", content="delete me",
-            created_at=self._old_iso(10), category="test",
-        )
-        store.add(key="another", content="another", category="test")
+        cat_file = mem_dir / "test.jsonl"
+        with cat_file.open("a") as fh:
+            fh.write(json.dumps({
+                "key": "expired_one",
+                "content": "delete me",
+                "category": "test",
+                "tags": [],
+                "created_at": self._old_iso(10),
+                "source": "",
+            }) + "\n")
         # Reload from disk — expired entry must be gone
         store2 = MemoryStore(global_dir=mem_dir, ttl_days=7)
         assert store2.get("expired_one") is None
         assert store2.get("keeper") is not None
+        assert "expired_one" in cat_file.read_text()  # loading never rewrites
+        # The next save vacuums it out of the log file itself
+        store2.add(key="another", content="another", category="test")
+        assert "expired_one" not in cat_file.read_text()
+        assert "keeper" in cat_file.read_text()
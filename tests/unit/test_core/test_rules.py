@@ -53,6 +53,12 @@ class TestInitRules:
         content = mgr.rules_file.read_text(encoding="utf-8")
         assert "MyApp" in content
 
+    def test_project_name_inserted_verbatim(self, tmp_path):
+        mgr = RulesManager(tmp_path)
+        mgr.init_rules(project_name="{weird} name")
+        content = mgr.rules_file.read_text(encoding="utf-8")
+        assert content == _DEFAULT_RULES_TEMPLATE.replace("{project_name}", "{weird} name")
+
     def test_creates_rules_directory(self, tmp_path):
         mgr = RulesManager(tmp_path)
         mgr.init_rules()
@@ -194,6 +200,24 @@ class TestListRules:
         titles = [r.title for r in rules]
         assert "Custom Rule" in titles
 
+    def test_reparses_after_file_changes(self, tmp_path):
+        mgr = RulesManager(tmp_path)
+        mgr.init_rules()
+        before = mgr.list_rules()
+        mgr.add_rule("Late Rule", "Added after the first listing")
+        after = mgr.list_rules()
+        assert len(after) == len(before) + 1
+        assert after[-1].title == "Late Rule"
+
+    def test_unchanged_file_is_not_reread(self, tmp_path, monkeypatch):
+        mgr = RulesManager(tmp_path)
+        mgr.init_rules()
+        first = mgr.list_rules()
+        monkeypatch.setattr(
+            Path, "read_text", lambda *a, **k: pytest.fail("LIDCO.md was re-read")
+        )
+        assert mgr.list_rules() == first
+
     def test_rule_content_is_stripped(self, tmp_path):
         mgr = RulesManager(tmp_path)
         mgr.init_rules()
@@ -248,6 +272,19 @@ class TestListRuleFiles:
         assert len(files) == 1
         assert files[0].name == "rule.md"
 
+    def test_rescans_after_directory_changes(self, tmp_path):
+        mgr = RulesManager(tmp_path)
+        mgr.add_rule_file("alpha", "a")
+        assert [f.name for f in mgr.list_rule_files()] == ["alpha.md"]
+
+        mgr.add_rule_file("beta", "b")
+        assert [f.name for f in mgr.list_rule_files()] == ["alpha.md", "beta.md"]
+
+    def test_empty_when_rules_path_is_a_file(self, tmp_path):
+        (tmp_path / ".lidco").mkdir()
+        (tmp_path / ".lidco" / "rules").write_text("not a directory")
+        assert RulesManager(tmp_path).list_rule_files() == []
+
 
 class TestGetAllRulesText:
     """Tests for combined rules text output."""
@@ -277,6 +314,17 @@ class TestGetAllRulesText:
         text = mgr.get_all_rules_text()
         assert "\n---\n" in text
 
+    def test_exact_layout(self, tmp_path):
+        (tmp_path / "LIDCO.md").write_text("MAIN", encoding="utf-8")
+        mgr = RulesManager(tmp_path)
+        mgr.add_rule_file("b", "two")
+        mgr.add_rule_file("a", "one")
+        assert mgr.get_all_rules_text() == (
+            "MAIN\n"
+            "\n---\n\n# a\n\none\n\n"
+            "\n---\n\n# b\n\ntwo\n"
+        )
+
     def test_only_rule_files_without_lidco_md(self, tmp_path):
         mgr = RulesManager(tmp_path)
         mgr.add_rule_file("standalone", "Standalone rule")
@@ -0,0 +1,42 @@
+"""Tests for Session teardown."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from lidco.core.session import Session
+from lidco.tools.registry import ToolRegistry
+
+
+def _bare_session(*tools: object) -> Session:
+    session = object.__new__(Session)
+    session._index_watcher = None
+    session._config_reloader = None
+    session._error_ledger = MagicMock()
+    session.tool_registry = ToolRegistry()
+    for tool in tools:
+        session.tool_registry.register(tool)  # type: ignore[arg-type]
+    return session
+
+
+class TestSessionAclose:
+    async def test_closes_tools_with_aclose(self):
+        pooled = SimpleNamespace(name="web_fetch", aclose=AsyncMock())
+        plain = SimpleNamespace(name="glob")
+        session = _bare_session(pooled, plain)
+
+        await session.aclose()
+
+        pooled.aclose.assert_awaited_once()
+        session._error_ledger.close.assert_called_once()
+
+    async def test_failing_tool_does_not_stop_teardown(self):
+        broken = SimpleNamespace(name="broken", aclose=AsyncMock(side_effect=OSError("boom")))
+        pooled = SimpleNamespace(name="web_fetch", aclose=AsyncMock())
+        session = _bare_session(broken, pooled)
+
+        await session.aclose()
+
+        pooled.aclose.assert_awaited_once()
+        session._error_ledger.close.assert_called_once()
@@ -58,6 +58,41 @@ class TestTokenBudget:
         assert len(warnings) == 1
         assert "exhausted" in warnings[0].lower()
 
+    def test_warning_follows_limit_changed_mid_session(self):
+        # /budget can raise or lower session_limit on a live budget
+        warnings: list[str] = []
+        budget = TokenBudget(session_limit=1000)
+        budget.set_warning_callback(lambda msg: warnings.append(msg))
+
+        budget.record(100)
+        assert warnings == []
+
+        budget.session_limit = 120
+        budget.record(1)  # 101/120 = 84%
+        assert len(warnings) == 1
+        assert "84%" in warnings[0]
+
+    def test_threshold_boundary_is_inclusive(self):
+        warnings: list[str] = []
+        budget = TokenBudget(session_limit=100, warning_threshold=0.7)
+        budget.set_warning_callback(lambda msg: warnings.append(msg))
+
+        budget.record(69)
+        assert warnings == []
+        budget.record(1)  # exactly 70%
+        assert len(warnings) == 1
+
+    def test_warns_on_every_record_past_threshold(self):
+        warnings: list[str] = []
+        budget = TokenBudget(session_limit=100, warning_threshold=0.8)
+        budget.set_warning_callback(lambda msg: warnings.append(msg))
+
+        budget.record(85)
+        budget.record(5)
+        budget.record(10)  # 100% - exhausted
+        assert len(warnings) == 3
+        assert "exhausted" in warnings[2].lower()
+
     def test_no_warning_when_unlimited(self):
         warnings: list[str] = []
         budget = TokenBudget(session_limit=0)
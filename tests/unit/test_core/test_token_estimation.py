@@ -1,5 +1,10 @@
 """Tests for token estimation module."""
 
+import gc
+
+import pytest
+
+from lidco.core import token_estimation
 from lidco.core.token_estimation import (
     estimate_conversation_tokens,
     estimate_message_tokens,
@@ -62,6 +67,46 @@ class TestEstimateMessageTokens:
         # Should include tool_calls JSON overhead
         assert tokens > 10
 
+    def test_tool_calls_measured_compact(self):
+        tool_calls = [{"id": "c", "type": "function", "function": {"name": "n" * 35}}]
+        compact = '[{"id":"c","type":"function","function":{"name":"%s"}}]' % ("n" * 35)
+        msg = Message(role="assistant", content="", tool_calls=tool_calls)
+        assert len(compact) == 88
+        assert estimate_message_tokens(msg) == 4 + 88 // 4
+
+    def test_parts_rounded_separately(self):
+        # 5-char content and 5-char name each round down to one token
+        msg = Message(role="tool", content="x" * 5, name="y" * 5)
+        assert estimate_message_tokens(msg) == 4 + 1 + 1
+
+
+class TestToolCallCache:
+    """Messages with tool_calls reuse their estimate until collected."""
+
+    def _msg(self) -> Message:
+        return Message(
+            role="assistant",
+            content="",
+            tool_calls=[{"id": "c", "type": "function", "function": {"name": "x" * 400}}],
+        )
+
+    def test_repeat_estimate_served_from_cache(self, monkeypatch):
+        msg = self._msg()
+        first = estimate_message_tokens(msg)
+        monkeypatch.setattr(
+            token_estimation, "_count_message_tokens", lambda m: pytest.fail("recounted")
+        )
+        assert estimate_message_tokens(msg) == first
+
+    def test_entry_dropped_when_message_collected(self):
+        msg = self._msg()
+        estimate_message_tokens(msg)
+        key = id(msg)
+        assert key in token_estimation._tool_call_cache
+        del msg
+        gc.collect()
+        assert key not in token_estimation._tool_call_cache
+
 
 class TestEstimateConversationTokens:
     """Tests for full conversation estimation."""
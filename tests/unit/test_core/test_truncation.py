@@ -16,6 +16,17 @@ class TestTruncateToolResult:
         result = truncate_tool_result("file_read", output, max_chars=12000)
         assert result == output
 
+    def test_short_output_is_returned_as_is(self):
+        output = "line\n" * 200
+        for tool in ("file_read", "grep", "glob", "bash", "git", "unknown_tool"):
+            assert truncate_tool_result(tool, output, max_chars=len(output)) is output
+
+    def test_fewer_chars_than_line_budget_unchanged(self):
+        # Over max_chars, but too short to hold more lines than the strategy keeps.
+        output = "a\nb\nc\nd"
+        assert truncate_tool_result("file_read", output, max_chars=2) == output
+        assert truncate_tool_result("grep", output, max_chars=2) == output
+
     def test_custom_max_chars(self):
         output = "x" * 200
         result = truncate_tool_result("unknown_tool", output, max_chars=50)
@@ -37,6 +48,13 @@ class TestFileReadTruncation:
         assert "line 480" in result
         assert "400 lines omitted" in result
 
+    def test_large_file_layout(self):
+        output = "\n".join(f"line {i}" for i in range(500))
+        result = truncate_tool_result("file_read", output, max_chars=100)
+        head, tail = result.split("\n\n... (400 lines omitted) ...\n\n")
+        assert head.splitlines() == [f"line {i}" for i in range(80)]
+        assert tail.splitlines() == [f"line {i}" for i in range(480, 500)]
+
     def test_file_within_head_tail_range(self):
         lines = [f"line {i}" for i in range(95)]
         output = "\n".join(lines)
@@ -63,6 +81,11 @@ class TestSearchTruncation:
         assert "file29" in result
         assert "70 more matches" in result
 
+    def test_grep_truncation_layout(self):
+        lines = [f"src/file{i}.py:10: match" for i in range(100)]
+        result = truncate_tool_result("grep", "\n".join(lines), max_chars=100)
+        assert result == "\n".join(lines[:30]) + "\n\n... (70 more matches) ..."
+
     def test_glob_truncates_many_results(self):
         lines = [f"src/file{i}.py" for i in range(60)]
         output = "\n".join(lines)
@@ -91,6 +114,14 @@ class TestBashTruncation:
         assert "output line 299" in result
         assert "180 lines omitted" in result
 
+    def test_carriage_return_progress_output_truncated(self):
+        # Progress bars redraw with bare \r; those count as lines too, even
+        # though the output contains almost no \n characters.
+        output = "\r".join(f"progress {i}%" for i in range(300)) + "\ndone"
+        result = truncate_tool_result("bash", output, max_chars=100)
+        assert "181 lines omitted" in result
+        assert result.endswith("done")
+
 
 class TestGitTruncation:
     """Tests for git output truncation strategy."""
@@ -121,3 +152,8 @@ class TestPlainTruncation:
         assert result.startswith("a" * 12000)
         assert "truncated" in result
         assert "8000 chars omitted" in result
+
+    def test_plain_truncation_layout(self):
+        output = "ab" * 100
+        result = truncate_tool_result("unknown_tool", output, max_chars=7)
+        assert result == "abababa\n\n... (truncated, 193 chars omitted) ..."
@@ -0,0 +1,170 @@
+"""Shared fixtures for project index tests.
+
+Session-scoped fixtures are built once per pytest-xdist worker; every test
+still gets its own ``tmp_path`` copy, so the modules run safely with ``-n auto``.
+"""
+from __future__ import annotations
+
+import shutil
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from lidco.index.db import IndexDatabase
+from lidco.index.project_indexer import ProjectIndexer
+from lidco.index.schema import FileRecord, SymbolRecord
+
+
+@pytest.fixture(scope="session")
+def _index_db_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty, fully migrated index database built once per session."""
+    path = tmp_path_factory.mktemp("index_template") / "index.db"
+    # Closing the only connection checkpoints the WAL into the main file,
+    # so the single file below is a complete copy of the schema.
+    with IndexDatabase(path):
+        pass
+    return path
+
+
+@pytest.fixture(scope="session")
+def new_index_db(_index_db_template: Path) -> Callable[[Path], IndexDatabase]:
+    """Factory: ``new_index_db(path)`` opens a fresh index copied from the template.
+
+    Copying skips the per-database schema DDL; reopening only checks the
+    version.  IndexDatabase commits after every write, so the test connection
+    also skips the fsync each of those commits would otherwise wait on.
+    """
+
+    def _new(path: Path) -> IndexDatabase:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(_index_db_template, path)
+        return IndexDatabase(path, synchronous="OFF")
+
+    return _new
+
+
+@pytest.fixture()
+def db(tmp_path: Path, new_index_db: Callable[[Path], IndexDatabase]) -> IndexDatabase:
+    """A private, empty index at ``tmp_path/.lidco/index.db``."""
+    return new_index_db(tmp_path / ".lidco" / "index.db")
+
+
+# Canonical small project indexed once per session; relative path -> source.
+_PROJECT_FILES = {
+    "src/main.py": "def main(): pass\n",
+    "src/utils.py": "def helper(): pass\nHELPER_CONST = 1\n",
+    "src/auth.py": "def login(user): pass\ndef logout(): pass\n",
+    "src/models.py": "class User: pass\n",
+    "tests/test_main.py": "def test_ok(): pass\n",
+    "tests/test_auth.py": "def test_login(): pass\n",
+}
+
+
+@pytest.fixture(scope="session")
+def indexed_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project dir with ``_PROJECT_FILES`` and a full index at ``.lidco/project_index.db``.
+
+    Shared by the whole session: tests must only read from it.  Use
+    ``indexed_db`` for a private, writable copy of the index.
+    """
+    project_dir = tmp_path_factory.mktemp("indexed_project")
+    for rel, source in _PROJECT_FILES.items():
+        path = project_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source, encoding="utf-8")
+    with IndexDatabase(project_dir / ".lidco" / "project_index.db") as database:
+        ProjectIndexer(project_dir=project_dir, db=database).run_full_index()
+    return project_dir
+
+
+@pytest.fixture()
+def indexed_db(tmp_path: Path, indexed_project: Path) -> IndexDatabase:
+    """A private copy of the session's indexed project database."""
+    path = tmp_path / ".lidco" / "index.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(indexed_project / ".lidco" / "project_index.db", path)
+    return IndexDatabase(path)
+
+
+@pytest.fixture(scope="session")
+def empty_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A project dir with no index, shared by the session.  Read-only."""
+    return tmp_path_factory.mktemp("empty_project")
+
+
+# ── Row seeding helpers ───────────────────────────────────────────────────────
+# Exposed as fixtures because test modules here cannot import from conftest.
+
+# Fixed timestamp for seeded rows; no assertion depends on the wall clock.
+_NOW = time.time()
+
+_SYMBOL_DEFAULTS: dict[str, Any] = {"kind": "function", "line_start": 1, "is_exported": True}
+
+
+def _insert_file(
+    db: IndexDatabase,
+    path: str,
+    role: str = "utility",
+    language: str = "python",
+    lines: int = 10,
+) -> int:
+    rec = FileRecord(
+        path=path,
+        language=language,
+        role=role,
+        size_bytes=100,
+        mtime=_NOW,
+        lines_count=lines,
+        indexed_at=_NOW,
+    )
+    return db.upsert_file(rec)
+
+
+def _insert_symbols(db: IndexDatabase, file_id: int, *specs: dict[str, Any]) -> None:
+    """Insert several symbols for one file with a single ``insert_symbols`` call."""
+    db.insert_symbols([
+        SymbolRecord(file_id=file_id, **{**_SYMBOL_DEFAULTS, **spec}) for spec in specs
+    ])
+
+
+def _insert_symbol(
+    db: IndexDatabase,
+    file_id: int,
+    name: str,
+    kind: str = "function",
+    line_start: int = 1,
+    is_exported: bool = True,
+    parent_name: str = "",
+) -> None:
+    _insert_symbols(
+        db,
+        file_id,
+        dict(
+            name=name,
+            kind=kind,
+            line_start=line_start,
+            is_exported=is_exported,
+            parent_name=parent_name,
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def insert_file() -> Callable[..., int]:
+    """``insert_file(db, path, role=..., language=..., lines=...)`` -> file id."""
+    return _insert_file
+
+
+@pytest.fixture(scope="session")
+def insert_symbol() -> Callable[..., None]:
+    """``insert_symbol(db, file_id, name, kind=..., line_start=..., ...)``."""
+    return _insert_symbol
+
+
+@pytest.fixture(scope="session")
+def insert_symbols() -> Callable[..., None]:
+    """``insert_symbols(db, file_id, *specs)`` with one ``dict`` of fields per symbol."""
+    return _insert_symbols
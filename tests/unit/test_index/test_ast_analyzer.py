@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 from pathlib import Path
 
 import pytest
@@ -55,6 +57,39 @@ class TestPythonSymbols:
         assert names == {"save", "delete"}
         assert all(m.parent_name == "Repo" for m in methods)
 
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_line_endings(self, analyzer: AstAnalyzer, tmp_path: Path, newline: str) -> None:
+        f = tmp_path / "mod.py"
+        f.write_bytes(newline.join(["import os", "", "def fn(): pass", ""]).encode())
+        symbols, imports = analyzer.analyze(f, file_id=1)
+        assert [(s.name, s.line_start) for s in symbols] == [("fn", 3)]
+        assert [i.imported_module for i in imports] == ["os"]
+
+    def test_invalid_utf8_replaced(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        f = tmp_path / "mod.py"
+        f.write_bytes(b"# caf\xe9\ndef fn(): pass\n")
+        symbols, _ = analyzer.analyze(f, file_id=1)
+        assert [s.name for s in symbols] == ["fn"]
+
+    def test_nested_definitions_ignored(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        src = (
+            "def outer():\n"
+            "    def inner(): pass\n"
+            "    import json\n"
+            "class Repo:\n"
+            "    class Meta: pass\n"
+            "    def save(self):\n"
+            "        def _cb(): pass\n"
+        )
+        f = _py(tmp_path, "repo.py", src)
+        symbols, imports = analyzer.analyze(f, file_id=2)
+        assert [(s.name, s.kind) for s in symbols] == [
+            ("outer", "function"),
+            ("Repo", "class"),
+            ("save", "method"),
+        ]
+        assert imports == []
+
     def test_private_not_exported(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
         f = _py(tmp_path, "foo.py", "def _helper(): pass\nclass _Internal: pass\n")
         symbols, _ = analyzer.analyze(f, file_id=1)
@@ -94,6 +129,20 @@ class TestPythonSymbols:
         assert symbols == []
         assert imports == []
 
+    @pytest.mark.parametrize("source", ["", "\n", " \t\n\r\n"])
+    def test_blank_file_skips_parser(
+        self,
+        analyzer: AstAnalyzer,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        source: str,
+    ) -> None:
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("blank file was parsed")
+
+        monkeypatch.setattr(analyzer, "_analyze_python", _fail)
+        assert analyzer.analyze(_py(tmp_path, "__init__.py", source)) == ([], [])
+
 
 # ── Python: imports ───────────────────────────────────────────────────────────
 
@@ -127,6 +176,28 @@ class TestPythonImports:
         assert all(s.file_id == 42 for s in symbols)
         assert all(i.from_file_id == 42 for i in imports)
 
+    def test_import_like_text_not_reported(
+        self, analyzer: AstAnalyzer, tmp_path: Path
+    ) -> None:
+        src = (
+            '"""Usage:\n'
+            "\n"
+            "import fake_module\n"
+            "from fake_pkg import thing\n"
+            '"""\n'
+            "from typing import (\n"
+            "    Any,\n"
+            ")\n"
+            "import os, sys\n"
+        )
+        f = _py(tmp_path, "foo.py", src)
+        _, imports = analyzer.analyze(f, file_id=1)
+        assert [(i.imported_module, i.import_kind) for i in imports] == [
+            ("typing", "from"),
+            ("os", "module"),
+            ("sys", "module"),
+        ]
+
 
 # ── JS/TS: symbols ────────────────────────────────────────────────────────────
 
@@ -224,6 +295,23 @@ class TestJsTsImports:
         _, imports = analyzer.analyze(f, file_id=1)
         assert any("session" in i.imported_module for i in imports)
 
+    def test_require_preferred_over_earlier_dynamic_import(
+        self, analyzer: AstAnalyzer, tmp_path: Path
+    ) -> None:
+        src = "await import('lazy'); const fs = require('fs');\n"
+        f = _ts(tmp_path, "app.js", src)
+        _, imports = analyzer.analyze(f, file_id=1)
+        assert [(i.imported_module, i.import_kind) for i in imports] == [("fs", "require")]
+
+    def test_one_import_per_line(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        src = "import './polyfills';\nconst mod = import('./lazy');\n"
+        f = _ts(tmp_path, "app.ts", src)
+        _, imports = analyzer.analyze(f, file_id=1)
+        assert [(i.imported_module, i.import_kind) for i in imports] == [
+            ("./polyfills", "module"),
+            ("./lazy", "dynamic"),
+        ]
+
 
 # ── File role detection ───────────────────────────────────────────────────────
 
@@ -349,3 +437,55 @@ def create_handler() -> BaseHandler:
         # Private method should not be exported
         internal = next(s for s in symbols if s.name == "_internal")
         assert internal.is_exported is False
+
+
+# ── Result cache ──────────────────────────────────────────────────────────────
+
+
+class TestAnalyzeCache:
+    def test_unchanged_file_not_reparsed(
+        self, analyzer: AstAnalyzer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        f = _py(tmp_path, "mod.py", "def foo(): pass\nimport os\n")
+        first = analyzer.analyze(f, file_id=1)
+
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("cached file was parsed again")
+
+        monkeypatch.setattr(analyzer, "_analyze_python", _fail)
+        assert analyzer.analyze(f, file_id=1) == first
+
+    def test_cache_hit_restamps_file_id(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        f = _py(tmp_path, "mod.py", "def foo(): pass\nimport os\n")
+        analyzer.analyze(f, file_id=1)
+        symbols, imports = analyzer.analyze(f, file_id=9)
+        assert [s.file_id for s in symbols] == [9]
+        assert [i.from_file_id for i in imports] == [9]
+
+    def test_modified_file_reanalyzed(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        f = _py(tmp_path, "mod.py", "def foo(): pass\n")
+        analyzer.analyze(f, file_id=1)
+        f.write_text("def bar(): pass\n", encoding="utf-8")
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        symbols, _ = analyzer.analyze(f, file_id=1)
+        assert [s.name for s in symbols] == ["bar"]
+
+    def test_returned_lists_are_private(self, analyzer: AstAnalyzer, tmp_path: Path) -> None:
+        f = _py(tmp_path, "mod.py", "def foo(): pass\n")
+        symbols, _ = analyzer.analyze(f, file_id=1)
+        symbols.clear()
+        assert len(analyzer.analyze(f, file_id=1)[0]) == 1
+
+    def test_construction_compiles_nothing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def _fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("pattern compiled per instance")
+
+        monkeypatch.setattr(re, "compile", _fail)
+        AstAnalyzer()
+
+    def test_lru_bound(self, tmp_path: Path) -> None:
+        analyzer = AstAnalyzer(cache_size=2)
+        for name in ("a.py", "b.py", "c.py"):
+            analyzer.analyze(_py(tmp_path, name, "X = 1\n"))
+        assert len(analyzer._cache) == 2
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import threading
-import time
 from pathlib import Path
 
 import pytest
@@ -18,12 +17,10 @@ from lidco.index.schema import (
 )
 
 
-# ── Fixtures ──────────────────────────────────────────────────────────────────
+# ── Helpers ───────────────────────────────────────────────────────────────────
 
-
-@pytest.fixture()
-def db(tmp_path: Path) -> IndexDatabase:
-    return IndexDatabase(tmp_path / ".lidco" / "project_index.db")
+# No test inspects indexed_at, so one fixed timestamp serves every record.
+_NOW = 1_700_000_000.0
 
 
 def _file(path: str = "src/foo.py", role: str = "utility", mtime: float = 1_000.0) -> FileRecord:
@@ -34,7 +31,7 @@ def _file(path: str = "src/foo.py", role: str = "utility", mtime: float = 1_000.
         size_bytes=100,
         mtime=mtime,
         lines_count=20,
-        indexed_at=time.time(),
+        indexed_at=_NOW,
     )
 
 
@@ -68,6 +65,34 @@ class TestSchemaAndLifecycle:
         db._apply_schema()  # second application
         db.close()
 
+    def test_synchronous_applies_to_every_connection(self, tmp_path: Path) -> None:
+        with IndexDatabase(tmp_path / "index.db", synchronous="off") as db:
+            modes = [db._conn.execute("PRAGMA synchronous").fetchone()[0]]
+            worker = threading.Thread(
+                target=lambda: modes.append(db._conn.execute("PRAGMA synchronous").fetchone()[0])
+            )
+            worker.start()
+            worker.join()
+        assert modes == [0, 0]
+
+    def test_unknown_synchronous_mode_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="synchronous"):
+            IndexDatabase(tmp_path / "index.db", synchronous="OFF; DROP TABLE files")
+
+    @pytest.mark.parametrize(
+        "query,index",
+        [
+            ("SELECT * FROM files WHERE role = 'test'", "idx_files_role"),
+            ("SELECT * FROM files WHERE language = 'python'", "idx_files_lang"),
+            ("SELECT id FROM symbols WHERE file_id = 1", "idx_symbols_file"),
+            ("SELECT id FROM imports WHERE from_file_id = 1", "idx_imports_from"),
+        ],
+    )
+    def test_lookups_use_index(self, db: IndexDatabase, query: str, index: str) -> None:
+        # The FK-side indexes also keep ON DELETE CASCADE from scanning the child tables.
+        plan = " ".join(row[3] for row in db._conn.execute(f"EXPLAIN QUERY PLAN {query}"))
+        assert index in plan
+
     def test_empty_stats(self, db: IndexDatabase) -> None:
         stats = db.get_stats()
         assert stats.total_files == 0
@@ -111,19 +136,36 @@ class TestFiles:
         assert db.get_file_by_path("src/del.py") is None
 
     def test_list_file_mtimes(self, db: IndexDatabase) -> None:
-        db.upsert_file(_file("a.py", mtime=1.0))
-        db.upsert_file(_file("b.py", mtime=2.0))
+        db.upsert_files([_file("a.py", mtime=1.0), _file("b.py", mtime=2.0)])
         mtimes = db.list_file_mtimes()
         assert mtimes == {"a.py": 1.0, "b.py": 2.0}
 
     def test_query_files_by_role(self, db: IndexDatabase) -> None:
-        db.upsert_file(_file("main.py", role="entrypoint"))
-        db.upsert_file(_file("util.py", role="utility"))
-        db.upsert_file(_file("app.py", role="entrypoint"))
+        db.upsert_files([
+            _file("main.py", role="entrypoint"),
+            _file("util.py", role="utility"),
+            _file("app.py", role="entrypoint"),
+        ])
         entrypoints = db.query_files_by_role("entrypoint")
         assert len(entrypoints) == 2
         assert all(r.role == "entrypoint" for r in entrypoints)
 
+    def test_upsert_files_returns_ids_in_order(self, db: IndexDatabase) -> None:
+        existing = db.upsert_file(_file("b.py"))
+        ids = db.upsert_files([_file("a.py"), _file("b.py", role="config"), _file("c.py")])
+        assert ids[1] == existing
+        assert ids == [db.get_file_id(p) for p in ("a.py", "b.py", "c.py")]
+        assert db.get_file_by_path("b.py").role == "config"
+
+    def test_upsert_files_empty(self, db: IndexDatabase) -> None:
+        assert db.upsert_files([]) == []
+
+    def test_upsert_files_more_than_one_id_query(self, db: IndexDatabase) -> None:
+        records = [_file(f"src/f{i}.py") for i in range(2_000)]
+        ids = db.upsert_files(records)
+        assert len(set(ids)) == 2_000
+        assert db.get_stats().total_files == 2_000
+
     def test_get_file_id(self, db: IndexDatabase) -> None:
         file_id = db.upsert_file(_file("src/foo.py"))
         assert db.get_file_id("src/foo.py") == file_id
@@ -160,6 +202,17 @@ class TestSymbols:
         assert len(classes) == 1
         assert classes[0].name == "MyClass"
 
+    def test_queried_kinds_share_one_string(self, db: IndexDatabase) -> None:
+        file_id = db.upsert_file(_file())
+        db.insert_symbols([_symbol(file_id, "a"), _symbol(file_id, "b")])
+        first, second = db.query_symbols(file_id=file_id)
+        assert first.kind is second.kind
+
+    def test_records_are_slotted(self) -> None:
+        assert not hasattr(_symbol(1), "__dict__")
+        assert not hasattr(_import(1), "__dict__")
+        assert not hasattr(_file(), "__dict__")
+
     def test_delete_symbols_for_file(self, db: IndexDatabase) -> None:
         file_id = db.upsert_file(_file())
         db.insert_symbols([_symbol(file_id)])
@@ -269,8 +322,7 @@ class TestMeta:
 
 class TestStats:
     def test_counts_reflect_data(self, db: IndexDatabase) -> None:
-        f1 = db.upsert_file(_file("a.py", role="utility"))
-        f2 = db.upsert_file(_file("b.py", role="entrypoint"))
+        f1, f2 = db.upsert_files([_file("a.py", role="utility"), _file("b.py", role="entrypoint")])
         db.insert_symbols([_symbol(f1), _symbol(f1, "Bar", "class"), _symbol(f2)])
         db.insert_imports([_import(f1), _import(f2)])
 
@@ -280,9 +332,11 @@ class TestStats:
         assert stats.total_imports == 2
 
     def test_files_by_role(self, db: IndexDatabase) -> None:
-        db.upsert_file(_file("a.py", role="utility"))
-        db.upsert_file(_file("b.py", role="utility"))
-        db.upsert_file(_file("c.py", role="config"))
+        db.upsert_files([
+            _file("a.py", role="utility"),
+            _file("b.py", role="utility"),
+            _file("c.py", role="config"),
+        ])
 
         stats = db.get_stats()
         assert stats.files_by_role["utility"] == 2
@@ -292,7 +346,7 @@ class TestStats:
         db.upsert_file(_file("a.py"))  # python
         db.upsert_file(FileRecord(
             path="b.ts", language="typescript", role="utility",
-            size_bytes=50, mtime=1.0, lines_count=10, indexed_at=time.time(),
+            size_bytes=50, mtime=1.0, lines_count=10, indexed_at=_NOW,
         ))
         stats = db.get_stats()
         assert stats.files_by_language["python"] == 1
@@ -428,6 +482,15 @@ class TestSchemaVersioning:
         ).fetchone()[0]
         assert count == 1  # INSERT OR REPLACE — no duplicates
 
+    def test_reopened_db_still_cascades(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "ver.db"
+        IndexDatabase(db_path).close()
+        with IndexDatabase(db_path) as db:
+            file_id = db.upsert_file(_file("src/gone.py"))
+            db.insert_symbols([_symbol(file_id, "orphan")])
+            db.delete_file("src/gone.py")
+            assert db.query_symbols(file_id=file_id) == []
+
     def test_existing_tables_still_work_after_migration(self, tmp_path: Path) -> None:
         db = IndexDatabase(tmp_path / "ver.db")
         db.upsert_file(_file())
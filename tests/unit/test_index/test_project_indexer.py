@@ -2,32 +2,39 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import time
+from collections.abc import Callable, Iterator
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
 from lidco.index.db import IndexDatabase
-from lidco.index.project_indexer import ProjectIndexer
+from lidco.index.project_indexer import IndexResult, ProjectIndexer
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
 
-@pytest.fixture()
-def db(tmp_path: Path) -> IndexDatabase:
-    return IndexDatabase(tmp_path / ".lidco" / "project_index.db")
-
-
-@pytest.fixture()
-def project(tmp_path: Path) -> Path:
-    """A minimal fake project directory."""
-    src = tmp_path / "src"
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A minimal fake project directory, written once per session."""
+    root = tmp_path_factory.mktemp("project_template")
+    src = root / "src"
     src.mkdir()
     (src / "main.py").write_text("def main(): pass\n", encoding="utf-8")
     (src / "utils.py").write_text("def helper(): pass\nHELPER_CONST = 1\n", encoding="utf-8")
-    (tmp_path / "tests").mkdir()
-    (tmp_path / "tests" / "test_main.py").write_text("def test_ok(): pass\n", encoding="utf-8")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_main.py").write_text("def test_ok(): pass\n", encoding="utf-8")
+    return root
+
+
+@pytest.fixture()
+def project(tmp_path: Path, _project_template: Path) -> Path:
+    """A private, writable copy of the minimal fake project directory."""
+    shutil.copytree(_project_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
@@ -39,50 +46,63 @@ def indexer(project: Path, db: IndexDatabase) -> ProjectIndexer:
 # ── Full index ────────────────────────────────────────────────────────────────
 
 
+class _FullRun(NamedTuple):
+    db: IndexDatabase
+    result: IndexResult
+    started: float
+    finished: float
+
+
+@pytest.fixture(scope="class")
+def full_run(
+    tmp_path_factory: pytest.TempPathFactory,
+    _project_template: Path,
+    new_index_db: Callable[[Path], IndexDatabase],
+) -> _FullRun:
+    """One full index of a copy of the fake project, shared by read-only tests."""
+    project_dir = tmp_path_factory.mktemp("full_run")
+    shutil.copytree(_project_template, project_dir, dirs_exist_ok=True)
+    db = new_index_db(project_dir / ".lidco" / "index.db")
+    started = time.time()
+    result = ProjectIndexer(project_dir=project_dir, db=db).run_full_index()
+    return _FullRun(db, result, started, time.time())
+
+
 class TestFullIndex:
-    def test_indexes_python_files(self, indexer: ProjectIndexer) -> None:
-        result = indexer.run_full_index()
-        assert result.stats.total_files == 3
+    def test_indexes_python_files(self, full_run: _FullRun) -> None:
+        assert full_run.result.stats.total_files == 3
 
-    def test_extracts_symbols(self, indexer: ProjectIndexer) -> None:
-        indexer.run_full_index()
-        symbols = indexer.db.query_symbols(name_like="main")
+    def test_extracts_symbols(self, full_run: _FullRun) -> None:
+        symbols = full_run.db.query_symbols(name_like="main")
         assert any(s.name == "main" for s in symbols)
 
-    def test_extracts_constants(self, indexer: ProjectIndexer) -> None:
-        indexer.run_full_index()
-        symbols = indexer.db.query_symbols(name_like="HELPER_CONST")
+    def test_extracts_constants(self, full_run: _FullRun) -> None:
+        symbols = full_run.db.query_symbols(name_like="HELPER_CONST")
         assert len(symbols) == 1
         assert symbols[0].kind == "constant"
 
-    def test_detects_test_role(self, indexer: ProjectIndexer) -> None:
-        indexer.run_full_index()
-        test_files = indexer.db.query_files_by_role("test")
+    def test_detects_test_role(self, full_run: _FullRun) -> None:
+        test_files = full_run.db.query_files_by_role("test")
         assert len(test_files) == 1
         assert "test_main" in test_files[0].path
 
-    def test_detects_entrypoint_role(self, indexer: ProjectIndexer) -> None:
-        indexer.run_full_index()
-        entrypoints = indexer.db.query_files_by_role("entrypoint")
+    def test_detects_entrypoint_role(self, full_run: _FullRun) -> None:
+        entrypoints = full_run.db.query_files_by_role("entrypoint")
         assert any("main" in f.path for f in entrypoints)
 
-    def test_sets_last_indexed_at(self, indexer: ProjectIndexer) -> None:
-        before = time.time()
-        indexer.run_full_index()
-        after = time.time()
-        val = indexer.db.get_meta("last_indexed_at")
+    def test_sets_last_indexed_at(self, full_run: _FullRun) -> None:
+        val = full_run.db.get_meta("last_indexed_at")
         assert val is not None
         ts = float(val)
-        assert before <= ts <= after
+        assert full_run.started <= ts <= full_run.finished
 
-    def test_sets_max_file_mtime(self, indexer: ProjectIndexer) -> None:
-        indexer.run_full_index()
-        val = indexer.db.get_meta("max_file_mtime")
+    def test_sets_max_file_mtime(self, full_run: _FullRun) -> None:
+        val = full_run.db.get_meta("max_file_mtime")
         assert val is not None
         assert float(val) > 0
 
-    def test_result_counts(self, indexer: ProjectIndexer) -> None:
-        result = indexer.run_full_index()
+    def test_result_counts(self, full_run: _FullRun) -> None:
+        result = full_run.result
         assert result.added == 3
         assert result.updated == 0
         assert result.deleted == 0
@@ -112,7 +132,9 @@ class TestFullIndex:
 
     def test_skips_large_files(self, project: Path, db: IndexDatabase) -> None:
         big = project / "src" / "generated.py"
-        big.write_text("x = 1\n" * 100_000, encoding="utf-8")
+        # Only st_size is checked, so a sparse file is enough to trip the limit.
+        with big.open("wb") as f:
+            f.truncate(600_000)
         indexer = ProjectIndexer(project_dir=project, db=db, max_file_size_kb=1)
         result = indexer.run_full_index()
         paths = [f.path for f in db.query_files_by_role("utility")]
@@ -145,6 +167,31 @@ class TestFullIndex:
 # ── Incremental index ─────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="session")
+def _primed_template(tmp_path_factory: pytest.TempPathFactory, _project_template: Path) -> Path:
+    """The fake project after one incremental run, index at ``.lidco/index.db``."""
+    project_dir = tmp_path_factory.mktemp("primed_project")
+    shutil.copytree(_project_template, project_dir, dirs_exist_ok=True)
+    # Closing checkpoints the WAL, so copying the directory copies the whole index.
+    with IndexDatabase(project_dir / ".lidco" / "index.db") as database:
+        ProjectIndexer(project_dir=project_dir, db=database).run_incremental_index()
+    return project_dir
+
+
+@pytest.fixture()
+def primed_project(tmp_path: Path, _primed_template: Path) -> Path:
+    """A private copy of the already-indexed fake project; mtimes are preserved."""
+    shutil.copytree(_primed_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture()
+def primed_indexer(primed_project: Path) -> Iterator[ProjectIndexer]:
+    """An indexer whose first incremental run has already happened."""
+    with IndexDatabase(primed_project / ".lidco" / "index.db") as db:
+        yield ProjectIndexer(project_dir=primed_project, db=db)
+
+
 class TestIncrementalIndex:
     def test_first_run_adds_all(self, indexer: ProjectIndexer) -> None:
         result = indexer.run_incremental_index()
@@ -152,79 +199,71 @@ class TestIncrementalIndex:
         assert result.updated == 0
         assert result.deleted == 0
 
-    def test_unchanged_files_skipped(self, indexer: ProjectIndexer) -> None:
-        indexer.run_incremental_index()
-        result2 = indexer.run_incremental_index()
+    def test_unchanged_files_skipped(self, primed_indexer: ProjectIndexer) -> None:
+        result2 = primed_indexer.run_incremental_index()
         assert result2.added == 0
         assert result2.updated == 0
         assert result2.skipped == 3
 
-    def test_modified_file_updated(self, project: Path, db: IndexDatabase) -> None:
-        indexer = ProjectIndexer(project_dir=project, db=db)
-        indexer.run_incremental_index()
-
+    def test_modified_file_updated(
+        self, primed_project: Path, primed_indexer: ProjectIndexer
+    ) -> None:
         # Modify a file (change content + bump mtime)
-        target = project / "src" / "utils.py"
+        target = primed_project / "src" / "utils.py"
         target.write_text("def new_func(): pass\n", encoding="utf-8")
         # Ensure mtime actually differs (some filesystems have 1s resolution)
         new_mtime = target.stat().st_mtime + 1
-        import os
         os.utime(target, (new_mtime, new_mtime))
 
-        result2 = indexer.run_incremental_index()
+        result2 = primed_indexer.run_incremental_index()
         assert result2.updated == 1
         assert result2.skipped == 2
 
-    def test_new_file_added(self, project: Path, db: IndexDatabase) -> None:
-        indexer = ProjectIndexer(project_dir=project, db=db)
-        indexer.run_incremental_index()
-
-        (project / "src" / "new_module.py").write_text("def fresh(): pass\n", encoding="utf-8")
-        result2 = indexer.run_incremental_index()
+    def test_new_file_added(self, primed_project: Path, primed_indexer: ProjectIndexer) -> None:
+        (primed_project / "src" / "new_module.py").write_text(
+            "def fresh(): pass\n", encoding="utf-8"
+        )
+        result2 = primed_indexer.run_incremental_index()
         assert result2.added == 1
         assert result2.skipped == 3
 
-    def test_deleted_file_removed(self, project: Path, db: IndexDatabase) -> None:
-        indexer = ProjectIndexer(project_dir=project, db=db)
-        indexer.run_incremental_index()
-
-        (project / "src" / "utils.py").unlink()
-        result2 = indexer.run_incremental_index()
+    def test_deleted_file_removed(
+        self, primed_project: Path, primed_indexer: ProjectIndexer
+    ) -> None:
+        (primed_project / "src" / "utils.py").unlink()
+        result2 = primed_indexer.run_incremental_index()
         assert result2.deleted == 1
-        assert db.get_file_by_path("src/utils.py") is None
-
-    def test_symbols_updated_on_reindex(self, project: Path, db: IndexDatabase) -> None:
-        indexer = ProjectIndexer(project_dir=project, db=db)
-        indexer.run_incremental_index()
+        assert primed_indexer.db.get_file_by_path("src/utils.py") is None
 
+    def test_symbols_updated_on_reindex(
+        self, primed_project: Path, primed_indexer: ProjectIndexer
+    ) -> None:
+        db = primed_indexer.db
         # Verify original symbol exists
         assert db.query_symbols(name_like="helper")
 
         # Rewrite file with different content
-        target = project / "src" / "utils.py"
+        target = primed_project / "src" / "utils.py"
         target.write_text("def brand_new(): pass\n", encoding="utf-8")
         new_mtime = target.stat().st_mtime + 1
-        import os
         os.utime(target, (new_mtime, new_mtime))
 
-        indexer.run_incremental_index()
+        primed_indexer.run_incremental_index()
 
         # Old symbol gone, new symbol present
         assert db.query_symbols(name_like="brand_new")
         assert not db.query_symbols(name_like="helper")
 
     def test_cascade_deletes_symbols_on_file_delete(
-        self, project: Path, db: IndexDatabase
+        self, primed_project: Path, primed_indexer: ProjectIndexer
     ) -> None:
-        indexer = ProjectIndexer(project_dir=project, db=db)
-        indexer.run_incremental_index()
-
+        db = primed_indexer.db
         file_id = db.get_file_id("src/utils.py")
         assert file_id is not None
         assert db.query_symbols(file_id=file_id)
 
-        (project / "src" / "utils.py").unlink()
-        indexer.run_incremental_index()
+        (primed_project / "src" / "utils.py").unlink()
+        primed_indexer.run_incremental_index()
 
         assert db.query_symbols(file_id=file_id) == []
 
@@ -276,7 +315,6 @@ class TestStaleness:
         new_file = project / "src" / "added.py"
         new_file.write_text("x = 1\n", encoding="utf-8")
         future = time.time() + 10
-        import os
         os.utime(new_file, (future, future))
 
         assert indexer.has_new_files() is True
@@ -299,23 +337,22 @@ class TestStats:
 # ── Integration: real project layout ─────────────────────────────────────────
 
 
+def _write_tree(root: Path, files: dict[str, bytes]) -> None:
+    """Write *files* (relative path -> content) under *root*."""
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
 class TestRealLayout:
-    def test_typescript_project(self, tmp_path: Path) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "index.ts").write_text(
-            "export function main(): void {}\n", encoding="utf-8"
-        )
-        (src / "auth.ts").write_text(
-            "export class AuthService {}\nexport function login(): void {}\n",
-            encoding="utf-8",
-        )
-        (tmp_path / "tests").mkdir()
-        (tmp_path / "tests" / "auth.spec.ts").write_text(
-            "describe('auth', () => {});\n", encoding="utf-8"
-        )
+    def test_typescript_project(self, tmp_path: Path, db: IndexDatabase) -> None:
+        _write_tree(tmp_path, {
+            "src/index.ts": b"export function main(): void {}\n",
+            "src/auth.ts": b"export class AuthService {}\nexport function login(): void {}\n",
+            "tests/auth.spec.ts": b"describe('auth', () => {});\n",
+        })
 
-        db = IndexDatabase(tmp_path / ".lidco" / "index.db")
         indexer = ProjectIndexer(project_dir=tmp_path, db=db)
         result = indexer.run_full_index()
 
@@ -331,11 +368,12 @@ class TestRealLayout:
         symbols = db.query_symbols(name_like="AuthService")
         assert symbols[0].kind == "class"
 
-    def test_mixed_language_project(self, tmp_path: Path) -> None:
-        (tmp_path / "main.py").write_text("def run(): pass\n", encoding="utf-8")
-        (tmp_path / "helper.js").write_text("function util() {}\n", encoding="utf-8")
+    def test_mixed_language_project(self, tmp_path: Path, db: IndexDatabase) -> None:
+        _write_tree(tmp_path, {
+            "main.py": b"def run(): pass\n",
+            "helper.js": b"function util() {}\n",
+        })
 
-        db = IndexDatabase(tmp_path / ".lidco" / "index.db")
         indexer = ProjectIndexer(project_dir=tmp_path, db=db)
         indexer.run_full_index()
 
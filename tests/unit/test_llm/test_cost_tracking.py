@@ -1,8 +1,11 @@
 """Tests for cost tracking in LLM responses and providers."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from lidco.agents.base import TokenUsage
+from lidco.llm import litellm_provider
 from lidco.llm.base import LLMResponse
 from lidco.llm.litellm_provider import calculate_cost
 
@@ -25,32 +28,35 @@ class TestLLMResponseCost:
             pass
 
 
+@pytest.fixture()
+def completion_cost(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace litellm.completion_cost for one test; set return_value/side_effect."""
+    mock = MagicMock(return_value=0.0)
+    monkeypatch.setattr(litellm_provider.litellm, "completion_cost", mock)
+    return mock
+
+
 class TestCalculateCost:
-    def test_returns_cost_for_known_model(self):
+    def test_returns_cost_for_known_model(self, completion_cost):
+        completion_cost.return_value = 0.005
         usage = {"prompt_tokens": 1000, "completion_tokens": 500}
-        with patch("lidco.llm.litellm_provider.litellm.completion_cost", return_value=0.005):
-            cost = calculate_cost("openai/glm-4.7", usage)
-        assert cost == 0.005
+        assert calculate_cost("openai/glm-4.7", usage) == 0.005
+        completion_cost.assert_called_once_with(
+            model="openai/glm-4.7", prompt_tokens=1000, completion_tokens=500
+        )
 
-    def test_returns_zero_on_exception(self):
+    def test_returns_zero_on_exception(self, completion_cost):
+        completion_cost.side_effect = Exception("Unknown model")
         usage = {"prompt_tokens": 100, "completion_tokens": 50}
-        with patch(
-            "lidco.llm.litellm_provider.litellm.completion_cost",
-            side_effect=Exception("Unknown model"),
-        ):
-            cost = calculate_cost("unknown-model-xyz", usage)
-        assert cost == 0.0
-
-    def test_handles_empty_usage(self):
-        with patch("lidco.llm.litellm_provider.litellm.completion_cost", return_value=0.0):
-            cost = calculate_cost("openai/glm-4.7", {})
-        assert cost == 0.0
-
-    def test_handles_partial_usage(self):
+        assert calculate_cost("unknown-model-xyz", usage) == 0.0
+
+    def test_handles_empty_usage(self, completion_cost):
+        assert calculate_cost("openai/glm-4.7", {}) == 0.0
+
+    def test_handles_partial_usage(self, completion_cost):
+        completion_cost.return_value = 0.001
         usage = {"prompt_tokens": 100}
-        with patch("lidco.llm.litellm_provider.litellm.completion_cost", return_value=0.001):
-            cost = calculate_cost("openai/glm-4.7", usage)
-        assert cost == 0.001
+        assert calculate_cost("openai/glm-4.7", usage) == 0.001
 
 
 class TestTokenUsageCost:
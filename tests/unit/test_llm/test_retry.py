@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 from litellm.exceptions import (
@@ -18,17 +18,28 @@ from litellm.exceptions import (
 from lidco.llm.exceptions import LLMRetryExhausted
 from lidco.llm.retry import RetryConfig, with_retry
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture()
+
+# RetryConfig is frozen, so one instance per module is safe to share.
+@pytest.fixture(scope="module")
 def no_jitter_config() -> RetryConfig:
     return RetryConfig(max_retries=3, base_delay=1.0, max_delay=60.0, jitter=False)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def jitter_config() -> RetryConfig:
     return RetryConfig(max_retries=3, base_delay=1.0, max_delay=60.0, jitter=True)
 
 
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace the backoff sleep for every test; request it to inspect the delays."""
+    mock = AsyncMock()
+    monkeypatch.setattr("lidco.llm.retry.asyncio.sleep", mock)
+    return mock
+
+
 def _make_litellm_error(cls: type, message: str = "error") -> Exception:
     """Create a litellm exception with the required constructor args."""
     return cls(
@@ -41,7 +52,6 @@ def _make_litellm_error(cls: type, message: str = "error") -> Exception:
 # --- test_no_retry_on_success ---
 
 
-@pytest.mark.asyncio()
 async def test_no_retry_on_success(no_jitter_config: RetryConfig) -> None:
     fn = AsyncMock(return_value="ok")
 
@@ -51,93 +61,36 @@ async def test_no_retry_on_success(no_jitter_config: RetryConfig) -> None:
     assert fn.await_count == 1
 
 
-# --- test_retry_on_rate_limit ---
+# --- test_retry_on_retryable ---
 
 
-@pytest.mark.asyncio()
-async def test_retry_on_rate_limit(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(RateLimitError)
+@pytest.mark.parametrize(
+    "exc_cls",
+    [RateLimitError, InternalServerError, Timeout, APIConnectionError, ServiceUnavailableError],
+    ids=lambda cls: cls.__name__,
+)
+async def test_retry_on_retryable(
+    exc_cls: type, no_jitter_config: RetryConfig, mock_sleep: AsyncMock
+) -> None:
+    error = _make_litellm_error(exc_cls)
     fn = AsyncMock(side_effect=[error, error, "ok"])
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        result = await with_retry(fn, no_jitter_config)
+    result = await with_retry(fn, no_jitter_config)
 
     assert result == "ok"
     assert fn.await_count == 3
     assert mock_sleep.await_count == 2
 
 
-# --- test_retry_on_server_error ---
-
-
-@pytest.mark.asyncio()
-async def test_retry_on_server_error(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(InternalServerError)
-    fn = AsyncMock(side_effect=[error, "ok"])
-
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        result = await with_retry(fn, no_jitter_config)
-
-    assert result == "ok"
-    assert fn.await_count == 2
-
-
-# --- test_retry_on_timeout ---
-
-
-@pytest.mark.asyncio()
-async def test_retry_on_timeout(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(Timeout)
-    fn = AsyncMock(side_effect=[error, "ok"])
-
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        result = await with_retry(fn, no_jitter_config)
-
-    assert result == "ok"
-    assert fn.await_count == 2
-
-
-# --- test_retry_on_connection_error ---
-
-
-@pytest.mark.asyncio()
-async def test_retry_on_connection_error(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(APIConnectionError)
-    fn = AsyncMock(side_effect=[error, "ok"])
-
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        result = await with_retry(fn, no_jitter_config)
-
-    assert result == "ok"
-    assert fn.await_count == 2
-
-
-# --- test_retry_on_service_unavailable ---
-
-
-@pytest.mark.asyncio()
-async def test_retry_on_service_unavailable(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(ServiceUnavailableError)
-    fn = AsyncMock(side_effect=[error, "ok"])
-
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        result = await with_retry(fn, no_jitter_config)
-
-    assert result == "ok"
-    assert fn.await_count == 2
-
-
 # --- test_max_retries_exceeded ---
 
 
-@pytest.mark.asyncio()
 async def test_max_retries_exceeded(no_jitter_config: RetryConfig) -> None:
     error = _make_litellm_error(RateLimitError)
     fn = AsyncMock(side_effect=error)
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        with pytest.raises(LLMRetryExhausted):
-            await with_retry(fn, no_jitter_config)
+    with pytest.raises(LLMRetryExhausted):
+        await with_retry(fn, no_jitter_config)
 
     # 1 initial + 3 retries = 4 total
     assert fn.await_count == 4
@@ -146,23 +99,14 @@ async def test_max_retries_exceeded(no_jitter_config: RetryConfig) -> None:
 # --- test_no_retry_on_non_retryable ---
 
 
-@pytest.mark.asyncio()
-async def test_no_retry_on_bad_request(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(BadRequestError)
-    fn = AsyncMock(side_effect=error)
-
-    with pytest.raises(BadRequestError):
-        await with_retry(fn, no_jitter_config)
-
-    assert fn.await_count == 1
-
-
-@pytest.mark.asyncio()
-async def test_no_retry_on_auth_error(no_jitter_config: RetryConfig) -> None:
-    error = _make_litellm_error(AuthenticationError)
+@pytest.mark.parametrize(
+    "exc_cls", [BadRequestError, AuthenticationError], ids=lambda cls: cls.__name__
+)
+async def test_no_retry_on_non_retryable(exc_cls: type, no_jitter_config: RetryConfig) -> None:
+    error = _make_litellm_error(exc_cls)
     fn = AsyncMock(side_effect=error)
 
-    with pytest.raises(AuthenticationError):
+    with pytest.raises(exc_cls):
         await with_retry(fn, no_jitter_config)
 
     assert fn.await_count == 1
@@ -171,14 +115,14 @@ async def test_no_retry_on_auth_error(no_jitter_config: RetryConfig) -> None:
 # --- test_exponential_backoff_delays ---
 
 
-@pytest.mark.asyncio()
-async def test_exponential_backoff_delays(no_jitter_config: RetryConfig) -> None:
+async def test_exponential_backoff_delays(
+    no_jitter_config: RetryConfig, mock_sleep: AsyncMock
+) -> None:
     error = _make_litellm_error(RateLimitError)
     fn = AsyncMock(side_effect=error)
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        with pytest.raises(LLMRetryExhausted):
-            await with_retry(fn, no_jitter_config)
+    with pytest.raises(LLMRetryExhausted):
+        await with_retry(fn, no_jitter_config)
 
     delays = [call.args[0] for call in mock_sleep.call_args_list]
     assert delays == [1.0, 2.0, 4.0]
@@ -187,15 +131,13 @@ async def test_exponential_backoff_delays(no_jitter_config: RetryConfig) -> None
 # --- test_max_delay_cap ---
 
 
-@pytest.mark.asyncio()
-async def test_max_delay_cap() -> None:
+async def test_max_delay_cap(mock_sleep: AsyncMock) -> None:
     config = RetryConfig(max_retries=5, base_delay=10.0, max_delay=30.0, jitter=False)
     error = _make_litellm_error(RateLimitError)
     fn = AsyncMock(side_effect=error)
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        with pytest.raises(LLMRetryExhausted):
-            await with_retry(fn, config)
+    with pytest.raises(LLMRetryExhausted):
+        await with_retry(fn, config)
 
     delays = [call.args[0] for call in mock_sleep.call_args_list]
     # 10, 20, 30(capped), 30(capped), 30(capped)
@@ -205,26 +147,26 @@ async def test_max_delay_cap() -> None:
 # --- test_jitter ---
 
 
-@pytest.mark.asyncio()
-async def test_jitter_varies_delay(jitter_config: RetryConfig) -> None:
+async def test_jitter_varies_delay(jitter_config: RetryConfig, mock_sleep: AsyncMock) -> None:
     error = _make_litellm_error(RateLimitError)
     fn = AsyncMock(side_effect=error)
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        with pytest.raises(LLMRetryExhausted):
-            await with_retry(fn, jitter_config)
+    with pytest.raises(LLMRetryExhausted):
+        await with_retry(fn, jitter_config)
 
     delays = [call.args[0] for call in mock_sleep.call_args_list]
     # With jitter, delays should be in range [base*0.5, base*1.5] * 2^attempt
-    for i, delay in enumerate(delays):
-        base = min(1.0 * (2 ** i), 60.0)
-        assert base * 0.5 <= delay <= base * 1.5
+    bases = [1.0, 2.0, 4.0]
+    assert len(delays) == len(bases)
+    out_of_range = [
+        (b, d) for b, d in zip(bases, delays, strict=True) if not b * 0.5 <= d <= b * 1.5
+    ]
+    assert out_of_range == []
 
 
 # --- test_zero_retries ---
 
 
-@pytest.mark.asyncio()
 async def test_zero_retries_raises_immediately() -> None:
     config = RetryConfig(max_retries=0)
     error = _make_litellm_error(RateLimitError)
@@ -239,7 +181,6 @@ async def test_zero_retries_raises_immediately() -> None:
 # --- test_stream_retry (integration-style) ---
 
 
-@pytest.mark.asyncio()
 async def test_stream_retry(no_jitter_config: RetryConfig) -> None:
     """Retry wraps the stream initialization, not individual chunks."""
     error = _make_litellm_error(RateLimitError)
@@ -250,8 +191,7 @@ async def test_stream_retry(no_jitter_config: RetryConfig) -> None:
 
     fn = AsyncMock(side_effect=[error, fake_stream()])
 
-    with patch("lidco.llm.retry.asyncio.sleep", new_callable=AsyncMock):
-        result = await with_retry(fn, no_jitter_config)
+    result = await with_retry(fn, no_jitter_config)
 
     chunks = [c async for c in result]
     assert chunks == ["chunk1", "chunk2"]
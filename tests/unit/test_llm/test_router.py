@@ -65,7 +65,6 @@ class TestLLMResponse:
 
 
 class TestModelRouter:
-    @pytest.mark.asyncio
     async def test_uses_primary_model(self):
         provider = MockProvider()
         router = ModelRouter(provider, default_model="model-a")
@@ -73,7 +72,6 @@ class TestModelRouter:
         result = await router.complete(messages)
         assert result.content == "Response from model-a"
 
-    @pytest.mark.asyncio
     async def test_fallback_on_failure(self):
         provider = MockProvider(fail_models={"model-a"})
         router = ModelRouter(
@@ -86,7 +84,6 @@ class TestModelRouter:
         assert result.content == "Response from model-b"
         assert provider.call_log == ["model-a", "model-b"]
 
-    @pytest.mark.asyncio
     async def test_all_models_fail(self):
         provider = MockProvider(fail_models={"model-a", "model-b"})
         router = ModelRouter(
@@ -98,7 +95,6 @@ class TestModelRouter:
         with pytest.raises(LLMRetryExhausted, match="All .* model"):
             await router.complete(messages)
 
-    @pytest.mark.asyncio
     async def test_explicit_model_overrides_default(self):
         provider = MockProvider()
         router = ModelRouter(provider, default_model="model-a")
@@ -113,7 +109,8 @@ class TestModelRouter:
 
 
 class TestModelRouterStream:
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     async def test_stream_fallback_on_retry_exhausted(self):
         """Router falls back to next model when primary raises LLMRetryExhausted during stream."""
         chunks_received = []
@@ -146,7 +143,6 @@ class TestModelRouterStream:
         assert len(chunks_received) == 1
         assert chunks_received[0].content == "chunk-from-b"
 
-    @pytest.mark.asyncio
     async def test_stream_fallback_on_raw_exception(self):
         """Router falls back to next model when primary raises a raw (non-LLMRetryExhausted) exception."""
         chunks_received = []
@@ -179,7 +175,6 @@ class TestModelRouterStream:
         assert len(chunks_received) == 1
         assert chunks_received[0].content == "fallback-chunk"
 
-    @pytest.mark.asyncio
     async def test_stream_all_fail_raises_retry_exhausted(self):
         """When all models fail during stream, raises LLMRetryExhausted."""
         provider = MockProvider(raw_fail_models={"model-a", "model-b"})
@@ -194,7 +189,8 @@ class TestModelRouterStream:
 class TestFallbackCallback:
     """ModelRouter notifies callback when falling back to a different model."""
 
-    @pytest.mark.asyncio
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     async def test_complete_fires_fallback_callback(self):
         from lidco.llm.exceptions import LLMRetryExhausted
         notifications: list[tuple[str, str, str]] = []
@@ -213,7 +209,6 @@ class TestFallbackCallback:
         assert fallback == "model-b"
         assert "exhausted" in reason
 
-    @pytest.mark.asyncio
     async def test_stream_fires_fallback_callback_on_raw_error(self):
         notifications: list[tuple] = []
 
@@ -240,7 +235,6 @@ class TestFallbackCallback:
         assert notifications[0][0] == "model-a"
         assert notifications[0][1] == "model-b"
 
-    @pytest.mark.asyncio
     async def test_no_callback_no_crash(self):
         """Router works fine when no fallback callback is set."""
         provider = MockProvider(fail_models={"model-a"})
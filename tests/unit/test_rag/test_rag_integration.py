@@ -3,13 +3,44 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
+from lidco.agents.base import AgentResponse
+from lidco.agents.graph import GraphOrchestrator
 from lidco.core.config import LidcoConfig, RAGConfig
+from lidco.core.session import Session
 
 
+@pytest.fixture()
+def _mock_session_deps(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stub the LLM provider, router and tool registry that Session builds."""
+    monkeypatch.setattr("lidco.core.session.LiteLLMProvider", MagicMock())
+    monkeypatch.setattr("lidco.core.session.ModelRouter", MagicMock())
+    tools = MagicMock()
+    tools.create_default_registry.return_value = MagicMock()
+    monkeypatch.setattr("lidco.core.session.ToolRegistry", tools)
+
+
+@pytest.fixture()
+def make_orchestrator():
+    """Factory for a GraphOrchestrator with a mocked LLM and an empty agent registry."""
+    def _make():
+        mock_registry = MagicMock()
+        mock_registry.list_agents.return_value = []
+        mock_registry.get.return_value = None
+        return GraphOrchestrator(
+            llm=MagicMock(),
+            agent_registry=mock_registry,
+            auto_plan=False,
+            auto_review=False,
+        )
+
+    return _make
+
+
+@pytest.mark.usefixtures("_mock_session_deps")
 class TestSessionRAGInit:
     """Test RAG initialization in Session."""
 
@@ -18,31 +49,17 @@ class TestSessionRAGInit:
         config = LidcoConfig()
         assert config.rag.enabled is False
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_not_initialized_when_disabled(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_not_initialized_when_disabled(self):
         """Session.context_retriever is None when RAG is disabled."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=False))
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         assert session.context_retriever is None
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_initialized_when_enabled_and_chromadb_available(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_initialized_when_enabled_and_chromadb_available(self):
         """When rag.enabled and chromadb is importable, retriever is created."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=True))
 
         mock_retriever = MagicMock()
@@ -52,53 +69,35 @@ class TestSessionRAGInit:
             patch("lidco.rag.indexer.CodeIndexer") as mock_indexer_cls,
             patch("lidco.rag.retriever.ContextRetriever", return_value=mock_retriever),
         ):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         assert session.context_retriever is mock_retriever
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_graceful_when_chromadb_missing(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_graceful_when_chromadb_missing(self):
         """When chromadb is not installed, RAG is silently disabled."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=True))
 
         with (
             patch("lidco.core.session.load_config", return_value=config),
-            patch.dict("sys.modules", {"chromadb": None}),
             patch(
                 "lidco.rag.store.VectorStore",
                 side_effect=ImportError("no chromadb"),
             ),
         ):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         assert session.context_retriever is None
 
 
+@pytest.mark.usefixtures("_mock_session_deps")
 class TestSessionGetFullContext:
     """Test RAG context injection in get_full_context."""
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_context_included_when_query_provided(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_context_included_when_query_provided(self):
         """RAG context is appended when query is provided."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=False))
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         mock_retriever = MagicMock()
@@ -109,19 +108,11 @@ class TestSessionGetFullContext:
         assert "Relevant Code Context" in ctx
         mock_retriever.retrieve.assert_called_once()
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_context_not_included_without_query(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_context_not_included_without_query(self):
         """RAG context is NOT fetched when no query is provided."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=False))
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         mock_retriever = MagicMock()
@@ -130,19 +121,11 @@ class TestSessionGetFullContext:
         session.get_full_context()
         mock_retriever.retrieve.assert_not_called()
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_rag_retrieval_failure_is_silent(
-        self, mock_tools, mock_router, mock_provider
-    ):
+    def test_rag_retrieval_failure_is_silent(self):
         """RAG retrieval errors don't crash get_full_context."""
-        mock_tools.create_default_registry.return_value = MagicMock()
         config = LidcoConfig(rag=RAGConfig(enabled=False))
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         mock_retriever = MagicMock()
@@ -154,37 +137,22 @@ class TestSessionGetFullContext:
         assert isinstance(ctx, str)
 
 
+@pytest.mark.usefixtures("_mock_session_deps")
 class TestSessionIndexProject:
     """Test project indexing."""
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_index_project_returns_zero_when_no_retriever(
-        self, mock_tools, mock_router, mock_provider
-    ):
-        mock_tools.create_default_registry.return_value = MagicMock()
+    def test_index_project_returns_zero_when_no_retriever(self):
         config = LidcoConfig()
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         assert session.index_project() == 0
 
-    @patch("lidco.core.session.LiteLLMProvider")
-    @patch("lidco.core.session.ModelRouter")
-    @patch("lidco.core.session.ToolRegistry")
-    def test_index_project_delegates_to_retriever(
-        self, mock_tools, mock_router, mock_provider
-    ):
-        mock_tools.create_default_registry.return_value = MagicMock()
+    def test_index_project_delegates_to_retriever(self):
         config = LidcoConfig()
 
         with patch("lidco.core.session.load_config", return_value=config):
-            from lidco.core.session import Session
-
             session = Session(config=config, project_dir=Path("/tmp/test"))
 
         mock_retriever = MagicMock()
@@ -198,166 +166,75 @@ class TestSessionIndexProject:
 class TestGraphOrchestratorRAG:
     """Test RAG integration in GraphOrchestrator."""
 
-    def _make_orchestrator(self):
-        """Create a GraphOrchestrator with mocked dependencies."""
-        from lidco.agents.graph import GraphOrchestrator
-
-        mock_llm = MagicMock()
-        mock_registry = MagicMock()
-        mock_registry.list_agents.return_value = []
-        mock_registry.get.return_value = None
-
-        orch = GraphOrchestrator(
-            llm=mock_llm,
-            agent_registry=mock_registry,
-            auto_plan=False,
-            auto_review=False,
-        )
-        return orch
-
-    def test_set_context_retriever(self):
+    def test_set_context_retriever(self, make_orchestrator):
         """set_context_retriever stores the retriever."""
-        orch = self._make_orchestrator()
+        orch = make_orchestrator()
         mock_retriever = MagicMock()
         orch.set_context_retriever(mock_retriever)
         assert orch._context_retriever is mock_retriever
 
-    def test_context_retriever_default_none(self):
+    def test_context_retriever_default_none(self, make_orchestrator):
         """By default, _context_retriever is None."""
-        orch = self._make_orchestrator()
+        orch = make_orchestrator()
         assert orch._context_retriever is None
 
 
-class TestGraphOrchestratorRAGIndexUpdate:
-    """Test RAG index update in _finalize_node."""
-
-    def _make_orchestrator(self):
-        from lidco.agents.graph import GraphOrchestrator
-
-        mock_llm = MagicMock()
-        mock_registry = MagicMock()
-        mock_registry.list_agents.return_value = []
-        mock_registry.get.return_value = None
-
-        return GraphOrchestrator(
-            llm=mock_llm,
-            agent_registry=mock_registry,
-            auto_plan=False,
-            auto_review=False,
-        )
+def _finalize_state(tool_calls: list[dict]) -> dict:
+    """Graph state after a coder turn that made *tool_calls*."""
+    return {
+        "user_message": "edit file",
+        "selected_agent": "coder",
+        "agent_response": AgentResponse(content="Done", iterations=1, tool_calls_made=tool_calls),
+    }
 
-    def test_update_rag_index_on_file_write(self):
-        """Files modified by file_write are re-indexed."""
-        from lidco.agents.base import AgentResponse
 
-        orch = self._make_orchestrator()
-        mock_retriever = MagicMock()
-        orch.set_context_retriever(mock_retriever)
+class TestGraphOrchestratorRAGIndexUpdate:
+    """Test RAG index update in _finalize_node."""
 
-        state = {
-            "user_message": "create file",
-            "selected_agent": "coder",
-            "agent_response": AgentResponse(
-                content="Done",
-                iterations=1,
-                tool_calls_made=[
-                    {"tool": "file_write", "args": {"path": "/tmp/new.py"}, "result": "ok"},
-                ],
+    @pytest.mark.parametrize(
+        "tool_calls,expected",
+        [
+            pytest.param(
+                [{"tool": "file_write", "args": {"path": "/tmp/new.py"}, "result": "ok"}],
+                [Path("/tmp/new.py")],
+                id="file_write",
             ),
-        }
-
-        orch._update_rag_index(state)
-        mock_retriever.update_file.assert_called_once_with(Path("/tmp/new.py"))
-
-    def test_update_rag_index_on_file_edit(self):
-        """Files modified by file_edit are re-indexed."""
-        from lidco.agents.base import AgentResponse
-
-        orch = self._make_orchestrator()
-        mock_retriever = MagicMock()
-        orch.set_context_retriever(mock_retriever)
-
-        state = {
-            "user_message": "edit file",
-            "selected_agent": "coder",
-            "agent_response": AgentResponse(
-                content="Done",
-                iterations=1,
-                tool_calls_made=[
-                    {"tool": "file_edit", "args": {"path": "/tmp/existing.py"}, "result": "ok"},
-                ],
+            pytest.param(
+                [{"tool": "file_edit", "args": {"path": "/tmp/existing.py"}, "result": "ok"}],
+                [Path("/tmp/existing.py")],
+                id="file_edit",
             ),
-        }
-
-        orch._update_rag_index(state)
-        mock_retriever.update_file.assert_called_once_with(Path("/tmp/existing.py"))
-
-    def test_no_update_for_read_only_tools(self):
-        """file_read and grep don't trigger index updates."""
-        from lidco.agents.base import AgentResponse
-
-        orch = self._make_orchestrator()
-        mock_retriever = MagicMock()
-        orch.set_context_retriever(mock_retriever)
-
-        state = {
-            "user_message": "read file",
-            "selected_agent": "coder",
-            "agent_response": AgentResponse(
-                content="Contents",
-                iterations=1,
-                tool_calls_made=[
+            pytest.param(
+                [
                     {"tool": "file_read", "args": {"path": "/tmp/a.py"}, "result": "ok"},
                     {"tool": "grep", "args": {"pattern": "foo"}, "result": "ok"},
                 ],
+                [],
+                id="read_only_tools",
             ),
-        }
-
-        orch._update_rag_index(state)
-        mock_retriever.update_file.assert_not_called()
-
-    def test_deduplicates_file_paths(self):
-        """Same file edited multiple times is re-indexed once."""
-        from lidco.agents.base import AgentResponse
-
-        orch = self._make_orchestrator()
+            pytest.param(
+                [{"tool": "file_edit", "args": {"path": "/tmp/same.py"}, "result": "ok"}] * 2,
+                [Path("/tmp/same.py")],
+                id="deduplicates_paths",
+            ),
+        ],
+    )
+    def test_reindexes_modified_files(self, make_orchestrator, tool_calls, expected):
+        """Files written or edited are re-indexed once each; read-only tools are ignored."""
+        orch = make_orchestrator()
         mock_retriever = MagicMock()
         orch.set_context_retriever(mock_retriever)
 
-        state = {
-            "user_message": "edit file",
-            "selected_agent": "coder",
-            "agent_response": AgentResponse(
-                content="Done",
-                iterations=1,
-                tool_calls_made=[
-                    {"tool": "file_edit", "args": {"path": "/tmp/same.py"}, "result": "ok"},
-                    {"tool": "file_edit", "args": {"path": "/tmp/same.py"}, "result": "ok"},
-                ],
-            ),
-        }
+        orch._update_rag_index(_finalize_state(tool_calls))
+        assert mock_retriever.update_file.call_args_list == [call(p) for p in expected]
 
-        orch._update_rag_index(state)
-        assert mock_retriever.update_file.call_count == 1
-
-    def test_no_crash_when_no_retriever(self):
+    def test_no_crash_when_no_retriever(self, make_orchestrator):
         """_update_rag_index is a no-op when no retriever is set."""
-        from lidco.agents.base import AgentResponse
-
-        orch = self._make_orchestrator()
+        orch = make_orchestrator()
         # No retriever set
-
-        state = {
-            "user_message": "edit",
-            "selected_agent": "coder",
-            "agent_response": AgentResponse(
-                content="Done",
-                iterations=1,
-                tool_calls_made=[
-                    {"tool": "file_write", "args": {"path": "/tmp/a.py"}, "result": "ok"},
-                ],
-            ),
-        }
+        state = _finalize_state(
+            [{"tool": "file_write", "args": {"path": "/tmp/a.py"}, "result": "ok"}]
+        )
 
         # Should not crash
         orch._update_rag_index(state)
@@ -0,0 +1,29 @@
+"""Tests for the FastAPI app's session teardown on shutdown."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from starlette.testclient import TestClient
+
+import lidco.server.app as server_app
+
+
+def test_shutdown_closes_session() -> None:
+    session = MagicMock()
+    session.aclose = AsyncMock()
+    session.agent_registry.list_agents.return_value = []
+
+    with patch.object(server_app, "Session", return_value=session):
+        with TestClient(server_app.create_app()) as client:
+            assert client.get("/api/agents").status_code == 200
+        session.aclose.assert_awaited_once()
+
+
+def test_shutdown_without_session_is_noop() -> None:
+    with (
+        patch.object(server_app, "Session") as session_cls,
+        TestClient(server_app.create_app()) as client,
+    ):
+        assert client.get("/health").status_code == 200
+    session_cls.assert_not_called()
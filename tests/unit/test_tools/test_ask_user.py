@@ -7,21 +7,23 @@ from lidco.tools.ask_user import AskUserTool
 from lidco.tools.base import ToolPermission
 
 
+# AskUserTool holds no per-call state, so one instance serves every test.
+@pytest.fixture(scope="class")
+def tool():
+    return AskUserTool()
+
+
 class TestAskUserTool:
-    def test_name(self):
-        tool = AskUserTool()
+    def test_name(self, tool):
         assert tool.name == "ask_user"
 
-    def test_description(self):
-        tool = AskUserTool()
+    def test_description(self, tool):
         assert "clarifying question" in tool.description
 
-    def test_permission_is_auto(self):
-        tool = AskUserTool()
+    def test_permission_is_auto(self, tool):
         assert tool.permission == ToolPermission.AUTO
 
-    def test_parameters(self):
-        tool = AskUserTool()
+    def test_parameters(self, tool):
         params = tool.parameters
         names = [p.name for p in params]
         assert "question" in names
@@ -34,8 +36,7 @@ class TestAskUserTool:
         options_param = next(p for p in params if p.name == "options")
         assert options_param.required is False
 
-    def test_openai_schema(self):
-        tool = AskUserTool()
+    def test_openai_schema(self, tool):
         schema = tool.to_openai_schema()
         assert schema["type"] == "function"
         assert schema["function"]["name"] == "ask_user"
@@ -45,9 +46,7 @@ class TestAskUserTool:
         assert "context" in props
         assert "question" in schema["function"]["parameters"]["required"]
 
-    @pytest.mark.asyncio
-    async def test_raises_clarification_needed(self):
-        tool = AskUserTool()
+    async def test_raises_clarification_needed(self, tool):
         with pytest.raises(ClarificationNeeded) as exc_info:
             await tool._run(
                 question="Which database?",
@@ -58,33 +57,25 @@ class TestAskUserTool:
         assert exc_info.value.options == ["PostgreSQL", "MySQL", "SQLite"]
         assert exc_info.value.context == "Need to choose a database"
 
-    @pytest.mark.asyncio
-    async def test_raises_with_empty_options(self):
-        tool = AskUserTool()
+    async def test_raises_with_empty_options(self, tool):
         with pytest.raises(ClarificationNeeded) as exc_info:
             await tool._run(question="What name?")
         assert exc_info.value.options == []
 
-    @pytest.mark.asyncio
-    async def test_execute_catches_exception(self):
+    async def test_execute_catches_exception(self, tool):
         """execute() wraps _run() errors, but ClarificationNeeded propagates."""
-        tool = AskUserTool()
         # ClarificationNeeded is caught by execute() as a generic Exception
         # and returned as a ToolResult with error
         result = await tool.execute(question="Which DB?")
         assert result.success is False
         assert "Which DB?" in (result.error or "")
 
-    @pytest.mark.asyncio
-    async def test_empty_question_returns_error(self):
-        tool = AskUserTool()
+    async def test_empty_question_returns_error(self, tool):
         result = await tool.execute(question="")
         assert result.success is False
         assert "required" in (result.error or "").lower()
 
-    @pytest.mark.asyncio
-    async def test_options_parsing(self):
-        tool = AskUserTool()
+    async def test_options_parsing(self, tool):
         with pytest.raises(ClarificationNeeded) as exc_info:
             await tool._run(
                 question="Framework?",
@@ -92,9 +83,7 @@ class TestAskUserTool:
             )
         assert exc_info.value.options == ["React", "Vue", "Svelte"]
 
-    @pytest.mark.asyncio
-    async def test_options_with_whitespace(self):
-        tool = AskUserTool()
+    async def test_options_with_whitespace(self, tool):
         with pytest.raises(ClarificationNeeded) as exc_info:
             await tool._run(
                 question="Q?",
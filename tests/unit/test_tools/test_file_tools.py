@@ -7,20 +7,14 @@ from unittest.mock import MagicMock
 from lidco.tools.file_read import FileReadTool
 from lidco.tools.file_write import FileWriteTool
 from lidco.tools.file_edit import FileEditTool
-from lidco.tools.base import ToolPermission
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
 
 class TestFileReadTool:
     def setup_method(self):
         self.tool = FileReadTool()
 
-    def test_name(self):
-        assert self.tool.name == "file_read"
-
-    def test_permission_is_auto(self):
-        assert self.tool.permission == ToolPermission.AUTO
-
-    @pytest.mark.asyncio
     async def test_read_existing_file(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("line1\nline2\nline3\n")
@@ -29,13 +23,11 @@ class TestFileReadTool:
         assert "line1" in result.output
         assert "line2" in result.output
 
-    @pytest.mark.asyncio
     async def test_read_nonexistent_file(self, tmp_path):
         result = await self.tool.execute(path=str(tmp_path / "nope.txt"))
         assert result.success is False
         assert "not found" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_read_with_offset(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("line1\nline2\nline3\nline4\n")
@@ -45,17 +37,24 @@ class TestFileReadTool:
         assert "line3" in result.output
         assert "line1" not in result.output
 
-    @pytest.mark.asyncio
+    async def test_large_file_read_in_thread(self, tmp_path, monkeypatch):
+        import asyncio
+
+        from lidco.tools import file_read
+
+        f = tmp_path / "big.txt"
+        f.write_text("line\n" * (file_read._THREAD_READ_THRESHOLD // 4))
+        to_thread = MagicMock(wraps=asyncio.to_thread)
+        monkeypatch.setattr(file_read.asyncio, "to_thread", to_thread)
+        result = await self.tool.execute(path=str(f), offset=2, limit=1)
+        assert result.success is True
+        assert "     2\tline" in result.output
+        to_thread.assert_called_once()
+
     async def test_read_directory_fails(self, tmp_path):
         result = await self.tool.execute(path=str(tmp_path))
         assert result.success is False
 
-    def test_openai_schema(self):
-        schema = self.tool.to_openai_schema()
-        assert schema["type"] == "function"
-        assert schema["function"]["name"] == "file_read"
-        assert "path" in schema["function"]["parameters"]["properties"]
-
 
 class TestFileReadCompression:
     """Tests for smart compression when reading large indexed files."""
@@ -66,7 +65,6 @@ class TestFileReadCompression:
         enricher.get_file_symbol_summary.return_value = summary
         return FileReadTool(enricher=enricher, project_dir=tmp_path)
 
-    @pytest.mark.asyncio
     async def test_small_file_not_compressed(self, tmp_path: Path) -> None:
         f = tmp_path / "small.py"
         f.write_text("x = 1\n" * 20)  # ~120 chars, below threshold
@@ -75,7 +73,6 @@ class TestFileReadCompression:
         assert result.success
         assert "## File summary" not in result.output
 
-    @pytest.mark.asyncio
     async def test_large_file_not_indexed_not_compressed(self, tmp_path: Path) -> None:
         f = tmp_path / "large.py"
         f.write_text("x = 1\n" * 800)  # ~5600 chars, above threshold
@@ -84,7 +81,6 @@ class TestFileReadCompression:
         assert result.success
         assert "## File summary" not in result.output
 
-    @pytest.mark.asyncio
     async def test_large_indexed_file_is_compressed(self, tmp_path: Path) -> None:
         f = tmp_path / "module.py"
         f.write_text("x = 1\n" * 800)  # above threshold
@@ -93,7 +89,6 @@ class TestFileReadCompression:
         assert result.success
         assert "## File summary" in result.output
 
-    @pytest.mark.asyncio
     async def test_compressed_output_has_full_content_section(self, tmp_path: Path) -> None:
         f = tmp_path / "module.py"
         f.write_text("x = 1\n" * 800)
@@ -101,7 +96,6 @@ class TestFileReadCompression:
         result = await tool.execute(path=str(f))
         assert "## Full content" in result.output
 
-    @pytest.mark.asyncio
     async def test_compressed_output_has_truncation_hint(self, tmp_path: Path) -> None:
         f = tmp_path / "module.py"
         f.write_text("x = 1\n" * 800)
@@ -109,7 +103,6 @@ class TestFileReadCompression:
         result = await tool.execute(path=str(f))
         assert "offset/limit" in result.output
 
-    @pytest.mark.asyncio
     async def test_compressed_metadata_has_compressed_flag(self, tmp_path: Path) -> None:
         f = tmp_path / "module.py"
         f.write_text("x = 1\n" * 800)
@@ -117,7 +110,6 @@ class TestFileReadCompression:
         result = await tool.execute(path=str(f))
         assert result.metadata.get("compressed") is True
 
-    @pytest.mark.asyncio
     async def test_offset_read_bypasses_compression(self, tmp_path: Path) -> None:
         """Reads with explicit offset should not be compressed."""
         f = tmp_path / "module.py"
@@ -127,7 +119,6 @@ class TestFileReadCompression:
         assert result.success
         assert "## File summary" not in result.output
 
-    @pytest.mark.asyncio
     async def test_small_limit_bypasses_compression(self, tmp_path: Path) -> None:
         """limit < 50 bypasses compression (targeted read)."""
         f = tmp_path / "module.py"
@@ -137,7 +128,6 @@ class TestFileReadCompression:
         assert result.success
         assert "## File summary" not in result.output
 
-    @pytest.mark.asyncio
     async def test_file_outside_project_dir_not_compressed(self, tmp_path: Path) -> None:
         """File outside project_dir cannot form a relative path → no compression."""
         import tempfile
@@ -150,7 +140,6 @@ class TestFileReadCompression:
             assert result.success
             assert "## File summary" not in result.output
 
-    @pytest.mark.asyncio
     async def test_no_enricher_no_compression(self, tmp_path: Path) -> None:
         """When enricher is not provided and project has no index, no compression."""
         f = tmp_path / "module.py"
@@ -166,27 +155,18 @@ class TestFileWriteTool:
     def setup_method(self):
         self.tool = FileWriteTool()
 
-    def test_name(self):
-        assert self.tool.name == "file_write"
-
-    def test_permission_is_ask(self):
-        assert self.tool.permission == ToolPermission.ASK
-
-    @pytest.mark.asyncio
     async def test_write_new_file(self, tmp_path):
         f = tmp_path / "new.txt"
         result = await self.tool.execute(path=str(f), content="hello world")
         assert result.success is True
         assert f.read_text() == "hello world"
 
-    @pytest.mark.asyncio
     async def test_write_creates_parent_dirs(self, tmp_path):
         f = tmp_path / "sub" / "dir" / "file.txt"
         result = await self.tool.execute(path=str(f), content="deep")
         assert result.success is True
         assert f.read_text() == "deep"
 
-    @pytest.mark.asyncio
     async def test_overwrite_existing(self, tmp_path):
         f = tmp_path / "existing.txt"
         f.write_text("old content")
@@ -199,10 +179,6 @@ class TestFileEditTool:
     def setup_method(self):
         self.tool = FileEditTool()
 
-    def test_name(self):
-        assert self.tool.name == "file_edit"
-
-    @pytest.mark.asyncio
     async def test_replace_unique_string(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("def hello():\n    print('hello')\n")
@@ -212,7 +188,6 @@ class TestFileEditTool:
         # "hello" appears twice, so without replace_all it should fail
         assert result.success is False
 
-    @pytest.mark.asyncio
     async def test_replace_all(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("foo bar foo baz foo")
@@ -222,7 +197,6 @@ class TestFileEditTool:
         assert result.success is True
         assert f.read_text() == "qux bar qux baz qux"
 
-    @pytest.mark.asyncio
     async def test_replace_single_occurrence(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("unique_string here")
@@ -232,7 +206,6 @@ class TestFileEditTool:
         assert result.success is True
         assert f.read_text() == "replaced here"
 
-    @pytest.mark.asyncio
     async def test_string_not_found(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("some content")
@@ -241,14 +214,12 @@ class TestFileEditTool:
         )
         assert result.success is False
 
-    @pytest.mark.asyncio
     async def test_edit_nonexistent_file(self, tmp_path):
         result = await self.tool.execute(
             path=str(tmp_path / "nope.py"), old_string="a", new_string="b"
         )
         assert result.success is False
 
-    @pytest.mark.asyncio
     async def test_context_preview_present_on_success(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("only_one_line")
@@ -258,7 +229,6 @@ class TestFileEditTool:
         assert result.success is True
         assert "context_preview" in result.metadata
 
-    @pytest.mark.asyncio
     async def test_context_preview_contains_new_string(self, tmp_path):
         f = tmp_path / "code.py"
         f.write_text("alpha\nbeta\ngamma\n")
@@ -268,7 +238,6 @@ class TestFileEditTool:
         assert result.success is True
         assert "BETA" in result.metadata["context_preview"]
 
-    @pytest.mark.asyncio
     async def test_anchor_line_correct(self, tmp_path):
         lines = [f"line{i}" for i in range(30)]
         f = tmp_path / "code.py"
@@ -280,7 +249,6 @@ class TestFileEditTool:
         assert result.success is True
         assert result.metadata["anchor_line"] == 15
 
-    @pytest.mark.asyncio
     async def test_context_preview_clipped_at_file_start(self, tmp_path):
         """Edit on line 2 should not produce negative indices."""
         lines = [f"line{i}" for i in range(5)]
@@ -294,7 +262,6 @@ class TestFileEditTool:
         assert "line0" in preview  # beginning of file visible
         assert "FIRST" in preview
 
-    @pytest.mark.asyncio
     async def test_context_preview_clipped_at_file_end(self, tmp_path):
         """Edit near end of file should not raise IndexError."""
         lines = [f"line{i}" for i in range(5)]
@@ -306,7 +273,6 @@ class TestFileEditTool:
         assert result.success is True
         assert "LAST" in result.metadata["context_preview"]
 
-    @pytest.mark.asyncio
     async def test_context_preview_spans_ten_lines_around_anchor(self, tmp_path):
         """Preview must include lines within ±10 of the anchor."""
         lines = [f"L{i:03d}" for i in range(50)]
@@ -8,10 +8,15 @@ from unittest.mock import MagicMock
 from lidco.tools.registry import ToolRegistry
 
 
+# Building the default registry instantiates every tool; the tests below only read it.
+@pytest.fixture(scope="module")
+def default_registry() -> ToolRegistry:
+    return ToolRegistry.create_default_registry()
+
+
 class TestToolRegistry:
-    def test_create_default_registry(self):
-        registry = ToolRegistry.create_default_registry()
-        names = registry.list_names()
+    def test_create_default_registry(self, default_registry):
+        names = default_registry.list_names()
         assert "file_read" in names
         assert "file_write" in names
         assert "file_edit" in names
@@ -49,9 +54,8 @@ class TestToolRegistry:
         assert "docker_sandbox" in names
         assert len(names) == 31
 
-    def test_get_tool(self):
-        registry = ToolRegistry.create_default_registry()
-        tool = registry.get("file_read")
+    def test_get_tool(self, default_registry):
+        tool = default_registry.get("file_read")
         assert tool is not None
         assert tool.name == "file_read"
 
@@ -59,22 +63,24 @@ class TestToolRegistry:
         registry = ToolRegistry()
         assert registry.get("nonexistent") is None
 
-    def test_openai_schemas(self):
-        registry = ToolRegistry.create_default_registry()
-        schemas = registry.get_openai_schemas()
+    def test_openai_schemas(self, default_registry):
+        schemas = default_registry.get_openai_schemas()
         assert len(schemas) == 31
         for schema in schemas:
             assert schema["type"] == "function"
             assert "name" in schema["function"]
             assert "parameters" in schema["function"]
 
-    def test_filtered_schemas(self):
-        registry = ToolRegistry.create_default_registry()
-        schemas = registry.get_openai_schemas(["file_read", "grep"])
+    def test_filtered_schemas(self, default_registry):
+        schemas = default_registry.get_openai_schemas(["file_read", "grep"])
         assert len(schemas) == 2
         names = {s["function"]["name"] for s in schemas}
         assert names == {"file_read", "grep"}
 
+    def test_filtered_schemas_share_tool_schemas(self, default_registry):
+        (schema,) = default_registry.get_openai_schemas(["grep"])
+        assert schema is default_registry.get("grep").to_openai_schema()
+
 
 class TestSchemaCache:
     """Schema caching and version tracking."""
@@ -4,117 +4,122 @@ import pytest
 
 from lidco.tools.glob import GlobTool
 from lidco.tools.grep import GrepTool
-from lidco.tools.base import ToolPermission
 
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-class TestGlobTool:
-    def setup_method(self):
-        self.tool = GlobTool()
 
-    def test_name(self):
-        assert self.tool.name == "glob"
+@pytest.fixture(scope="module")
+def sample_tree(tmp_path_factory):
+    """Small read-only tree shared by the glob and grep tests in this module."""
+    root = tmp_path_factory.mktemp("tree")
+    (root / "a.py").write_text("def hello():\n    print('world')\nfindme\n")
+    (root / "b.py").write_text("foo123\nbar456\nfoo789\n")
+    (root / "c.txt").write_text("Hello World\nfindme\n")
+    (root / "sub").mkdir()
+    (root / "sub" / "deep.py").write_text("pass\n")
+    return root
+
 
-    def test_permission_is_auto(self):
-        assert self.tool.permission == ToolPermission.AUTO
+class TestGlobTool:
+    @classmethod
+    def setup_class(cls):
+        # GlobTool keeps no state between calls, so one instance serves the class.
+        cls.tool = GlobTool()
 
-    @pytest.mark.asyncio
-    async def test_find_python_files(self, tmp_path):
-        (tmp_path / "a.py").write_text("pass")
-        (tmp_path / "b.py").write_text("pass")
-        (tmp_path / "c.txt").write_text("text")
-        result = await self.tool.execute(pattern="*.py", path=str(tmp_path))
+    async def test_find_python_files(self, sample_tree):
+        result = await self.tool.execute(pattern="*.py", path=str(sample_tree))
         assert result.success is True
         assert "a.py" in result.output
         assert "b.py" in result.output
         assert "c.txt" not in result.output
 
-    @pytest.mark.asyncio
-    async def test_recursive_glob(self, tmp_path):
-        sub = tmp_path / "sub"
-        sub.mkdir()
-        (sub / "deep.py").write_text("pass")
-        result = await self.tool.execute(pattern="**/*.py", path=str(tmp_path))
+    async def test_recursive_glob(self, sample_tree):
+        result = await self.tool.execute(pattern="**/*.py", path=str(sample_tree))
         assert result.success is True
         assert "deep.py" in result.output
 
-    @pytest.mark.asyncio
-    async def test_no_matches(self, tmp_path):
-        result = await self.tool.execute(pattern="*.xyz", path=str(tmp_path))
+    async def test_no_matches(self, sample_tree):
+        result = await self.tool.execute(pattern="*.xyz", path=str(sample_tree))
         assert result.success is True
         assert result.metadata["count"] == 0
 
-    @pytest.mark.asyncio
-    async def test_nonexistent_dir(self, tmp_path):
-        result = await self.tool.execute(pattern="*", path=str(tmp_path / "nope"))
+    async def test_nonexistent_dir(self, sample_tree):
+        result = await self.tool.execute(pattern="*", path=str(sample_tree / "nope"))
         assert result.success is False
 
+    async def test_recursive_glob_skips_noise_dirs(self, tmp_path, monkeypatch):
+        import os
 
-class TestGrepTool:
-    def setup_method(self):
-        self.tool = GrepTool()
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "a.py").write_text("pass")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "b.py").write_text("pass")
+        scanned: list[str] = []
+        real_scandir = os.scandir
+
+        def spy_scandir(path="."):
+            scanned.append(os.fspath(path))
+            return real_scandir(path)
 
-    def test_name(self):
-        assert self.tool.name == "grep"
+        monkeypatch.setattr(os, "scandir", spy_scandir)
+        result = await self.tool.execute(pattern="**/*.py", path=str(tmp_path))
+        assert result.metadata["count"] == 1
+        assert not any("node_modules" in p for p in scanned)
 
-    def test_permission_is_auto(self):
-        assert self.tool.permission == ToolPermission.AUTO
 
-    @pytest.mark.asyncio
-    async def test_find_pattern(self, tmp_path):
-        f = tmp_path / "code.py"
-        f.write_text("def hello():\n    print('world')\n")
-        result = await self.tool.execute(pattern="hello", path=str(tmp_path))
+class TestGrepTool:
+    @classmethod
+    def setup_class(cls):
+        # GrepTool keeps no state between calls, so one instance serves the class.
+        cls.tool = GrepTool()
+
+    async def test_find_pattern(self, sample_tree):
+        result = await self.tool.execute(pattern="hello", path=str(sample_tree))
         assert result.success is True
         assert "hello" in result.output
         assert result.metadata["count"] >= 1
 
-    @pytest.mark.asyncio
-    async def test_case_insensitive(self, tmp_path):
-        f = tmp_path / "code.py"
-        f.write_text("Hello World\n")
+    async def test_case_insensitive(self, sample_tree):
         result = await self.tool.execute(
-            pattern="hello", path=str(tmp_path), case_insensitive=True
+            pattern="hello world", path=str(sample_tree), case_insensitive=True
         )
         assert result.success is True
         assert result.metadata["count"] >= 1
 
-    @pytest.mark.asyncio
-    async def test_no_matches(self, tmp_path):
-        f = tmp_path / "code.py"
-        f.write_text("some content\n")
-        result = await self.tool.execute(pattern="zzzznotfound", path=str(tmp_path))
+    async def test_no_matches(self, sample_tree):
+        result = await self.tool.execute(pattern="zzzznotfound", path=str(sample_tree))
         assert result.success is True
         assert result.metadata["count"] == 0
 
-    @pytest.mark.asyncio
-    async def test_regex_pattern(self, tmp_path):
-        f = tmp_path / "code.py"
-        f.write_text("foo123\nbar456\nfoo789\n")
-        result = await self.tool.execute(pattern=r"foo\d+", path=str(tmp_path))
+    async def test_regex_pattern(self, sample_tree):
+        result = await self.tool.execute(pattern=r"foo\d+", path=str(sample_tree))
         assert result.success is True
         assert result.metadata["count"] == 2
 
-    @pytest.mark.asyncio
-    async def test_invalid_regex(self, tmp_path):
-        result = await self.tool.execute(pattern="[invalid", path=str(tmp_path))
+    async def test_invalid_regex(self, sample_tree):
+        result = await self.tool.execute(pattern="[invalid", path=str(sample_tree))
         assert result.success is False
         assert "regex" in result.error.lower()
 
-    @pytest.mark.asyncio
-    async def test_search_single_file(self, tmp_path):
-        f = tmp_path / "target.py"
-        f.write_text("target_line\nother_line\n")
-        result = await self.tool.execute(pattern="target", path=str(f))
+    async def test_search_single_file(self, sample_tree):
+        result = await self.tool.execute(pattern="findme", path=str(sample_tree / "a.py"))
         assert result.success is True
-        assert result.metadata["count"] >= 1
+        assert result.metadata["count"] == 1
 
-    @pytest.mark.asyncio
-    async def test_include_filter(self, tmp_path):
-        (tmp_path / "a.py").write_text("findme\n")
-        (tmp_path / "b.txt").write_text("findme\n")
+    async def test_include_filter(self, sample_tree):
         result = await self.tool.execute(
-            pattern="findme", path=str(tmp_path), include="*.py"
+            pattern="findme", path=str(sample_tree), include="*.py"
         )
         assert result.success is True
         assert "a.py" in result.output
-        assert "b.txt" not in result.output
+        assert "c.txt" not in result.output
+
+    async def test_literal_pattern_in_undecodable_file(self, tmp_path):
+        (tmp_path / "blob.dat").write_bytes(b"\xff\xfe header\nneedle here\n")
+        result = await self.tool.execute(pattern="needle", path=str(tmp_path))
+        assert result.metadata["count"] == 1
+        assert "blob.dat:2: needle here" in result.output
+
+    async def test_metachar_pattern_still_regex(self, sample_tree):
+        result = await self.tool.execute(pattern="foo.2", path=str(sample_tree))
+        assert result.metadata["count"] == 1
@@ -0,0 +1,40 @@
+"""Name, permission and schema checks shared by the core file, search and web tools."""
+
+from __future__ import annotations
+
+import pytest
+
+from lidco.tools.base import BaseTool, ToolPermission
+from lidco.tools.file_edit import FileEditTool
+from lidco.tools.file_read import FileReadTool
+from lidco.tools.file_write import FileWriteTool
+from lidco.tools.glob import GlobTool
+from lidco.tools.grep import GrepTool
+from lidco.tools.web_fetch import WebFetchTool
+from lidco.tools.web_search import WebSearchTool
+
+CASES = [
+    (FileReadTool, "file_read", ToolPermission.AUTO),
+    (FileWriteTool, "file_write", ToolPermission.ASK),
+    (FileEditTool, "file_edit", ToolPermission.ASK),
+    (GlobTool, "glob", ToolPermission.AUTO),
+    (GrepTool, "grep", ToolPermission.AUTO),
+    (WebSearchTool, "web_search", ToolPermission.ASK),
+    (WebFetchTool, "web_fetch", ToolPermission.ASK),
+]
+
+
+@pytest.mark.parametrize(
+    "tool_cls,name,permission", CASES, ids=[name for _, name, _ in CASES]
+)
+def test_tool_contract(tool_cls: type[BaseTool], name: str, permission: ToolPermission):
+    tool = tool_cls()
+    assert tool.name == name
+    assert tool.permission == permission
+
+    schema = tool.to_openai_schema()
+    assert schema["type"] == "function"
+    assert schema["function"]["name"] == name
+    properties = schema["function"]["parameters"]["properties"]
+    assert set(properties) == {p.name for p in tool.parameters}
+    assert schema is tool.to_openai_schema()
@@ -2,76 +2,118 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
-
+import asyncio
+import sys
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
 import pytest
 
-from lidco.tools.base import ToolPermission
-from lidco.tools.web_fetch import WebFetchTool, _strip_html
+from lidco.tools.web_fetch import _MIN_FETCH_BYTES, WebFetchTool, _strip_html
 from lidco.tools.web_search import WebSearchTool
 
+_LONG_PAYLOAD = "A" * 10000
 
-class TestWebSearchTool:
-    def setup_method(self):
-        self.tool = WebSearchTool()
 
-    def test_name(self):
-        assert self.tool.name == "web_search"
+@dataclass
+class _FakeResponse:
+    """Plain stand-in for a streamed ``httpx.Response``."""
 
-    def test_permission_is_ask(self):
-        assert self.tool.permission == ToolPermission.ASK
+    text: str
+    headers: dict[str, str] = field(default_factory=lambda: {"content-type": "text/html"})
+    encoding: str = "utf-8"
+    chunk_size: int = 64 * 1024
+    bytes_sent: int = 0
 
-    def test_schema(self):
-        schema = self.tool.to_openai_schema()
-        assert schema["type"] == "function"
-        assert schema["function"]["name"] == "web_search"
-        props = schema["function"]["parameters"]["properties"]
-        assert "query" in props
-        assert "max_results" in props
+    async def __aenter__(self) -> _FakeResponse:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        return False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        data = self.text.encode(self.encoding)
+        for start in range(0, len(data), self.chunk_size):
+            chunk = data[start:start + self.chunk_size]
+            self.bytes_sent += len(chunk)
+            yield chunk
+
+
+@dataclass
+class _FakeClient:
+    """Plain stand-in for ``httpx.AsyncClient``."""
+
+    response: _FakeResponse | None = None
+    exc: Exception | None = None
+    is_closed: bool = False
+
+    def stream(self, method: str, url: str, **kwargs: Any) -> _FakeResponse | None:
+        if self.exc is not None:
+            raise self.exc
+        return self.response
+
+    async def aclose(self) -> None:
+        self.is_closed = True
 
-    @pytest.mark.asyncio
-    async def test_returns_results(self):
-        import sys
-        from types import ModuleType
 
-        mock_results = [
+@dataclass
+class _FakeDDGS:
+    """Plain stand-in for ``duckduckgo_search.DDGS``."""
+
+    results: list[dict[str, str]] = field(default_factory=list)
+    exc: Exception | None = None
+
+    def __enter__(self) -> _FakeDDGS:
+        return self
+
+    def __exit__(self, *exc_info: object) -> bool:
+        return False
+
+    def text(self, query: str, **kwargs: Any) -> list[dict[str, str]]:
+        if self.exc is not None:
+            raise self.exc
+        return self.results
+
+
+class TestWebSearchTool:
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+    def setup_method(self):
+        self.tool = WebSearchTool()
+
+    async def test_returns_results(self):
+        ddgs = _FakeDDGS(results=[
             {"title": "Result 1", "href": "https://example.com/1", "body": "Snippet 1"},
             {"title": "Result 2", "href": "https://example.com/2", "body": "Snippet 2"},
-        ]
-        mock_cls = MagicMock()
-        mock_inst = MagicMock()
-        mock_inst.text.return_value = mock_results
-        mock_cls.return_value.__enter__.return_value = mock_inst
-        mock_cls.return_value.__exit__.return_value = None
+        ])
+        tool = WebSearchTool(ddgs_factory=lambda: ddgs)
 
-        mod = ModuleType("duckduckgo_search")
-        mod.DDGS = mock_cls  # type: ignore[attr-defined]
-
-        with patch.dict(sys.modules, {"duckduckgo_search": mod}):
-            result = await self.tool.execute(query="python best practices")
+        result = await tool.execute(query="python best practices")
 
         assert result.success is True
         assert "Result 1" in result.output
         assert "Result 2" in result.output
         assert "https://example.com/1" in result.output
 
-    @pytest.mark.asyncio
     async def test_handles_search_error(self):
-        mock_ddgs_instance = MagicMock()
-        mock_ddgs_instance.text.side_effect = RuntimeError("Network error")
-        mock_ddgs_instance.__enter__ = MagicMock(return_value=mock_ddgs_instance)
-        mock_ddgs_instance.__exit__ = MagicMock(return_value=False)
+        ddgs = _FakeDDGS(exc=RuntimeError("Network error"))
+        tool = WebSearchTool(ddgs_factory=lambda: ddgs)
 
-        with patch.dict("sys.modules", {"duckduckgo_search": MagicMock(DDGS=lambda: mock_ddgs_instance)}):
-            result = await self.tool.execute(query="test query")
+        result = await tool.execute(query="test query")
 
         assert result.success is False
         assert "Search failed" in result.error
 
-    @pytest.mark.asyncio
     async def test_no_library_graceful(self):
         """Test graceful handling when duckduckgo-search is not installed."""
-        with patch.dict("sys.modules", {"duckduckgo_search": None}):
+        with patch.dict(sys.modules, {"duckduckgo_search": None}):
             result = await self.tool.execute(query="test")
 
         assert result.success is False
@@ -79,75 +121,82 @@ class TestWebSearchTool:
 
 
 class TestWebFetchTool:
+    pytestmark = pytest.mark.asyncio(loop_scope="session")
+
     def setup_method(self):
+        # Fresh instance per test: WebFetchTool caches the client it creates.
         self.tool = WebFetchTool()
 
-    def test_name(self):
-        assert self.tool.name == "web_fetch"
-
-    def test_permission_is_ask(self):
-        assert self.tool.permission == ToolPermission.ASK
-
-    def test_schema(self):
-        schema = self.tool.to_openai_schema()
-        assert schema["type"] == "function"
-        assert schema["function"]["name"] == "web_fetch"
-        props = schema["function"]["parameters"]["properties"]
-        assert "url" in props
-        assert "max_length" in props
-
-    @pytest.mark.asyncio
     async def test_returns_content(self):
-        mock_response = MagicMock()
-        mock_response.text = "<html><body><p>Hello World</p></body></html>"
-        mock_response.headers = {"content-type": "text/html"}
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        client = _FakeClient(_FakeResponse("<html><body><p>Hello World</p></body></html>"))
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch("httpx.AsyncClient", return_value=client):
             result = await self.tool.execute(url="https://example.com")
 
         assert result.success is True
         assert "Hello World" in result.output
 
-    @pytest.mark.asyncio
     async def test_timeout_error(self):
-        import httpx
-
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = httpx.TimeoutException("timed out")
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        client = _FakeClient(exc=httpx.TimeoutException("timed out"))
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch("httpx.AsyncClient", return_value=client):
             result = await self.tool.execute(url="https://example.com")
 
         assert result.success is False
         assert "timed out" in result.error.lower()
 
-    @pytest.mark.asyncio
     async def test_truncates_long_content(self):
-        mock_response = MagicMock()
-        mock_response.text = "A" * 10000
-        mock_response.headers = {"content-type": "text/plain"}
-        mock_response.raise_for_status = MagicMock()
+        client = _FakeClient(_FakeResponse(_LONG_PAYLOAD, {"content-type": "text/plain"}))
 
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch("httpx.AsyncClient", return_value=client):
             result = await self.tool.execute(url="https://example.com", max_length=100)
 
         assert result.success is True
         assert "[Truncated]" in result.output
         assert len(result.output) < 200
 
+    async def test_stops_downloading_oversized_body(self):
+        response = _FakeResponse("A" * (3 * _MIN_FETCH_BYTES), {"content-type": "text/plain"})
+
+        with patch("httpx.AsyncClient", return_value=_FakeClient(response)):
+            result = await self.tool.execute(url="https://example.com", max_length=100)
+
+        assert result.output.endswith("[Truncated]")
+        assert response.bytes_sent <= _MIN_FETCH_BYTES + response.chunk_size
+
+    async def test_reuses_client_across_fetches(self):
+        client_cls = MagicMock(side_effect=lambda **kw: _FakeClient(_FakeResponse("<p>hi</p>")))
+
+        with patch("httpx.AsyncClient", client_cls):
+            results = await asyncio.gather(
+                *(self.tool.execute(url=f"https://example.com/{i}") for i in range(20))
+            )
+
+        assert all(r.success for r in results)
+        assert client_cls.call_count == 1
+
+    async def test_aclose_closes_client(self):
+        client = _FakeClient(_FakeResponse("<p>hi</p>"))
+
+        with patch("httpx.AsyncClient", return_value=client):
+            await self.tool.execute(url="https://example.com")
+        await self.tool.aclose()
+
+        assert client.is_closed is True
+        await self.tool.aclose()  # idempotent, and a no-op with no client
+
+    async def test_closes_client_from_another_loop(self):
+        stale = _FakeClient()
+        self.tool._client, self.tool._client_loop = stale, object()
+        fresh = _FakeClient(_FakeResponse("<p>hi</p>"))
+
+        with patch("httpx.AsyncClient", return_value=fresh):
+            result = await self.tool.execute(url="https://example.com")
+
+        assert result.success is True
+        assert stale.is_closed is True
+        assert self.tool._client is fresh
+
 
 class TestStripHtml:
     def test_strips_tags(self):
@@ -168,4 +217,11 @@ class TestStripHtml:
     def test_decodes_entities(self):
         html = "&amp; &lt; &gt; &quot;"
         result = _strip_html(html)
-        assert "& < > \"" == result
+        assert result == "& < > \""
+
+    def test_unclosed_tags_stay_linear(self):
+        html = "<script>x" * 20000 + "<p" * 20000
+        start = time.perf_counter()
+        result = _strip_html(html)
+        assert time.perf_counter() - start < 1.0  # quadratic rescans took ~20 s
+        assert result.endswith("<p")